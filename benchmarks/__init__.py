@@ -0,0 +1,4 @@
+"""Micro-benchmarks for STRIKERS 2022.
+
+Run from the project root, e.g. ``python -m benchmarks.blit_formats``.
+"""
@@ -0,0 +1,56 @@
+"""Per-blit cost of every image before and after the surface pipeline.
+
+"before" is the previous loading path (``convert_alpha`` for everything),
+"after" is ``load_image`` (opaque / colorkey+RLE / alpha by classification).
+
+    python -m benchmarks.blit_formats [--blits 2000]
+"""
+
+import argparse
+import time
+
+from strikers2022.headless import init_pygame
+
+
+def time_blits(target, surface, blits: int) -> float:
+    """Average microseconds per blit of ``surface`` onto ``target``."""
+    width, height = target.get_size()
+    positions = [((i * 37) % (width - surface.get_width() + 1),
+                  (i * 53) % (height - surface.get_height() + 1)) for i in range(blits)]
+    target.blit(surface, positions[0])  # warm up (RLE encodes on first blit)
+    start = time.perf_counter()
+    for pos in positions:
+        target.blit(surface, pos)
+    return (time.perf_counter() - start) * 1e6 / blits
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--blits", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    screen = init_pygame()
+
+    import pygame
+    from strikers2022.config import assets
+    from strikers2022.utils import classify_surface, load_image
+
+    print(f"{'image':<24}{'size':>11}{'kind':>10}{'before us':>11}{'after us':>10}{'speedup':>9}")
+    for path in sorted(assets.image_path.glob("*.png")):
+        raw = pygame.image.load(str(path))
+        blits = args.blits if raw.get_width() * raw.get_height() < 100_000 else args.blits // 20
+
+        before = time_blits(screen, raw.convert_alpha(), blits)
+        after = time_blits(screen, load_image(path.name), blits)
+
+        size = f"{raw.get_width()}x{raw.get_height()}"
+        print(
+            f"{path.name:<24}{size:>11}{classify_surface(raw):>10}"
+            f"{before:>11.2f}{after:>10.2f}{before / after:>8.2f}x"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
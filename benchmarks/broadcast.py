@@ -0,0 +1,135 @@
+"""Spectator broadcast cost and bandwidth.
+
+Runs the uncapped game loop with the broadcaster on and 0..N connected
+viewers. Each viewer is a thread that reads and decodes every message like
+the real client, minus the drawing. Reports per viewer count:
+
+- frames/s of the game loop
+- encode time per frame (game thread)
+- server write time per viewer per frame (broadcast thread)
+- average keyframe and delta size on the wire, and bytes/s per viewer
+
+``--pattern-bullets`` keeps the boss's bullet field topped up with rings of
+pattern bullets, which go into every frame.
+
+    python -m benchmarks.broadcast [--frames 600] [--viewers 0 1 4 16] [--enemies 100] [--bullets 400]
+                                   [--pattern-bullets 0]
+"""
+
+import argparse
+import random
+import socket
+import threading
+import time
+
+from strikers2022.headless import init_pygame
+
+from .render_queue import populate
+
+
+def viewer(port: int, counts: dict) -> None:
+    """Read and decode the stream until the server closes it."""
+    from strikers2022.broadcast.codec import MESSAGE_HEADER, StateDecoder
+
+    decoder = StateDecoder()
+    with socket.create_connection(("127.0.0.1", port)) as sock:
+        stream = sock.makefile("rb")
+        while True:
+            header = stream.read(MESSAGE_HEADER.size)
+            if len(header) < MESSAGE_HEADER.size:
+                break
+            length, kind = MESSAGE_HEADER.unpack(header)
+            if decoder.feed(kind, stream.read(length)) is not None:
+                counts["frames"] += 1
+
+
+def run(
+    screen, viewers: int, frames: int, enemies: int, bullets: int, pattern_bullets: int = 0
+) -> dict:
+    """Broadcast ``frames`` loop iterations to ``viewers`` readers."""
+    from strikers2022.game import Game
+
+    game = Game(screen)
+    game.fps_limit = 0
+    game.quality.enabled = False
+    game.seed = 0
+    game.enable_broadcast(port=0)
+    server = game.broadcaster.server
+
+    counts = [{"frames": 0} for _ in range(viewers)]
+    threads = [
+        threading.Thread(target=viewer, args=(server.port, count), daemon=True)
+        for count in counts
+    ]
+    for thread in threads:
+        thread.start()
+    while server.viewers < viewers:
+        time.sleep(0.01)
+
+    game.start()
+    populate(game, enemies, bullets)
+
+    start = time.perf_counter()
+    played = 0
+    rng = random.Random(0)
+    ring = [i * 360 / 64 for i in range(64)]
+    while played < frames and not game.result:
+        field = game.bullet_field
+        while len(field) < pattern_bullets:
+            x, y = rng.uniform(100, 1180), rng.uniform(50, 500)
+            field.spawn(x, y, ring[: pattern_bullets - len(field)], rng.uniform(1.5, 4.0))
+        game.step()
+        played += 1
+    elapsed = time.perf_counter() - start
+
+    broadcaster = game.broadcaster
+    game.close()
+    for thread in threads:
+        thread.join(5)
+
+    sent = server.frames_sent or 1
+    received = min((count["frames"] for count in counts), default=0)
+    bytes_per_frame = (broadcaster.keyframe_bytes + broadcaster.delta_bytes) / broadcaster.frames
+    return {
+        "fps": played / elapsed,
+        "encode_ms": broadcaster.encode_seconds / broadcaster.frames * 1000,
+        "write_us": server.write_seconds / sent * 1e6 if server.frames_sent else 0.0,
+        "keyframe": broadcaster.keyframe_bytes / (broadcaster.keyframes or 1),
+        "delta": broadcaster.delta_bytes / (broadcaster.deltas or 1),
+        "kbps": bytes_per_frame * 60 / 1000,
+        "received": received,
+        "played": played,
+        "skipped": server.frames_skipped,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Spectator broadcast cost.")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--viewers", type=int, nargs="+", default=[0, 1, 4, 16])
+    parser.add_argument("--enemies", type=int, default=100)
+    parser.add_argument("--bullets", type=int, default=400)
+    parser.add_argument("--pattern-bullets", type=int, default=0, help="live bullet field bullets")
+    args = parser.parse_args(argv)
+
+    screen = init_pygame()
+
+    import pygame
+
+    print(
+        f"{'viewers':>7} {'frames/s':>9} {'encode ms':>10} {'write us/viewer':>16} "
+        f"{'keyframe B':>11} {'delta B':>8} {'kB/s @60':>9} {'received':>9} {'skipped':>8}"
+    )
+    for viewers in args.viewers:
+        r = run(screen, viewers, args.frames, args.enemies, args.bullets, args.pattern_bullets)
+        print(
+            f"{viewers:>7} {r['fps']:>9.0f} {r['encode_ms']:>10.3f} {r['write_us']:>16.1f} "
+            f"{r['keyframe']:>11.0f} {r['delta']:>8.0f} {r['kbps']:>9.1f} "
+            f"{r['received']:>4}/{r['played']:<4} {r['skipped']:>8}"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Cost of player shots cancelling enemy bullets against both counts.
+
+Shots and enemy bullets are scattered over the window and every
+overlapping (shot, bullet) pair is found two ways:
+
+    crash   per-shot ``GameEntity.crash`` against the bullet group, the
+            way the other collision checks are written: up to shots x
+            bullets pair tests (each shot stops at its first hit)
+    sweep   the test inside ``CollisionManager.check_bullet_cancel``:
+            bounding boxes of both populations, one ``overlapping_pairs``
+            sort-and-sweep pass
+
+Pairs is the number of candidate pairs each approach tests per frame.
+Times are medians per frame in ms; the crash loop is skipped above
+``--naive-limit`` pairs. Nothing is killed while timing.
+
+    python -m benchmarks.bullet_cancel [--repeat 20]
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+import numpy as np
+
+SHOTS = (10, 50, 200)
+BULLETS = (100, 1000, 5000)
+
+
+def median_ms(func, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Bullet cancellation cost.")
+    parser.add_argument("--repeat", type=int, default=20, help="timed runs per case")
+    parser.add_argument(
+        "--naive-limit", type=int, default=1_000_000, help="largest shots x bullets for the crash loop"
+    )
+    args = parser.parse_args(argv)
+
+    from strikers2022.headless import init_pygame
+
+    init_pygame()
+
+    import pygame
+    from strikers2022.config import WINDOW_WIDTH, WINDOW_HEIGHT
+    from strikers2022.entities import EntityGroup, EnemyWeapon, PlayerWeapon
+    from strikers2022.utils import overlapping_pairs
+
+    rng = random.Random(1)
+
+    def boxes(sprites) -> np.ndarray:
+        rects = np.array([sprite.rect for sprite in sprites], dtype=np.float64)
+        rects[:, 2:] += rects[:, :2]
+        return rects
+
+    print(f"median of {args.repeat} (ms)")
+    print(f"{'shots':>5} {'bullets':>7} {'crash':>9} {'pairs':>9} {'sweep':>8} {'pairs':>7} {'hits':>5}")
+    for shots in SHOTS:
+        for bullets in BULLETS:
+            player_shots = [
+                PlayerWeapon(rng.randrange(WINDOW_WIDTH), rng.randrange(WINDOW_HEIGHT), 1)
+                for _ in range(shots)
+            ]
+            enemy_bullets = EntityGroup()
+            for _ in range(bullets):
+                x, y = rng.randrange(WINDOW_WIDTH), rng.randrange(WINDOW_HEIGHT)
+                enemy_bullets.add(EnemyWeapon(x, y, rng.randrange(WINDOW_WIDTH), WINDOW_HEIGHT))
+
+            def crash():
+                for shot in player_shots:
+                    shot.crash(enemy_bullets, pygame.sprite.collide_mask)
+
+            def sweep():
+                return overlapping_pairs(boxes(player_shots), boxes(enemy_bullets))
+
+            crash_ms = "-"
+            if shots * bullets <= args.naive_limit:
+                crash_ms = f"{median_ms(crash, args.repeat):.3f}"
+            sweep_ms = median_ms(sweep, args.repeat)
+            _, hits, tested = sweep()
+            print(
+                f"{shots:>5} {bullets:>7} {crash_ms:>9} {shots * bullets:>9} "
+                f"{sweep_ms:8.3f} {tested:>7} {len(hits):>5}"
+            )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Bullets each boss pattern can sustain within a frame budget.
+
+Every pattern of a phase file is fired on its own into an empty
+``BulletField`` with its ``count`` multiplied by 1, 2, 4, ... After the
+field has filled up, the frame cost of the bullet work is timed: firing
+(``BossPatterns.update``), moving and steering (``BulletField.update``),
+the collision test against both players (pixel-exact, hits removed),
+building the blit list and drawing it. The largest steady live bullet
+count whose median frame cost stays within ``--budget`` ms is what the
+pattern can sustain.
+
+    python -m benchmarks.bullet_patterns [--file boss.json] [--budget 8] [--frames 120]
+"""
+
+import argparse
+import dataclasses
+import math
+import statistics
+import time
+
+from strikers2022.headless import init_pygame
+
+# Largest count multiplier tried
+MAX_SCALE = 4096
+
+
+def measure(game, pattern, frames: int) -> tuple[float, float]:
+    """Mean live bullets and median milliseconds per frame of ``pattern``."""
+    from strikers2022.config import BOSS_DEFAULT_HP
+    from strikers2022.patterns import BossPatterns, BulletField, Phase
+
+    field = BulletField(capacity=1 << 18)
+    director = BossPatterns((Phase(BOSS_DEFAULT_HP, (pattern,)),))
+    players = (game.player1, game.player2)
+    targets = tuple((player.center_x, player.center_y) for player in players)
+    renderer = game.renderer
+
+    def frame() -> None:
+        director.update(game.boss, players, field)
+        field.update(targets)
+        for player in players:
+            hit = field.hits(player.rect, player.mask)
+            if hit.any():
+                field.remove(hit)
+        renderer.blits(field.blits())
+
+    # Fill the screen: the slowest bullet crosses the diagonal
+    warmup = pattern.delay + pattern.interval + math.ceil(1500 / pattern.speed)
+    for _ in range(warmup):
+        frame()
+
+    live = 0
+    times = []
+    for _ in range(frames):
+        start = time.perf_counter()
+        frame()
+        times.append(time.perf_counter() - start)
+        live += len(field)
+    return live / frames, statistics.median(times) * 1000
+
+
+def sustainable(game, pattern, budget: float, frames: int) -> list[tuple[int, float, float]]:
+    """(multiplier, live bullets, ms/frame) per step, up to the first over budget."""
+    steps = []
+    scale = 1
+    while scale <= MAX_SCALE:
+        scaled = dataclasses.replace(pattern, count=pattern.count * scale)
+        live, ms = measure(game, scaled, frames)
+        steps.append((scale, live, ms))
+        if ms > budget:
+            break
+        scale *= 2
+    return steps
+
+
+def main(argv=None) -> None:
+    from strikers2022.config import BOSS_PATTERN_FILE, FPS
+
+    parser = argparse.ArgumentParser(description="Sustainable bullets per boss pattern.")
+    parser.add_argument("--file", default=BOSS_PATTERN_FILE, help="phase file in patterns/")
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=500 / FPS,
+        help="ms of bullet work per frame (default: half a frame)",
+    )
+    parser.add_argument("--frames", type=int, default=120, help="frames timed per step")
+    parser.add_argument("--verbose", action="store_true", help="print every step")
+    args = parser.parse_args(argv)
+
+    screen = init_pygame()
+
+    import pygame
+    from strikers2022.game import Game
+    from strikers2022.patterns import load_phases
+
+    game = Game(screen)
+    game.start()
+    phases = load_phases(args.file)
+
+    print(f"budget: {args.budget:.2f} ms/frame for firing, moving, colliding and drawing")
+    print(f"{'phase':>5} {'pattern':8} {'base':>6} {'sustained':>9} {'x':>5} {'ms':>6} {'us/bullet':>9}")
+    for phase in phases:
+        for pattern in phase.patterns:
+            steps = sustainable(game, pattern, args.budget, args.frames)
+            if args.verbose:
+                for scale, live, ms in steps:
+                    print(f"      x{scale:<5} {live:8.0f} bullets {ms:7.2f} ms")
+            within = [step for step in steps if step[2] <= args.budget]
+            base = steps[0][1]
+            if within:
+                scale, live, ms = within[-1]
+                per_bullet = ms * 1000 / live if live else 0.0
+                print(
+                    f"{phase.hp:>5} {pattern.kind:8} {base:6.0f} {live:9.0f} "
+                    f"{scale:>5} {ms:6.2f} {per_bullet:9.2f}"
+                )
+            else:
+                print(f"{phase.hp:>5} {pattern.kind:8} {base:6.0f} {'-':>9} (over budget at x1)")
+
+    game.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
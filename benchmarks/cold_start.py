@@ -0,0 +1,155 @@
+"""Cold start: time from launching Python to the menu and to a built game.
+
+Every run is a fresh interpreter (dummy video and audio drivers) that
+reports when each boot phase ended; the phases are:
+
+    python    interpreter startup, until the first line of the launcher
+    pygame    ``import pygame``
+    modules   game modules needed before the menu
+    init      SDL subsystems and the window
+    assets    action map, menu images and fonts, first menu present
+    game      importing the remaining modules and building ``Game``
+
+and four launches are compared:
+
+    eager     the previous order: every module imported up front,
+              ``pygame.init()``, the game built before the menu
+    lazy      ``strikers2022.main.boot`` then ``load_game`` from the
+              source tree, with its bytecode cache
+    nocache   the same from a copy without ``__pycache__``, run with
+              ``-B`` (a read-only install compiles every module each start)
+    pyz       the same from ``python -m strikers2022.pack``'s archive
+
+``menu`` is launch to first menu frame, ``ready`` launch to a built game.
+In ``eager`` the game is built before the menu; elsewhere it is built
+right after the menu is on screen. Medians in ms.
+
+    python -m benchmarks.cold_start [--runs 10]
+"""
+
+import argparse
+import json
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+CHILD = r"""
+import json, os, sys, time
+start = time.time()
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+mode, path = sys.argv[1], sys.argv[2]
+sys.path.insert(0, path)
+marks = [("python", start)]
+if mode == "eager":
+    import pygame
+    marks.append(("pygame", time.time()))
+    from strikers2022.config import WINDOW_WIDTH, WINDOW_HEIGHT
+    from strikers2022.game import Game
+    from strikers2022.managers import ActionMap, filter_events
+    from strikers2022.ui import GameMenu
+    marks.append(("modules", time.time()))
+    pygame.init()
+    pygame.mixer.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    filter_events()
+    marks.append(("init", time.time()))
+    actions = ActionMap.load()
+    menu = GameMenu(screen, actions)
+    marks.append(("assets", time.time()))
+    Game(screen, actions)
+    marks.append(("game", time.time()))
+    menu.draw()
+    marks.append(("menu shown", time.time()))
+else:
+    from strikers2022.main import boot, load_game
+    screen, menu, actions = boot(marks)
+    load_game(screen, actions, marks)
+print(json.dumps(marks))
+"""
+
+# Boot phase marks (``strikers2022.main``) -> table column
+COLUMNS = {
+    "import pygame": "pygame",
+    "import menu": "modules",
+    "init": "init",
+    "menu assets": "assets",
+    "menu shown": "assets",
+    "import game": "game",
+    "game built": "game",
+}
+PHASES = ("python", "pygame", "modules", "init", "assets", "game")
+
+
+def launch(mode: str, path: Path, flags: tuple[str, ...] = ()) -> dict[str, float]:
+    """Start one interpreter; phase durations plus ``menu`` and ``ready`` in ms."""
+    spawned = time.time()
+    result = subprocess.run(
+        [sys.executable, *flags, "-c", CHILD, mode, str(path)],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=tempfile.gettempdir(),
+    )
+    marks = json.loads(result.stdout.strip().splitlines()[-1])
+    times = dict.fromkeys(PHASES, 0.0)
+    previous = spawned
+    for name, at in marks:
+        times[COLUMNS.get(name, name)] += (at - previous) * 1000
+        previous = at
+        if name == "menu shown":
+            times["menu"] = (at - spawned) * 1000
+    times["ready"] = (max(at for _, at in marks) - spawned) * 1000
+    return times
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Launch to menu and game, by phase.")
+    parser.add_argument("--runs", type=int, default=10, help="launches per mode")
+    args = parser.parse_args(argv)
+
+    from strikers2022.pack import build
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        copy = tmp / "source"
+        shutil.copytree(
+            PROJECT_DIR / "strikers2022",
+            copy / "strikers2022",
+            ignore=shutil.ignore_patterns("__pycache__"),
+        )
+        for name in ("images", "sounds", "musics", "patterns"):
+            (copy / name).symlink_to(PROJECT_DIR / name)
+        archive = tmp / "strikers2022.pyz"
+        build(archive)
+
+        modes = (
+            ("eager", PROJECT_DIR, ()),
+            ("lazy", PROJECT_DIR, ()),
+            ("nocache", copy, ("-B",)),
+            ("pyz", archive, ()),
+        )
+        # Warm the OS file cache and the source tree's bytecode cache
+        for mode, path, flags in modes:
+            launch(mode if mode == "eager" else "lazy", path, flags)
+
+        print(f"median of {args.runs} launches (ms)")
+        header = " ".join(f"{name:>8}" for name in (*PHASES, "menu", "ready"))
+        print(f"{'mode':<8} {header}")
+        for mode, path, flags in modes:
+            runs = [launch(mode, path, flags) for _ in range(args.runs)]
+            row = " ".join(
+                f"{statistics.median(run[name] for run in runs):8.1f}"
+                for name in (*PHASES, "menu", "ready")
+            )
+            print(f"{mode:<8} {row}")
+
+
+if __name__ == "__main__":
+    main()
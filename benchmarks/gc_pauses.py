@@ -0,0 +1,92 @@
+"""Garbage collector pauses with and without the managed GC policy.
+
+Plays the same seeded, populated game with both players holding fire and
+enemies shooting, once with the interpreter's automatic collection
+(``GC_MANAGED = False``) and once managed (startup objects frozen,
+collections moved into frame slack). Reports collections per generation,
+collections that landed inside frame work and their longest pause, and
+frame work percentiles.
+
+The loop runs at the normal 60 FPS cap so there is slack to collect in.
+
+    python -m benchmarks.gc_pauses [--frames 1800] [--enemies 100] [--bullets 400]
+"""
+
+import argparse
+import gc
+
+from strikers2022.headless import init_pygame
+
+from .render_queue import populate
+
+
+def run(screen, managed: bool, frames: int, enemies: int, bullets: int) -> dict:
+    """Play ``frames`` frames under one GC policy."""
+    from strikers2022.game import Game
+    from strikers2022.managers import GCManager
+
+    gc.unfreeze()
+    gc.enable()
+    gc.collect()
+
+    game = Game(screen)
+    game.quality.enabled = False
+    game.gc_manager.close()
+    game.gc_manager = GCManager(game.frame_stats, managed=managed)
+    game.seed = 0
+    game.start()
+    populate(game, enemies, bullets)
+    for player in (game.player1, game.player2):
+        player.state.start_attack()
+
+    work = []
+    played = 0
+    while played < frames and not game.result:
+        game.step()
+        work.append(game.frame_stats.last_work_ms)
+        played += 1
+
+    stats = game.frame_stats
+    work.sort()
+    result = {
+        "collections": list(stats.gc_collections),
+        "in_frame": stats.gc_in_frame,
+        "max_in_frame": stats.gc_max_in_frame_ms,
+        "max_scheduled": stats.gc_max_scheduled_ms,
+        "p99": work[int(len(work) * 0.99) - 1],
+        "max": work[-1],
+        "frozen": gc.get_freeze_count(),
+    }
+    game.close()
+    return result
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="GC pauses: automatic vs. managed.")
+    parser.add_argument("--frames", type=int, default=1800)
+    parser.add_argument("--enemies", type=int, default=100)
+    parser.add_argument("--bullets", type=int, default=400)
+    args = parser.parse_args(argv)
+
+    screen = init_pygame()
+
+    import pygame
+
+    print(
+        f"{'policy':>9} {'gen0':>6} {'gen1':>5} {'gen2':>5} {'in-frame':>9} "
+        f"{'max in-frame ms':>16} {'max scheduled ms':>17} {'work p99':>9} {'work max':>9} {'frozen':>8}"
+    )
+    for managed in (False, True):
+        r = run(screen, managed, args.frames, args.enemies, args.bullets)
+        gen0, gen1, gen2 = r["collections"]
+        print(
+            f"{'managed' if managed else 'automatic':>9} {gen0:>6} {gen1:>5} {gen2:>5} "
+            f"{r['in_frame']:>9} {r['max_in_frame']:>16.2f} {r['max_scheduled']:>17.2f} "
+            f"{r['p99']:>9.2f} {r['max']:>9.2f} {r['frozen']:>8}"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
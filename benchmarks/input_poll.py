@@ -0,0 +1,125 @@
+"""Per-frame input processing cost against the number of queued events.
+
+Every frame a batch of events nobody acts on (mouse motion, stick motion,
+text input, key releases) is posted together with one key press and
+release of a bound key, and the frame's input step is timed two ways:
+
+    events   every event type queued, each one dispatched through an
+             if/elif chain over the bound keys (the previous InputManager)
+    sampled  ``filter_events`` blocks the unhandled types, the queue is
+             drained through ``InputManager.handle_event``, then ``poll``
+             samples the bound keys and sticks once
+
+Blocked events are dropped when posted, so ``sampled`` never sees them;
+the events column is what each approach took off the queue per frame.
+Times are medians per frame in microseconds.
+
+    python -m benchmarks.input_poll [--frames 600]
+"""
+
+import argparse
+import statistics
+import time
+
+LOADS = (0, 10, 100, 1000)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Input processing cost per frame.")
+    parser.add_argument("--frames", type=int, default=600, help="timed frames per case")
+    args = parser.parse_args(argv)
+
+    from strikers2022.headless import init_pygame
+
+    init_pygame()
+
+    import pygame
+    from strikers2022.entities import Player
+    from strikers2022.managers import InputManager, filter_events
+
+    players = (Player(0, 0, "player1.png"), Player(0, 0, "player2.png"))
+    manager = InputManager(*players)
+    bindings = [
+        [(pygame.key.key_code(name), action) for action, names in player.items() for name in names]
+        for player in manager.actions.keys
+    ]
+
+    def dispatch(event) -> None:
+        """Key event handling as an if/elif chain, as before the action map."""
+        if event.type == pygame.QUIT:
+            return
+        if event.type == pygame.KEYDOWN:
+            for player, keys in zip(players, bindings):
+                for key, action in keys:
+                    if event.key == key:
+                        if action == "attack":
+                            player.state.start_attack()
+                        else:
+                            getattr(player, f"move_{action}")()
+                        break
+        elif event.type == pygame.KEYUP:
+            for player, keys in zip(players, bindings):
+                for key, action in keys:
+                    if event.key == key:
+                        if action in ("left", "right"):
+                            player.stop_horizontal()
+                        elif action in ("up", "down"):
+                            player.stop_vertical()
+                        else:
+                            player.state.stop_attack()
+                        break
+
+    def post(load: int) -> None:
+        noise = (
+            pygame.event.Event(pygame.MOUSEMOTION, pos=(1, 1), rel=(1, 1), buttons=(0, 0, 0)),
+            pygame.event.Event(pygame.JOYAXISMOTION, joy=0, instance_id=0, axis=0, value=0.5),
+            pygame.event.Event(pygame.TEXTINPUT, text="a"),
+            pygame.event.Event(pygame.KEYUP, key=pygame.K_z, mod=0),
+        )
+        for index in range(load):
+            pygame.event.post(noise[index % len(noise)])
+        pygame.event.post(pygame.event.Event(pygame.KEYDOWN, key=pygame.K_LEFT, mod=0))
+        pygame.event.post(pygame.event.Event(pygame.KEYUP, key=pygame.K_LEFT, mod=0))
+
+    def events_frame() -> int:
+        events = pygame.event.get()
+        for event in events:
+            dispatch(event)
+        return len(events)
+
+    def sampled_frame() -> int:
+        events = pygame.event.get()
+        for event in events:
+            manager.handle_event(event)
+        manager.poll()
+        return len(events)
+
+    def run(frame, load: int) -> tuple[float, int]:
+        times = []
+        handled = 0
+        for _ in range(args.frames):
+            post(load)
+            start = time.perf_counter()
+            handled = frame()
+            times.append(time.perf_counter() - start)
+        return statistics.median(times) * 1e6, handled
+
+    print(f"median of {args.frames} frames (us per frame)")
+    print(f"{'load':>5} {'events':>9} {'queued':>6} {'sampled':>9} {'queued':>6}")
+    for load in LOADS:
+        pygame.event.set_allowed(None)
+        pygame.event.clear()
+        events_us, events_handled = run(events_frame, load)
+        filter_events()
+        pygame.event.clear()
+        sampled_us, sampled_handled = run(sampled_frame, load)
+        print(
+            f"{load:>5} {events_us:9.1f} {events_handled:>6} "
+            f"{sampled_us:9.1f} {sampled_handled:>6}"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
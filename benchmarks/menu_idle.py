@@ -0,0 +1,67 @@
+"""Idle CPU usage of the menu loop.
+
+Runs the menu with no input for a few seconds and reports process CPU time
+as a share of wall time, for the previous polling loop (redraw every
+iteration, ``event.get``) and the current one (pre-composed frame,
+``event.wait`` with a timeout).
+
+    python -m benchmarks.menu_idle [--seconds 3]
+"""
+
+import argparse
+import time
+
+from strikers2022.headless import init_pygame
+
+
+def measure(step, seconds: float) -> tuple[float, int]:
+    """Run ``step`` for ``seconds``; return (CPU share in %, iterations)."""
+    iterations = 0
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    while time.perf_counter() - wall_start < seconds:
+        step()
+        iterations += 1
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    return cpu / wall * 100, iterations
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Menu idle CPU usage.")
+    parser.add_argument("--seconds", type=float, default=3.0)
+    args = parser.parse_args(argv)
+
+    screen = init_pygame()
+
+    import pygame
+    from strikers2022.config import WINDOW_WIDTH, WINDOW_HEIGHT, WHITE, YELLOW
+    from strikers2022.ui import GameMenu, draw_text
+
+    menu = GameMenu(screen)
+
+    def polling_step():
+        # The previous menu loop: full redraw and a non-blocking poll
+        screen.blit(menu.background, [0, 0])
+        draw_x, draw_y = int(WINDOW_WIDTH / 4), int(WINDOW_HEIGHT / 4)
+        draw_text("STRIKERS 2022", menu.font_70, screen, draw_x + 250, draw_y, YELLOW)
+        draw_text("PRESS ENTER KEY", menu.font_40, screen, draw_x + 150, draw_y + 200, WHITE)
+        draw_text("TO START THE GAME.", menu.font_40, screen, draw_x + 150, draw_y + 250, WHITE)
+        pygame.display.update()
+        pygame.event.get()
+
+    def idle_step():
+        menu.draw()
+        menu.handle_events()
+
+    before, before_iterations = measure(polling_step, args.seconds)
+    after, after_iterations = measure(idle_step, args.seconds)
+
+    print(f"polling menu: {before:5.1f}% CPU  ({before_iterations} iterations)")
+    print(f"idle menu:    {after:5.1f}% CPU  ({after_iterations} iterations)")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Two headless netplay instances over loopback UDP.
+
+Starts both players as separate processes with bot input and injected
+latency/jitter/loss, waits for them and prints their session reports
+(rollback depth, resimulation time, snapshot size, checksum matches).
+
+    python -m benchmarks.netplay_loopback [--frames 1200] [--delay-ms 40] [--jitter-ms 15] [--loss 0.02]
+"""
+
+import argparse
+import subprocess
+import sys
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Netplay over loopback.")
+    parser.add_argument("--frames", type=int, default=1200)
+    parser.add_argument("--delay-ms", type=float, default=40.0)
+    parser.add_argument("--jitter-ms", type=float, default=15.0)
+    parser.add_argument("--loss", type=float, default=0.02)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args(argv)
+
+    processes = [
+        subprocess.Popen(
+            [
+                sys.executable, "-m", "strikers2022.netplay",
+                "--player", str(player),
+                "--headless", "--bot",
+                "--seed", str(args.seed),
+                "--frames", str(args.frames),
+                "--delay-ms", str(args.delay_ms),
+                "--jitter-ms", str(args.jitter_ms),
+                "--loss", str(args.loss),
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
+        for player in (1, 2)
+    ]
+
+    for player, process in zip((1, 2), processes):
+        output, _ = process.communicate()
+        print(f"--- player {player} (exit {process.returncode})")
+        print("\n".join(
+            line for line in output.splitlines()
+            if not line.startswith(("pygame ", "Hello from the pygame"))
+        ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Single-threaded vs. pipelined frame loop throughput.
+
+Runs the uncapped game loop from the same seeded start in both modes and
+reports frames per second:
+
+- serial: simulate, collide and render one after another on one thread
+- pipelined: simulate frame N+1 on a worker thread while the main thread
+  draws the snapshot of frame N
+
+The overlap is limited to the time the render stage spends in
+GIL-releasing pygame calls (blits, scaling) unless the interpreter is a
+free-threaded build, and it needs a second core to show up at all.
+
+    python -m benchmarks.pipeline [--frames 600] [--repeats 3] [--enemies 100] [--bullets 400]
+"""
+
+import argparse
+import os
+import sys
+import sysconfig
+import time
+
+from strikers2022.headless import init_pygame
+
+from .render_queue import populate
+
+
+def run(game, pipelined: bool, frames: int, enemies: int, bullets: int) -> float:
+    """Frames per second of ``frames`` loop iterations from a seeded start."""
+    game.seed = 0
+    game.pipelined = pipelined
+    game.start()
+    populate(game, enemies, bullets)
+
+    start = time.perf_counter()
+    played = 0
+    while played < frames and not game.result:
+        game.step()
+        played += 1
+    return played / (time.perf_counter() - start)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Serial vs. pipelined frame loop.")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--enemies", type=int, default=100)
+    parser.add_argument("--bullets", type=int, default=400)
+    args = parser.parse_args(argv)
+
+    screen = init_pygame()
+
+    import pygame
+    from strikers2022.game import Game
+
+    game = Game(screen)
+    game.fps_limit = 0
+    game.quality.enabled = False
+
+    # Alternate the two modes and keep the best of several runs
+    serial = pipelined = 0.0
+    for _ in range(args.repeats):
+        serial = max(serial, run(game, False, args.frames, args.enemies, args.bullets))
+        pipelined = max(pipelined, run(game, True, args.frames, args.enemies, args.bullets))
+
+    free_threaded = bool(sysconfig.get_config_var("Py_GIL_DISABLED"))
+    gil = sys._is_gil_enabled() if hasattr(sys, "_is_gil_enabled") else True
+    print(f"cpus: {os.cpu_count()}  free-threaded build: {free_threaded}  GIL enabled: {gil}")
+    print(f"serial:    {serial:7.0f} frames/s")
+    print(f"pipelined: {pipelined:7.0f} frames/s  ({pipelined / serial:.2f}x)")
+
+    game.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
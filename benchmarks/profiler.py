@@ -0,0 +1,84 @@
+"""Overhead of the sampling profiler on the game loop.
+
+Runs the uncapped loop from the same seeded, populated start with the
+profiler off and on at several sampling intervals, alternating modes and
+keeping the best of several runs. Reports frames/s, the slowdown against
+the unprofiled loop and the profiler's own account of its sampling time.
+
+    python -m benchmarks.profiler [--frames 600] [--repeats 3] [--intervals 1 5 10]
+"""
+
+import argparse
+import tempfile
+import time
+
+from strikers2022.headless import init_pygame
+
+from .render_queue import populate
+
+
+def run(game, frames: int, interval_ms: float | None, output_dir: str) -> tuple[float, float]:
+    """Frames per second and reported sampling overhead of one run."""
+    from strikers2022.diagnostics import SamplingProfiler
+
+    game.seed = 0
+    game.start()
+    populate(game, 100, 400)
+
+    profiler = None
+    if interval_ms is not None:
+        profiler = game.profiler = SamplingProfiler(interval_ms, output_dir)
+        profiler.start(game._profile_labels)
+
+    start = time.perf_counter()
+    played = 0
+    while played < frames and not game.result:
+        game.step()
+        played += 1
+    elapsed = time.perf_counter() - start
+
+    if profiler is None:
+        return played / elapsed, 0.0
+    profiler.stop()
+    profiler.write()
+    return played / elapsed, profiler.overhead
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Sampling profiler overhead.")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--intervals", type=float, nargs="+", default=[1, 5, 10])
+    args = parser.parse_args(argv)
+
+    screen = init_pygame()
+
+    import pygame
+    from strikers2022.game import Game
+
+    game = Game(screen)
+    game.fps_limit = 0
+    game.quality.enabled = False
+
+    modes = [None] + args.intervals
+    best = {mode: (0.0, 0.0) for mode in modes}
+    with tempfile.TemporaryDirectory() as output_dir:
+        for _ in range(args.repeats):
+            for mode in modes:
+                fps, overhead = run(game, args.frames, mode, output_dir)
+                if fps > best[mode][0]:
+                    best[mode] = (fps, overhead)
+
+    baseline = best[None][0]
+    print(f"{'interval':>10} {'frames/s':>9} {'slowdown':>9} {'sampling':>9}")
+    for mode in modes:
+        fps, overhead = best[mode]
+        label = "off" if mode is None else f"{mode:g} ms"
+        print(f"{label:>10} {fps:>9.0f} {(1 - fps / baseline) * 100:>8.1f}% {overhead * 100:>8.2f}%")
+
+    game.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
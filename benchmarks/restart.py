@@ -0,0 +1,75 @@
+"""Time from a start request (Enter) to the first gameplay frame.
+
+Plays a short session, then starts again, each start measured from the
+request to the first presented gameplay frame:
+
+- cold: the very first start (builds the world)
+- rebuild: later starts through the previous path (new entities, groups and
+  managers, music reloaded from disk)
+- reset: later starts through the in-place reset
+
+The previous game-over path also blocked for one second in
+``pygame.time.wait`` before the menu could take Enter again; that wait is
+not included in the rebuild numbers.
+
+    python -m benchmarks.restart [--restarts 20] [--frames 120]
+"""
+
+import argparse
+import statistics
+
+from strikers2022.headless import init_pygame
+
+
+def play(game, frames: int) -> None:
+    """Run ``frames`` gameplay frames."""
+    for _ in range(frames):
+        game.step()
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Start request to first frame.")
+    parser.add_argument("--restarts", type=int, default=20)
+    parser.add_argument("--frames", type=int, default=120)
+    args = parser.parse_args(argv)
+
+    init_pygame()
+
+    import pygame
+    from strikers2022.game import Game
+    from strikers2022.managers import audio
+
+    game = Game(pygame.display.get_surface())
+    game.fps_limit = 0
+
+    game.start()
+    play(game, args.frames)
+    cold = game.start_ms[-1]
+
+    def rebuild():
+        game._world_ready = False
+        audio._music_file = None
+        game.start()
+
+    results = {}
+    for name, restart in (("rebuild", rebuild), ("reset", game.start)):
+        samples = []
+        for _ in range(args.restarts):
+            restart()
+            play(game, args.frames)
+            samples.append(game.start_ms[-1])
+        results[name] = samples
+
+    print(f"cold start: {cold:7.2f} ms")
+    for name, samples in results.items():
+        print(
+            f"{name:<8}    median {statistics.median(samples):6.2f} ms  "
+            f"min {min(samples):6.2f} ms  max {max(samples):6.2f} ms"
+        )
+
+    game.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
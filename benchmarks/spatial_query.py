@@ -0,0 +1,179 @@
+"""Nearest-target queries for missiles against growing enemy counts.
+
+For every (missiles, enemies) pair, points are scattered uniformly over
+the window and each missile asks for its nearest enemy within the lock
+radius, three ways:
+
+    naive   Python loop over all enemies per missile (per-entity code)
+    brute   one numpy distance matrix, missiles x enemies
+    grid    ``SpatialGrid.rebuild`` + batched ``nearest`` (k=1)
+
+``within`` (every enemy inside the radius, as an area effect would ask)
+is timed on the grid as well. Results are checked against each other.
+Before timing, ``check`` compares ``nearest`` (several k) and ``within``
+with a brute-force answer on sparse, clustered and off-window points
+at radii up to unbounded, and stops on the first mismatch.
+Times are medians per frame in ms; the naive scan is skipped above
+``--naive-limit`` pairs.
+
+    python -m benchmarks.spatial_query [--radius 450] [--repeat 15]
+"""
+
+import argparse
+import math
+import statistics
+import time
+
+import numpy as np
+
+MISSILES = (10, 100, 1000)
+ENEMIES = (10, 100, 1000, 10000)
+
+
+def median_ms(func, repeat: int) -> tuple[float, object]:
+    """Median milliseconds of ``func()`` and its last result."""
+    times = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000, result
+
+
+def naive(mx, my, ex, ey, radius: float) -> list[int]:
+    nearest = []
+    for x, y in zip(mx, my):
+        best, best_distance = -1, math.inf
+        for index, (tx, ty) in enumerate(zip(ex, ey)):
+            distance = math.hypot(tx - x, ty - y)
+            if distance < best_distance:
+                best, best_distance = index, distance
+        nearest.append(best if best_distance <= radius else -1)
+    return nearest
+
+
+def brute(mx, my, ex, ey, radius: float) -> np.ndarray:
+    dx = ex[None, :] - mx[:, None]
+    dy = ey[None, :] - my[:, None]
+    distance2 = dx * dx + dy * dy
+    nearest = distance2.argmin(axis=1)
+    nearest[distance2[np.arange(len(mx)), nearest] > radius * radius] = -1
+    return nearest
+
+
+def brute_nearest(qx, qy, px, py, k: int, radius: float) -> tuple[np.ndarray, np.ndarray]:
+    """``SpatialGrid.nearest`` by sorting every distance."""
+    indices = np.full((len(qx), k), -1, np.intp)
+    distances = np.full((len(qx), k), np.inf)
+    for query, (x, y) in enumerate(zip(qx, qy)):
+        distance2 = (px - x) ** 2 + (py - y) ** 2
+        ranked = np.lexsort((np.arange(len(px)), distance2))[:k]
+        ranked = ranked[distance2[ranked] <= radius * radius]
+        indices[query, : len(ranked)] = ranked
+        distances[query, : len(ranked)] = np.sqrt(distance2[ranked])
+    return indices, distances
+
+
+def check(grid) -> int:
+    """Compare the grid with brute force; returns the number of cases."""
+    from strikers2022.config import WINDOW_WIDTH, WINDOW_HEIGHT
+
+    rng = np.random.default_rng(7)
+    corners = (np.array([5.0, WINDOW_WIDTH - 5.0]), np.array([5.0, WINDOW_HEIGHT - 5.0]))
+    cases = [
+        # One point in a corner, queried from the opposite one
+        (corners[0][:1], corners[1][:1], corners[0][1:], corners[1][1:]),
+        # Points clamped in from far outside the window
+        (
+            rng.uniform(-3 * WINDOW_WIDTH, 4 * WINDOW_WIDTH, 20),
+            rng.uniform(-3 * WINDOW_HEIGHT, 4 * WINDOW_HEIGHT, 20),
+            rng.uniform(0, WINDOW_WIDTH, 50),
+            rng.uniform(0, WINDOW_HEIGHT, 50),
+        ),
+        # A tight cluster queried from everywhere
+        (
+            rng.normal(100, 10, 30),
+            rng.normal(100, 10, 30),
+            rng.uniform(0, WINDOW_WIDTH, 50),
+            rng.uniform(0, WINDOW_HEIGHT, 50),
+        ),
+        # Uniform points, integer coordinates for distance ties
+        (
+            rng.integers(0, WINDOW_WIDTH, 300).astype(float),
+            rng.integers(0, WINDOW_HEIGHT, 300).astype(float),
+            rng.integers(0, WINDOW_WIDTH, 100).astype(float),
+            rng.integers(0, WINDOW_HEIGHT, 100).astype(float),
+        ),
+    ]
+    checked = 0
+    for number, (px, py, qx, qy) in enumerate(cases):
+        grid.rebuild(px, py)
+        for radius in (math.inf, 2000.0, 450.0, 60.0):
+            for k in (1, 3, 8):
+                found = grid.nearest(qx, qy, k=k, radius=radius)
+                expected = brute_nearest(qx, qy, px, py, k, radius)
+                if not (np.array_equal(found[0], expected[0]) and np.array_equal(found[1], expected[1])):
+                    raise AssertionError(f"nearest disagrees with brute force: case {number}, k={k}, radius={radius}")
+                checked += 1
+            within = grid.within(qx, qy, radius)
+            for query, (x, y) in enumerate(zip(qx, qy)):
+                inside = np.flatnonzero((px - x) ** 2 + (py - y) ** 2 <= radius * radius)
+                if not np.array_equal(np.sort(within[query]), inside):
+                    raise AssertionError(f"within disagrees with brute force: case {number}, radius={radius}")
+            checked += 1
+    return checked
+
+
+def main(argv=None) -> None:
+    from strikers2022.config import MISSILE_LOCK_RADIUS, SPATIAL_GRID_CELL, WINDOW_WIDTH, WINDOW_HEIGHT
+    from strikers2022.utils import SpatialGrid
+
+    parser = argparse.ArgumentParser(description="Nearest-target query scaling.")
+    parser.add_argument("--radius", type=float, default=MISSILE_LOCK_RADIUS, help="lock radius")
+    parser.add_argument("--cell", type=float, default=SPATIAL_GRID_CELL, help="grid cell size")
+    parser.add_argument("--repeat", type=int, default=15, help="timed runs per case")
+    parser.add_argument(
+        "--naive-limit", type=int, default=1_000_000, help="largest missiles x enemies for the naive scan"
+    )
+    args = parser.parse_args(argv)
+
+    rng = np.random.default_rng(1)
+    grid = SpatialGrid(args.cell)
+    print(f"grid matches brute force in {check(grid)} cases")
+    print(f"radius {args.radius:g}, cell {args.cell:g}, median of {args.repeat} (ms)")
+    print(f"{'missiles':>8} {'enemies':>7} {'naive':>9} {'brute':>8} {'grid':>8} {'rebuild':>8} {'within':>8}")
+    for missiles in MISSILES:
+        for enemies in ENEMIES:
+            mx = rng.uniform(0, WINDOW_WIDTH, missiles)
+            my = rng.uniform(0, WINDOW_HEIGHT, missiles)
+            ex = rng.uniform(0, WINDOW_WIDTH, enemies)
+            ey = rng.uniform(0, WINDOW_HEIGHT, enemies)
+
+            def grid_nearest():
+                grid.rebuild(ex, ey)
+                return grid.nearest(mx, my, k=1, radius=args.radius)[0][:, 0]
+
+            naive_ms = "-"
+            if missiles * enemies <= args.naive_limit:
+                lists = (mx.tolist(), my.tolist(), ex.tolist(), ey.tolist())
+                ms, expected = median_ms(lambda: naive(*lists, args.radius), max(1, args.repeat // 5))
+                naive_ms = f"{ms:.3f}"
+            brute_ms, nearest = median_ms(lambda: brute(mx, my, ex, ey, args.radius), args.repeat)
+            grid_ms, found = median_ms(grid_nearest, args.repeat)
+            rebuild_ms, _ = median_ms(lambda: grid.rebuild(ex, ey), args.repeat)
+            within_ms, _ = median_ms(lambda: grid.within(mx, my, args.radius), args.repeat)
+
+            # Ties are vanishingly unlikely with random floats
+            if not np.array_equal(found, nearest):
+                raise AssertionError(f"grid and brute force disagree at {missiles} x {enemies}")
+            if naive_ms != "-" and list(found) != expected:
+                raise AssertionError(f"grid and naive scan disagree at {missiles} x {enemies}")
+            print(
+                f"{missiles:>8} {enemies:>7} {naive_ms:>9} {brute_ms:8.3f} "
+                f"{grid_ms:8.3f} {rebuild_ms:8.3f} {within_ms:8.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""Cost of session telemetry on the game loop, and behaviour on a slow disk.
+
+Measures the per-frame cost of ``TelemetryRecorder.on_frame`` in a running
+game and the writer's batch times. Then holds an exclusive lock on the
+database (a disk that stops keeping up) while rows keep coming, and
+reports the slowest ``put``, the buffered row count and the dropped rows.
+
+    python -m benchmarks.telemetry [--frames 36000] [--stall 3]
+"""
+
+import argparse
+import os
+import sqlite3
+import tempfile
+import time
+
+from strikers2022.headless import init_pygame
+
+
+def recorder_cost(game, frames: int) -> float:
+    """Microseconds per ``on_frame`` call."""
+    telemetry = game.telemetry
+    start = time.perf_counter()
+    for _ in range(frames):
+        telemetry.on_frame(game, 1.0, 16.7)
+    return (time.perf_counter() - start) / frames * 1e6
+
+
+def stalled_writer(path: str, rows: int, stall: float, max_pending: int) -> tuple[float, int, int]:
+    """Slowest put (us), most rows buffered and rows dropped during a stall."""
+    from strikers2022.diagnostics import TelemetrySink
+
+    sink = TelemetrySink(path, flush_seconds=0.05, max_pending=max_pending)
+    sink.start()
+    blocker = sqlite3.connect(path, timeout=0)
+    blocker.execute("BEGIN EXCLUSIVE")
+
+    row = ("stall", 0, 0, 0, 0, 0, 1, 1, 1, 1, 1, 1, 60, 1.0, 2.0, 17.0)
+    interval = stall / rows
+    slowest = 0.0
+    buffered = 0
+    for _ in range(rows):
+        start = time.perf_counter()
+        sink.put("second", row)
+        slowest = max(slowest, time.perf_counter() - start)
+        buffered = max(buffered, len(sink._pending))
+        time.sleep(interval)
+
+    blocker.rollback()
+    blocker.close()
+    sink.stop()
+    return slowest * 1e6, buffered, sink.dropped
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Telemetry cost and slow-disk behaviour.")
+    parser.add_argument("--frames", type=int, default=36000, help="frames of on_frame calls")
+    parser.add_argument("--stall", type=float, default=3.0, help="seconds the disk is locked")
+    parser.add_argument("--max-pending", type=int, default=1000)
+    args = parser.parse_args(argv)
+
+    screen = init_pygame()
+
+    import pygame
+    from strikers2022.game import Game
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "telemetry.db")
+        game = Game(screen)
+        game.enable_telemetry(path)
+        game.start()
+
+        per_frame = recorder_cost(game, args.frames)
+        sink = game.telemetry.sink
+        game.close()
+        print(f"on_frame: {per_frame:.2f} us/frame ({args.frames // 60} rows over {args.frames} frames)")
+        print(sink.summary())
+
+        stall_path = os.path.join(directory, "stall.db")
+        slowest, buffered, dropped = stalled_writer(
+            stall_path, 10000, args.stall, args.max_pending
+        )
+        print(
+            f"disk locked {args.stall:g} s: slowest put {slowest:.1f} us, "
+            f"at most {buffered} rows buffered (limit {args.max_pending}), {dropped} dropped"
+        )
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Overhead of the timeline tracer on the game loop.
+
+Runs the uncapped loop from the same seeded, populated start with the
+tracer off and on, alternating modes and keeping the best of several
+runs. Reports frames/s, the slowdown, spans recorded per frame and the
+cost per span. A run with the tracer off executes exactly the code of a
+build without tracing, since wrappers only exist during a capture.
+
+    python -m benchmarks.tracer [--frames 600] [--repeats 5] [--capacity 4096]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+from strikers2022.headless import init_pygame
+
+from .render_queue import populate
+
+
+def run(game, frames: int, traced: bool, capacity: int, output_dir: str) -> tuple[float, int]:
+    """Frames per second and recorded spans of one run."""
+    from strikers2022.diagnostics import Tracer
+
+    game.seed = 0
+    game.start()
+    populate(game, 100, 400)
+
+    if traced:
+        game.tracer = Tracer(capacity, output_dir)
+        game.tracer.start()
+        for target, names in game._trace_targets():
+            game.tracer.instrument(target, names)
+
+    start = time.perf_counter()
+    played = 0
+    while played < frames and not game.result:
+        game.step()
+        played += 1
+    elapsed = time.perf_counter() - start
+
+    if not traced:
+        return played / elapsed, 0
+    game.tracer.stop()
+    return played / elapsed, game.tracer.recorded
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Timeline tracer overhead.")
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--capacity", type=int, default=4096, help="ring buffer spans")
+    args = parser.parse_args(argv)
+
+    screen = init_pygame()
+
+    import pygame
+    from strikers2022.game import Game
+
+    game = Game(screen)
+    game.fps_limit = 0
+    game.quality.enabled = False
+
+    best = {False: 0.0, True: 0.0}
+    spans = 0
+    with tempfile.TemporaryDirectory() as output_dir:
+        for _ in range(args.repeats):
+            for traced in (False, True):
+                fps, recorded = run(game, args.frames, traced, args.capacity, output_dir)
+                if fps > best[traced]:
+                    best[traced] = fps
+                    spans = recorded or spans
+
+        start = time.perf_counter()
+        path = game.tracer.write()
+        write_ms = (time.perf_counter() - start) * 1000
+        size = os.path.getsize(path)
+
+    off, on = best[False], best[True]
+    per_frame = spans / args.frames
+    span_us = (1 / on - 1 / off) * 1e6 / per_frame
+    print(f"off: {off:.0f} frames/s   on: {on:.0f} frames/s   slowdown {(1 - on / off) * 100:.1f}%")
+    print(f"{per_frame:.0f} spans/frame, {span_us:.2f} us per span")
+    print(
+        f"write: {min(spans, args.capacity)} spans ({game.tracer.dropped} overwritten) "
+        f"in {write_ms:.1f} ms, {size / 1024:.0f} KiB"
+    )
+
+    game.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,15 @@
 """STRIKERS 2022 - A 2-player shooting game."""
 
-from .main import main
+from typing import TYPE_CHECKING
+
+from .lazy_exports import lazy_exports
 
 __version__ = "2.0.0"
 __all__ = ["main"]
+
+# Imported on first use: ``python -m strikers2022.headless`` and other
+# entry points under the package should not load the game to start
+__getattr__, __dir__ = lazy_exports(__name__, {"main": ".main"})
+
+if TYPE_CHECKING:
+    from .main import main
@@ -0,0 +1,12 @@
+"""Scripted bot players for unattended runs."""
+
+from .controllers import (
+    BOTS,
+    Bot,
+    DodgeBot,
+    ItemSeekerBot,
+    RandomWalkBot,
+    create_bot,
+    steer_bits,
+)
+from .driver import BotDriver
@@ -0,0 +1,226 @@
+"""Bot controllers that play a player from the world state."""
+
+from abc import ABC, abstractmethod
+from itertools import chain
+import math
+import random
+
+import numpy as np
+
+from ..config import (
+    WINDOW_WIDTH,
+    WINDOW_HEIGHT,
+    PLAYER_SPEED,
+    BOT_DODGE_RADIUS,
+    BOT_LOOKAHEAD_FRAMES,
+    BOT_HOME_Y,
+)
+from ..managers import InputManager
+
+
+def steer_bits(dx: float, dy: float, deadzone: float = PLAYER_SPEED) -> int:
+    """Movement bits that head along (dx, dy); components inside the deadzone stop."""
+    bits = 0
+    if dx < -deadzone:
+        bits |= InputManager.LEFT
+    elif dx > deadzone:
+        bits |= InputManager.RIGHT
+    if dy < -deadzone:
+        bits |= InputManager.UP
+    elif dy > deadzone:
+        bits |= InputManager.DOWN
+    return bits
+
+
+class Bot(ABC):
+    """Decides one player's input bits every frame.
+
+    Bots only read the world (``Game`` entities and groups); the input
+    bits they return go through ``InputManager.apply_bits`` like netplay
+    input, so a bot drives the player exactly as held keys would.
+    """
+
+    name = "bot"
+
+    def __init__(self, seed: int | None = None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    def reset(self) -> None:
+        """Forget per-game state (called on every game start)."""
+        self.rng.seed(self.seed)
+
+    @abstractmethod
+    def decide(self, game, player) -> int:
+        """Input bits for ``player`` this frame (see ``InputManager.LEFT`` etc.)."""
+
+
+class RandomWalkBot(Bot):
+    """Holds a random direction for a random number of frames and fires at random."""
+
+    name = "random"
+
+    def __init__(self, seed: int | None = None):
+        super().__init__(seed)
+        self.reset()
+
+    def reset(self) -> None:
+        super().reset()
+        self._bits = 0
+        self._frames = 0
+
+    def decide(self, game, player) -> int:
+        if self._frames <= 0:
+            rng = self.rng
+            self._bits = (
+                rng.choice((0, InputManager.LEFT, InputManager.RIGHT))
+                | rng.choice((0, InputManager.UP, InputManager.DOWN))
+                | rng.choice((0, InputManager.ATTACK, InputManager.ATTACK))
+            )
+            self._frames = rng.randint(5, 30)
+        self._frames -= 1
+        return self._bits
+
+
+class DodgeBot(Bot):
+    """Dodges incoming bullets and enemies, otherwise lines up under a target.
+
+    Every enemy bullet is extrapolated along its straight path; a bullet
+    whose closest approach within ``BOT_LOOKAHEAD_FRAMES`` passes inside
+    ``BOT_DODGE_RADIUS`` pushes the player away from that point, harder the
+    closer it gets. Enemies push by distance alone. With nothing to dodge
+    the bot steers towards ``target`` (under the lowest enemy, or the boss)
+    at ``BOT_HOME_Y``. The fire button is held throughout.
+    """
+
+    name = "dodge"
+
+    def decide(self, game, player) -> int:
+        x, y = player.center_x, player.center_y
+        flee_x, flee_y = self._threats(game, x, y)
+        if flee_x or flee_y:
+            bits = steer_bits(flee_x, flee_y, 0.0)
+        else:
+            target_x, target_y = self.target(game, player)
+            bits = steer_bits(target_x - x, target_y - y)
+        return bits | InputManager.ATTACK
+
+    def target(self, game, player) -> tuple[float, float]:
+        """Position to head for when nothing needs dodging."""
+        lowest = None
+        for enemy in chain(game.enemy1s, game.enemy2s):
+            if lowest is None or enemy.rect.bottom > lowest.rect.bottom:
+                lowest = enemy
+        aim = lowest.rect.centerx if lowest else game.boss.rect.centerx
+        return aim, BOT_HOME_Y
+
+    def _threats(self, game, x: float, y: float) -> tuple[float, float]:
+        """Sum of the pushes away from everything about to hit (x, y)."""
+        radius = BOT_DODGE_RADIUS
+        radius2 = radius * radius
+        flee_x = flee_y = 0.0
+
+        for bullet in chain(game.enemy1_weapons, game.enemy2_weapons):
+            bx, by = bullet.rect.center
+            vx = math.cos(bullet.direction) * bullet.speed
+            vy = math.sin(bullet.direction) * bullet.speed
+            rx, ry = x - bx, y - by
+            speed2 = vx * vx + vy * vy
+            t = (rx * vx + ry * vy) / speed2 if speed2 else 0.0
+            if t < 0 or t > BOT_LOOKAHEAD_FRAMES:
+                continue
+            # Closest point of the bullet's path, relative to the player
+            cx, cy = bx + vx * t - x, by + vy * t - y
+            distance2 = cx * cx + cy * cy
+            if distance2 >= radius2:
+                continue
+            if distance2 < 1.0:
+                # Dead on: step sideways to the path
+                cx, cy = -vy, vx
+                distance2 = 1.0
+            weight = (1.0 - distance2 / radius2) / math.sqrt(distance2)
+            flee_x -= cx * weight
+            flee_y -= cy * weight
+
+        push_x, push_y = self._field_threats(game.bullet_field, x, y)
+        flee_x += push_x
+        flee_y += push_y
+
+        for enemy in chain(game.enemy1s, game.enemy2s):
+            cx, cy = enemy.rect.centerx - x, enemy.rect.centery - y
+            distance2 = cx * cx + cy * cy
+            if 0 < distance2 < radius2:
+                weight = (1.0 - distance2 / radius2) / math.sqrt(distance2)
+                flee_x -= cx * weight
+                flee_y -= cy * weight
+
+        if flee_x or flee_y:
+            # Walls: never flee into an edge the player cannot pass
+            if x < radius and flee_x < 0 or x > WINDOW_WIDTH - radius and flee_x > 0:
+                flee_x = 0.0
+            if y < radius and flee_y < 0 or y > WINDOW_HEIGHT - radius and flee_y > 0:
+                flee_y = 0.0
+        return flee_x, flee_y
+
+    def _field_threats(self, field, x: float, y: float) -> tuple[float, float]:
+        """``_threats`` for the boss pattern bullets, over all of them at once."""
+        if not len(field):
+            return 0.0, 0.0
+        radius2 = BOT_DODGE_RADIUS * BOT_DODGE_RADIUS
+        bx, by, vx, vy = field.live()
+        rx, ry = x - bx, y - by
+        speed2 = vx * vx + vy * vy
+        t = np.divide(rx * vx + ry * vy, speed2, out=np.zeros_like(speed2), where=speed2 > 0)
+        cx = bx + vx * t - x
+        cy = by + vy * t - y
+        distance2 = cx * cx + cy * cy
+        near = (t >= 0) & (t <= BOT_LOOKAHEAD_FRAMES) & (distance2 < radius2)
+        if not near.any():
+            return 0.0, 0.0
+        cx, cy, distance2 = cx[near], cy[near], distance2[near]
+        # Dead on: step sideways to the path
+        dead_on = distance2 < 1.0
+        cx = np.where(dead_on, -vy[near], cx)
+        cy = np.where(dead_on, vx[near], cy)
+        distance2 = np.maximum(distance2, 1.0)
+        weight = (1.0 - distance2 / radius2) / np.sqrt(distance2)
+        return -float((cx * weight).sum()), -float((cy * weight).sum())
+
+
+class ItemSeekerBot(DodgeBot):
+    """Dodges like ``DodgeBot`` but heads for the nearest item when one is up."""
+
+    name = "items"
+
+    def target(self, game, player) -> tuple[float, float]:
+        x, y = player.center_x, player.center_y
+        nearest = None
+        nearest_distance = math.inf
+        for item in chain(
+            game.heal_items,
+            game.weapon_power_items,
+            game.weapon_speed_items,
+            game.weapon_number_items,
+            game.weapon_missile_items,
+            game.weapon_beam_items,
+        ):
+            distance = math.hypot(item.rect.centerx - x, item.rect.centery - y)
+            if distance < nearest_distance:
+                nearest, nearest_distance = item, distance
+        if nearest is None:
+            return super().target(game, player)
+        return nearest.rect.center
+
+
+# Bot names accepted by ``create_bot`` and the headless runner
+BOTS: dict[str, type[Bot]] = {
+    bot.name: bot for bot in (RandomWalkBot, DodgeBot, ItemSeekerBot)
+}
+
+
+def create_bot(name: str, seed: int | None = None) -> Bot:
+    """Instantiate a bot by name (see ``BOTS``)."""
+    try:
+        return BOTS[name](seed)
+    except KeyError:
+        raise ValueError(f"Unknown bot {name!r} (choose from {', '.join(BOTS)})") from None
@@ -0,0 +1,77 @@
+"""Runs bot controllers inside the game loop and times their decisions."""
+
+from collections import deque
+import time
+
+from ..config import FRAME_STATS_WINDOW
+from ..diagnostics.frame_stats import percentile
+from .controllers import Bot
+
+
+class BotDriver:
+    """Feeds the input bits of up to two bots to their players each frame.
+
+    ``Game.step`` calls ``drive`` after the frame limiter and before it
+    starts timing frame work, so the bots' decision time never shows up in
+    ``FrameStats``. It is recorded here instead, per frame and per bot.
+    """
+
+    def __init__(
+        self,
+        player1: Bot | None = None,
+        player2: Bot | None = None,
+        window: int = FRAME_STATS_WINDOW,
+    ):
+        self.bots = (player1, player2)
+        self._bits = [0, 0]
+        self._decide_ms: deque[float] = deque(maxlen=window)
+        self.frames = 0
+        self.total_ms = [0.0, 0.0]
+
+    def reset(self) -> None:
+        """Restart the bots for a new game."""
+        self._bits = [0, 0]
+        self._decide_ms.clear()
+        self.frames = 0
+        self.total_ms = [0.0, 0.0]
+        for bot in self.bots:
+            if bot:
+                bot.reset()
+
+    def release(self) -> None:
+        """Treat every input as released (the game dropped held input)."""
+        self._bits = [0, 0]
+
+    def drive(self, game) -> None:
+        """Let every bot decide and apply its input to its player."""
+        manager = game.input_manager
+        clock = time.perf_counter
+        frame_ms = 0.0
+        for index, (bot, player) in enumerate(zip(self.bots, (game.player1, game.player2))):
+            if bot is None:
+                continue
+            start = clock()
+            bits = bot.decide(game, player)
+            ms = (clock() - start) * 1000
+            self.total_ms[index] += ms
+            frame_ms += ms
+            manager.apply_bits(player, bits, self._bits[index])
+            self._bits[index] = bits
+        self._decide_ms.append(frame_ms)
+        self.frames += 1
+
+    def percentile(self, percent: float) -> float:
+        """Decision time per frame (all bots) over the window, in ms."""
+        return percentile(list(self._decide_ms), percent)
+
+    def summary(self) -> str:
+        """One-line decision cost report, kept apart from frame work."""
+        names = "/".join(bot.name if bot else "-" for bot in self.bots)
+        if not self.frames:
+            return f"bots ({names}): no frames"
+        total = sum(self.total_ms)
+        return (
+            f"bots ({names}): decide {total / self.frames * 1000:.1f} us/frame  "
+            f"p99: {self.percentile(99) * 1000:.1f} us  "
+            f"(not included in frame work)"
+        )
@@ -0,0 +1,5 @@
+"""Spectator broadcast of the world state over a local socket."""
+
+from .codec import FrameState, StateDecoder, StateEncoder
+from .server import BroadcastServer, Broadcaster
+from .viewer import SpectatorView
@@ -0,0 +1,60 @@
+"""Watch a game that is being broadcast.
+
+Start the game with ``BROADCAST_ENABLED = True`` (or a headless run with
+``--broadcast``), then:
+
+    python -m strikers2022.broadcast
+"""
+
+import argparse
+import asyncio
+import time
+
+from ..config import BROADCAST_HOST, BROADCAST_PORT, FPS
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="STRIKERS 2022 spectator viewer.")
+    parser.add_argument("--host", default=BROADCAST_HOST)
+    parser.add_argument("--port", type=int, default=BROADCAST_PORT)
+    parser.add_argument("--frames", type=int, default=0, help="stop after N frames (0: stream end)")
+    parser.add_argument("--headless", action="store_true", help="no window")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+
+    if args.headless:
+        from ..headless import init_pygame
+
+        init_pygame()
+    else:
+        import pygame
+        from ..config import WINDOW_WIDTH, WINDOW_HEIGHT
+
+        pygame.init()
+        pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+        pygame.display.set_caption("STRIKERS 2022 - spectator")
+
+    import pygame
+    from .viewer import SpectatorView
+
+    view = SpectatorView(pygame.display.get_surface())
+    start = time.perf_counter()
+    try:
+        asyncio.run(view.run(args.host, args.port, fps=FPS, frames=args.frames))
+    except OSError as e:
+        print(f"Warning: Could not connect to {args.host}:{args.port} ({e})")
+    elapsed = time.perf_counter() - start
+
+    frames = view.frames_received
+    print(
+        f"spectator: {frames} frames in {elapsed:.1f} s, "
+        f"{view.bytes_received} bytes ({view.bytes_received / (frames or 1):.0f} B/frame)"
+    )
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,342 @@
+"""Binary world-state format for spectators.
+
+Every message is ``MESSAGE_HEADER`` (payload length, message type) followed
+by a zlib-compressed payload:
+
+- ``SPRITES``: JSON list of ``[asset name, width, height, layer]``; an
+  entity's sprite byte indexes this table
+- ``KEYFRAME``: ``FRAME_HEADER``, the frame's bullets and beams, entity
+  count, then one ``ENTITY`` record per entity
+- ``DELTA``: ``FRAME_HEADER`` (whose ``keyframe`` field names the base),
+  the frame's bullets and beams, removed ids, then ``ENTITY`` records only
+  for entities that were added or changed since that keyframe
+
+Deltas are relative to the last keyframe, not to the previous frame, so a
+viewer needs only the keyframe and the newest delta to show a frame and
+can skip frames freely.
+
+Bullets and beams follow the header in every frame: one ``BEAM`` per
+player, then the bullet count and the ``BulletField`` bullets as columns
+(all x, all y, all image buckets). Pattern bullets have no ids and all of
+them move every frame, so they are sent whole rather than as changes.
+"""
+
+from dataclasses import dataclass
+import json
+import struct
+import weakref
+import zlib
+
+import numpy as np
+
+from ..config import BROADCAST_KEYFRAME_INTERVAL
+from ..ui import Layer
+
+SPRITES = 1
+KEYFRAME = 2
+DELTA = 3
+
+# payload length, message type
+MESSAGE_HEADER = struct.Struct("!IB")
+
+# frame, keyframe, kills, missed, elapsed s, players hp, boss hp, enemy level,
+# player 1 and player 2 weapon (speed, power, number) levels
+FRAME_HEADER = struct.Struct("!IIIIIiiB6B")
+
+# id, sprite, angle bucket (1/256 turn), x, y
+ENTITY = struct.Struct("!HBBhh")
+
+# Beam centre x, top of the player, drawn length (0 = off)
+BEAM = struct.Struct("!hhH")
+
+# Bullet centre coordinates and ``BulletField`` image buckets
+BULLET_POSITION = np.dtype(">i2")
+BULLET_BUCKET = np.dtype("u1")
+
+COUNT = struct.Struct("!H")
+ID = struct.Struct("!H")
+
+
+@dataclass(frozen=True, slots=True)
+class FrameState:
+    """One decoded frame.
+
+    Attributes:
+        frame: Frame number
+        hud: The ``FRAME_HEADER`` fields after frame and keyframe
+        entities: (sprite, angle bucket, x, y) per entity, in draw order
+        bullets: Pattern bullets as arrays (centre x, centre y, image bucket)
+        beams: (centre x, top, length) of each player's beam
+    """
+
+    frame: int
+    hud: tuple
+    entities: list[tuple[int, int, int, int]]
+    bullets: tuple[np.ndarray, np.ndarray, np.ndarray]
+    beams: tuple[tuple[int, int, int], ...]
+
+
+def game_entities(game):
+    """(layer, entity) pairs of everything a spectator sees, in draw order."""
+    for group in (game.enemy1s, game.enemy2s):
+        for entity in group:
+            yield Layer.ENEMIES, entity
+    for group in (game.enemy1_weapons, game.enemy2_weapons):
+        for entity in group:
+            yield Layer.ENEMY_BULLETS, entity
+    for group in (
+        game.player1_weapons,
+        game.player2_weapons,
+        game.player1_missiles,
+        game.player2_missiles,
+    ):
+        for entity in group:
+            yield Layer.PLAYER_BULLETS, entity
+    yield Layer.PLAYERS, game.player1
+    yield Layer.PLAYERS, game.player2
+    yield Layer.BOSS, game.boss
+    for group in (
+        game.weapon_number_items,
+        game.weapon_speed_items,
+        game.weapon_power_items,
+        game.weapon_missile_items,
+        game.weapon_beam_items,
+        game.heal_items,
+    ):
+        for entity in group:
+            yield Layer.ITEMS, entity
+
+
+def angle_bucket(angle: float) -> int:
+    """Quantize degrees to 1/256 of a turn."""
+    return round(angle * 256 / 360) % 256
+
+
+def encode_field(game) -> bytes:
+    """The ``BEAM`` records and pattern bullet columns of ``game``."""
+    beams = b"".join(BEAM.pack(*span) for span in game.beam_spans())
+    field = game.bullet_field
+    x, y, _, _ = field.live()
+    n = min(len(x), 65535)
+    if not n:
+        return beams + COUNT.pack(0)
+    return b"".join(
+        [
+            beams,
+            COUNT.pack(n),
+            np.rint(np.clip(x[:n], -32768, 32767)).astype(BULLET_POSITION).tobytes(),
+            np.rint(np.clip(y[:n], -32768, 32767)).astype(BULLET_POSITION).tobytes(),
+            field.directions()[:n].astype(BULLET_BUCKET).tobytes(),
+        ]
+    )
+
+
+def decode_field(payload: bytes, offset: int) -> tuple[tuple, tuple, int]:
+    """Read what ``encode_field`` wrote at ``offset``.
+
+    Returns:
+        (bullets, beams, offset after them)
+    """
+    beams = []
+    for _ in range(2):
+        beams.append(BEAM.unpack_from(payload, offset))
+        offset += BEAM.size
+    (n,) = COUNT.unpack_from(payload, offset)
+    offset += COUNT.size
+    x = np.frombuffer(payload, BULLET_POSITION, n, offset)
+    offset += x.nbytes
+    y = np.frombuffer(payload, BULLET_POSITION, n, offset)
+    offset += y.nbytes
+    buckets = np.frombuffer(payload, BULLET_BUCKET, n, offset)
+    offset += buckets.nbytes
+    return (x, y, buckets), tuple(beams), offset
+
+
+def pack_message(kind: int, payload: bytes) -> bytes:
+    """Compress ``payload`` and prefix the message header."""
+    body = zlib.compress(payload, 1)
+    return MESSAGE_HEADER.pack(len(body), kind) + body
+
+
+class StateEncoder:
+    """Turns game frames into broadcast messages.
+
+    Entities get a 16-bit id the first time they are seen (held weakly, so
+    ids vanish with their entities).
+    """
+
+    def __init__(self, keyframe_interval: int = BROADCAST_KEYFRAME_INTERVAL):
+        self.keyframe_interval = keyframe_interval
+        self.frame = 0
+        self.sprite_table: list[tuple[str, int, int, int]] = []
+
+        self._ids: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self._next_id = 0
+        self._sprites: dict[int, int] = {}
+        self._keyframe: dict[int, bytes] = {}
+        self._keyframe_number = 0
+
+    def _entity_id(self, entity) -> int:
+        entity_id = self._ids.get(entity)
+        if entity_id is None:
+            entity_id = self._next_id
+            self._next_id = (self._next_id + 1) % 65536
+            self._ids[entity] = entity_id
+        return entity_id
+
+    def _sprite_index(self, sprite, layer: Layer) -> int | None:
+        index = self._sprites.get(id(sprite))
+        if index is None:
+            if sprite.name is None or len(self.sprite_table) >= 256:
+                return None
+            index = len(self.sprite_table)
+            self._sprites[id(sprite)] = index
+            self.sprite_table.append((sprite.name, *sprite.size, int(layer)))
+        return index
+
+    def sprites_message(self) -> bytes:
+        """The current sprite table."""
+        return pack_message(SPRITES, json.dumps(self.sprite_table).encode())
+
+    def encode(self, game) -> list[tuple[int, bytes]]:
+        """Encode the current frame of ``game``.
+
+        Returns:
+            (message type, message) pairs: a ``SPRITES`` update when new
+            sprites appeared, then the ``KEYFRAME`` or ``DELTA``
+        """
+        sprites_known = len(self.sprite_table)
+        records: dict[int, bytes] = {}
+        for layer, entity in game_entities(game):
+            sprite = self._sprite_index(entity.sprite, layer)
+            if sprite is None:
+                continue
+            entity_id = self._entity_id(entity)
+            records[entity_id] = ENTITY.pack(
+                entity_id,
+                sprite,
+                angle_bucket(getattr(entity, "angle", 0.0)),
+                entity.rect.x,
+                entity.rect.y,
+            )
+
+        messages = []
+        if len(self.sprite_table) != sprites_known:
+            messages.append((SPRITES, self.sprites_message()))
+
+        keyframe = self.frame % self.keyframe_interval == 0
+        if keyframe:
+            self._keyframe = records
+            self._keyframe_number = self.frame
+
+        levels = []
+        for player in (game.player1, game.player2):
+            state = player.state
+            levels += [
+                state.weapon_speed_level,
+                state.weapon_power_level,
+                state.weapon_number_level,
+            ]
+        header = FRAME_HEADER.pack(
+            self.frame,
+            self._keyframe_number,
+            game.shot_count,
+            game.count_missed,
+            int(game.elapsed_seconds),
+            game.players_hp,
+            game.boss.hp,
+            game.enemy_level,
+            *levels,
+        ) + encode_field(game)
+
+        if keyframe:
+            payload = header + COUNT.pack(len(records)) + b"".join(records.values())
+            messages.append((KEYFRAME, pack_message(KEYFRAME, payload)))
+        else:
+            base = self._keyframe
+            removed = [entity_id for entity_id in base if entity_id not in records]
+            changed = [
+                record
+                for entity_id, record in records.items()
+                if base.get(entity_id) != record
+            ]
+            payload = b"".join(
+                [
+                    header,
+                    COUNT.pack(len(removed)),
+                    b"".join(ID.pack(entity_id) for entity_id in removed),
+                    COUNT.pack(len(changed)),
+                    b"".join(changed),
+                ]
+            )
+            messages.append((DELTA, pack_message(DELTA, payload)))
+
+        self.frame += 1
+        return messages
+
+
+class StateDecoder:
+    """Rebuilds frames from broadcast messages on the viewer side."""
+
+    def __init__(self):
+        self.sprite_table: list[tuple[str, int, int, int]] = []
+        self._keyframe: dict[int, tuple[int, int, int, int]] = {}
+        self._keyframe_number: int | None = None
+
+    def feed(self, kind: int, body: bytes) -> FrameState | None:
+        """Decode one message body (after ``MESSAGE_HEADER``).
+
+        Returns:
+            The frame for ``KEYFRAME`` and ``DELTA`` messages (None for a
+            delta whose keyframe was never received), None otherwise
+        """
+        payload = zlib.decompress(body)
+        if kind == SPRITES:
+            self.sprite_table = [tuple(entry) for entry in json.loads(payload)]
+            return None
+
+        fields = FRAME_HEADER.unpack_from(payload)
+        frame, keyframe_number, hud = fields[0], fields[1], fields[2:]
+        bullets, beams, offset = decode_field(payload, FRAME_HEADER.size)
+
+        if kind == KEYFRAME:
+            (count,) = COUNT.unpack_from(payload, offset)
+            offset += COUNT.size
+            entities = {}
+            for _ in range(count):
+                entity_id, *record = ENTITY.unpack_from(payload, offset)
+                offset += ENTITY.size
+                entities[entity_id] = tuple(record)
+            self._keyframe = entities
+            self._keyframe_number = frame
+            return self._frame(frame, hud, entities, bullets, beams)
+
+        if kind != DELTA or keyframe_number != self._keyframe_number:
+            return None
+
+        entities = dict(self._keyframe)
+        (removed,) = COUNT.unpack_from(payload, offset)
+        offset += COUNT.size
+        for _ in range(removed):
+            (entity_id,) = ID.unpack_from(payload, offset)
+            offset += ID.size
+            entities.pop(entity_id, None)
+
+        (changed,) = COUNT.unpack_from(payload, offset)
+        offset += COUNT.size
+        for _ in range(changed):
+            entity_id, *record = ENTITY.unpack_from(payload, offset)
+            offset += ENTITY.size
+            entities[entity_id] = tuple(record)
+        return self._frame(frame, hud, entities, bullets, beams)
+
+    def _frame(
+        self, frame: int, hud: tuple, entities: dict, bullets: tuple, beams: tuple
+    ) -> FrameState:
+        """Order entities by their sprite's layer for drawing."""
+        table = self.sprite_table
+        ordered = sorted(
+            entities.values(),
+            key=lambda record: table[record[0]][3] if record[0] < len(table) else 0,
+        )
+        return FrameState(frame, hud, ordered, bullets, beams)
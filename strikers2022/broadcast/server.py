@@ -0,0 +1,207 @@
+"""Local spectator server."""
+
+import asyncio
+import threading
+import time
+
+from ..config import BROADCAST_HOST, BROADCAST_PORT, BROADCAST_MAX_BUFFER
+from .codec import KEYFRAME, SPRITES, StateEncoder
+
+
+class BroadcastServer:
+    """Fans encoded frames out to spectator connections.
+
+    The asyncio loop runs on a daemon thread. The game thread only hands
+    finished messages over with ``call_soon_threadsafe``; all socket work
+    happens on the loop, so a slow viewer never stalls a frame. A viewer
+    whose write buffer grows past ``max_buffer`` drops frames until the next
+    keyframe instead of queueing without bound.
+    """
+
+    def __init__(
+        self,
+        host: str = BROADCAST_HOST,
+        port: int = BROADCAST_PORT,
+        max_buffer: int = BROADCAST_MAX_BUFFER,
+    ):
+        self.host = host
+        self.port = port
+        self.max_buffer = max_buffer
+
+        # Counters, updated on the loop thread
+        self.viewers_total = 0
+        self.frames_sent = 0
+        self.frames_skipped = 0
+        self.bytes_sent = 0
+        self.write_seconds = 0.0
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.Server | None = None
+        self._thread: threading.Thread | None = None
+        self._writers: dict[asyncio.StreamWriter, bool] = {}  # writer -> waiting for keyframe
+        self._sprites = b""
+        self._keyframe = b""
+        self._delta = b""
+
+    @property
+    def viewers(self) -> int:
+        """Connected viewers."""
+        return len(self._writers)
+
+    def start(self) -> None:
+        """Start serving in the background."""
+        if self._thread:
+            return
+
+        ready = threading.Event()
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._run, args=(ready,), name="broadcast", daemon=True
+        )
+        self._thread.start()
+        ready.wait()
+
+    def _run(self, ready: threading.Event) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._server = self._loop.run_until_complete(
+                asyncio.start_server(self._accept, self.host, self.port)
+            )
+            self.port = self._server.sockets[0].getsockname()[1]
+        except OSError as e:
+            print(f"Warning: Broadcast server could not bind {self.host}:{self.port} ({e})")
+            self._server = None
+        ready.set()
+        if self._server:
+            self._loop.run_forever()
+        self._loop.close()
+
+    def stop(self) -> None:
+        """Close every viewer and stop serving."""
+        if not self._thread:
+            return
+        if self._server:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._thread = None
+        self._server = None
+
+    async def _shutdown(self) -> None:
+        self._server.close()
+        for writer in self._writers:
+            writer.close()
+        # Closing a connection ends its handler's read; wait for them
+        handlers = asyncio.all_tasks() - {asyncio.current_task()}
+        if handlers:
+            await asyncio.wait(handlers, timeout=1.0)
+
+    async def _accept(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Send the current state to a new viewer, then keep it subscribed."""
+        self.viewers_total += 1
+        writer.write(self._sprites + self._keyframe + self._delta)
+        self._writers[writer] = False
+        try:
+            # Viewers send nothing; EOF means they left
+            await reader.read()
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.pop(writer, None)
+            writer.close()
+
+    def publish(self, messages: list[tuple[int, bytes]]) -> None:
+        """Queue one frame's messages for every viewer (thread safe)."""
+        if self._server:
+            self._loop.call_soon_threadsafe(self._send, messages)
+
+    def _send(self, messages: list[tuple[int, bytes]]) -> None:
+        """Write a frame to every viewer (loop thread)."""
+        keyframe = False
+        for kind, message in messages:
+            if kind == SPRITES:
+                self._sprites = message
+            elif kind == KEYFRAME:
+                self._keyframe = message
+                self._delta = b""
+                keyframe = True
+            else:
+                self._delta = message
+        data = b"".join(message for _, message in messages)
+
+        # CPU time of this thread, so waiting for the GIL is not counted
+        started = time.thread_time()
+        for writer, waiting in list(self._writers.items()):
+            if writer.is_closing():
+                continue
+            if writer.transport.get_write_buffer_size() > self.max_buffer:
+                # Too far behind: drop frames until the buffer drains and a
+                # keyframe (which needs no earlier frames) comes along
+                self._writers[writer] = True
+                self.frames_skipped += 1
+                continue
+            if waiting and not keyframe:
+                self.frames_skipped += 1
+                continue
+            if waiting:
+                # Re-send the sprite table in case it changed meanwhile
+                writer.write(self._sprites)
+                self._writers[writer] = False
+            writer.write(data)
+            self.frames_sent += 1
+            self.bytes_sent += len(data)
+        self.write_seconds += time.thread_time() - started
+
+
+class Broadcaster:
+    """Encodes game frames and publishes them to spectators."""
+
+    def __init__(self, host: str = BROADCAST_HOST, port: int = BROADCAST_PORT):
+        self.encoder = StateEncoder()
+        self.server = BroadcastServer(host, port)
+
+        self.frames = 0
+        self.encode_seconds = 0.0
+        self.keyframe_bytes = 0
+        self.keyframes = 0
+        self.delta_bytes = 0
+        self.deltas = 0
+
+    def start(self) -> None:
+        """Start the spectator server."""
+        self.server.start()
+
+    def stop(self) -> None:
+        """Stop the spectator server."""
+        self.server.stop()
+
+    def publish(self, game) -> None:
+        """Encode the current frame of ``game`` and send it to viewers."""
+        started = time.perf_counter()
+        messages = self.encoder.encode(game)
+        self.encode_seconds += time.perf_counter() - started
+
+        self.frames += 1
+        for kind, message in messages:
+            if kind == KEYFRAME:
+                self.keyframes += 1
+                self.keyframe_bytes += len(message)
+            elif kind != SPRITES:
+                self.deltas += 1
+                self.delta_bytes += len(message)
+        self.server.publish(messages)
+
+    def summary(self) -> str:
+        """One-line encode and traffic report."""
+        frames = self.frames or 1
+        server = self.server
+        write_us = server.write_seconds / server.frames_sent * 1e6 if server.frames_sent else 0.0
+        return (
+            f"broadcast: {self.frames} frames, "
+            f"encode {self.encode_seconds / frames * 1000:.3f} ms/frame, "
+            f"keyframe {self.keyframe_bytes // (self.keyframes or 1)} B, "
+            f"delta {self.delta_bytes // (self.deltas or 1)} B, "
+            f"{server.viewers_total} viewers, "
+            f"write {write_us:.1f} us/viewer-frame, "
+            f"{server.frames_skipped} frames skipped"
+        )
@@ -0,0 +1,153 @@
+"""Spectator client that redraws broadcast frames."""
+
+import asyncio
+from datetime import timedelta
+import time
+
+import pygame
+
+from ..config import WINDOW_WIDTH, WINDOW_HEIGHT, BROADCAST_HOST, BROADCAST_PORT, BEAM_WIDTH
+from ..entities import SpriteData
+from ..patterns import BulletField
+from ..ui import HUD, Layer, RenderQueue, fonts
+from ..utils import load_image, rotation_cache
+from .codec import MESSAGE_HEADER, FrameState, StateDecoder
+
+
+class SpectatorView:
+    """Reads a broadcast stream and draws the newest frame.
+
+    Reading and drawing are decoupled: the reader decodes every message as
+    it arrives and keeps only the newest frame, the draw loop shows
+    whatever is newest at its own rate.
+    """
+
+    def __init__(self, screen: pygame.Surface):
+        self.screen = screen
+        self.decoder = StateDecoder()
+        self.frame: FrameState | None = None
+        self.frames_received = 0
+        self.bytes_received = 0
+        self.connected = False
+
+        self.background = load_image("background.png", (WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.hud = HUD(fonts.get_font(20))
+        self._sprites: list[SpriteData | None] = []
+        self._table_size = 0
+        self.render_queue = RenderQueue()
+
+        # Pattern bullet images (an empty field) and beams cut to length
+        self.bullet_images = BulletField(capacity=0)
+        self.beam_image = load_image("beam.png", (BEAM_WIDTH, WINDOW_HEIGHT))
+        self._beam_images: dict[int, pygame.Surface] = {}
+
+    async def read(self, host: str = BROADCAST_HOST, port: int = BROADCAST_PORT) -> None:
+        """Receive frames until the server closes the stream."""
+        reader, writer = await asyncio.open_connection(host, port)
+        self.connected = True
+        try:
+            while True:
+                header = await reader.readexactly(MESSAGE_HEADER.size)
+                length, kind = MESSAGE_HEADER.unpack(header)
+                body = await reader.readexactly(length)
+                self.bytes_received += MESSAGE_HEADER.size + length
+
+                frame = self.decoder.feed(kind, body)
+                if frame is not None:
+                    self.frame = frame
+                    self.frames_received += 1
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            self.connected = False
+            writer.close()
+
+    def _sprite(self, index: int) -> SpriteData | None:
+        """Load sprites for table entries the first time they are drawn."""
+        table = self.decoder.sprite_table
+        if len(table) != self._table_size:
+            self._sprites.extend([None] * (len(table) - len(self._sprites)))
+            self._table_size = len(table)
+        if index >= len(table):
+            return None
+        sprite = self._sprites[index]
+        if sprite is None:
+            name, width, height, _ = table[index]
+            try:
+                sprite = SpriteData.load(name, (width, height))
+            except (pygame.error, FileNotFoundError) as e:
+                print(f"Warning: Could not load sprite {name} ({e})")
+                return None
+            self._sprites[index] = sprite
+        return sprite
+
+    def draw(self) -> None:
+        """Draw the newest frame (or just the background before the first)."""
+        screen = self.screen
+        screen.blit(self.background, (0, 0))
+        frame = self.frame
+        if frame is None:
+            return
+
+        queue = self.render_queue
+        table = self.decoder.sprite_table
+        for index, angle, x, y in frame.entities:
+            sprite = self._sprite(index)
+            if sprite is None:
+                continue
+            image = sprite.image
+            if angle:
+                image = rotation_cache.rotate(image, angle * 360 / 256)
+            queue.add(Layer(table[index][3]), image, (x, y))
+        queue.extend(Layer.ENEMY_BULLETS, self.bullet_images.place(*frame.bullets))
+        for x, y, length in frame.beams:
+            if not length:
+                continue
+            length = min(length, WINDOW_HEIGHT)
+            image = self._beam_images.get(length)
+            if image is None:
+                image = self.beam_image.subsurface((0, WINDOW_HEIGHT - length, BEAM_WIDTH, length))
+                self._beam_images[length] = image
+            queue.add(Layer.PLAYER_BULLETS, image, (x - BEAM_WIDTH // 2, y - length))
+        queue.flush(screen)
+
+        kills, missed, seconds, players_hp, boss_hp, enemy_level = frame.hud[:6]
+        self.hud.draw(
+            screen,
+            kills,
+            missed,
+            timedelta(seconds=seconds),
+            players_hp,
+            boss_hp,
+            enemy_level,
+        )
+
+    async def run(
+        self,
+        host: str = BROADCAST_HOST,
+        port: int = BROADCAST_PORT,
+        fps: int = 60,
+        frames: int = 0,
+    ) -> None:
+        """Connect and draw until the stream or window closes.
+
+        Args:
+            fps: Draw rate (0: draw as fast as possible)
+            frames: Stop after receiving this many frames (0: no limit)
+        """
+        reader = asyncio.create_task(self.read(host, port))
+        interval = 1 / fps if fps else 0
+        try:
+            while not reader.done():
+                started = time.perf_counter()
+                for event in pygame.event.get():
+                    if event.type == pygame.QUIT:
+                        return
+                self.draw()
+                pygame.display.flip()
+                if frames and self.frames_received >= frames:
+                    return
+                await asyncio.sleep(max(0.0, interval - (time.perf_counter() - started)))
+        finally:
+            reader.cancel()
+            await asyncio.gather(reader, return_exceptions=True)
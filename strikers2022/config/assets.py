@@ -1,6 +1,9 @@
 """Asset path management."""
 
 import os
+import shutil
+import tempfile
+import zipfile
 from pathlib import Path
 
 
@@ -26,6 +29,21 @@ class AssetManager:
         self._image_path = self._project_dir / "images"
         self._sound_path = self._project_dir / "sounds"
         self._music_path = self._project_dir / "musics"
+        self._pattern_path = self._project_dir / "patterns"
+
+        # Run from a zipapp (``python -m strikers2022.pack``), the project
+        # directory is the archive: packed assets are extracted to a cache
+        # directory named after the archive the first time they are used
+        self._archive: zipfile.ZipFile | None = None
+        self._cache_dir: Path | None = None
+        if self._project_dir.is_file():
+            self._archive = zipfile.ZipFile(self._project_dir)
+            stat = self._project_dir.stat()
+            self._cache_dir = Path(tempfile.gettempdir()) / (
+                f"strikers2022-{stat.st_size:x}-{stat.st_mtime_ns:x}"
+            )
+            if not self._cache_dir.exists():
+                self._prune_caches()
 
         self._initialized = True
 
@@ -41,17 +59,56 @@ class AssetManager:
     def music_path(self) -> Path:
         return self._music_path
 
+    @property
+    def pattern_path(self) -> Path:
+        return self._pattern_path
+
+    def _prune_caches(self) -> None:
+        """Remove asset caches of other archive builds.
+
+        Called when this build's cache does not exist yet, so only one
+        cache is normally left behind. A game still running from another
+        build extracts what it needs again.
+        """
+        for cache in self._cache_dir.parent.glob("strikers2022-*-*"):
+            if cache != self._cache_dir and cache.is_dir():
+                shutil.rmtree(cache, ignore_errors=True)
+
+    def _resolve(self, folder: str, filename: str) -> str:
+        """Path of an asset on disk, extracting it from the archive if needed."""
+        if self._archive is None or os.path.isabs(filename):
+            return str(self._project_dir / folder / filename)
+
+        member = f"{folder}/{filename}"
+        target = self._cache_dir / member
+        if not target.exists():
+            try:
+                data = self._archive.read(member)
+            except KeyError:
+                # Not packed: the assets sit next to the archive
+                return str(self._project_dir.parent / member)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Another instance may extract the same file at the same time
+            partial = target.with_name(f"{target.name}.{os.getpid()}")
+            partial.write_bytes(data)
+            os.replace(partial, target)
+        return str(target)
+
     def get_image(self, filename: str) -> str:
         """Get full path to an image file."""
-        return str(self._image_path / filename)
+        return self._resolve("images", filename)
 
     def get_sound(self, filename: str) -> str:
         """Get full path to a sound file."""
-        return str(self._sound_path / filename)
+        return self._resolve("sounds", filename)
 
     def get_music(self, filename: str) -> str:
         """Get full path to a music file."""
-        return str(self._music_path / filename)
+        return self._resolve("musics", filename)
+
+    def get_pattern(self, filename: str) -> str:
+        """Get full path to a bullet pattern file."""
+        return self._resolve("patterns", filename)
 
 
 # Global instance
@@ -24,6 +24,7 @@ ATTACK_SPEED_MULTIPLIER = 3
 MAX_WEAPON_SPEED_LEVEL = 5
 MAX_WEAPON_POWER_LEVEL = 5
 MAX_WEAPON_NUMBER_LEVEL = 4
+MAX_MISSILE_LEVEL = 3  # Missiles per salvo at the top level
 
 # Enemy settings
 ENEMY_ATTACK_INTERVAL = 100
@@ -54,3 +55,170 @@ PLAYER_WEAPON_SIZE = (10, 40)
 PLAYER_WEAPON_SPEED = 15
 ENEMY_WEAPON_SIZE = (10, 40)
 ENEMY_WEAPON_SPEED = 5
+
+# Homing missiles (missile item upgrade)
+MISSILE_SIZE = (12, 28)
+MISSILE_SPEED = 8
+MISSILE_DAMAGE = 3
+MISSILE_COOLDOWN = 40  # Frames between salvos while attacking
+MISSILE_SALVO_SPREAD = 30  # Degrees between the launch headings of one salvo
+MISSILE_TURN = 6  # Degrees per frame a missile turns towards its target
+MISSILE_LIFETIME = 150  # Frames before a missile that hit nothing burns out
+MISSILE_LOCK_RADIUS = 450  # Farthest enemy a missile locks onto; beyond it, the boss
+SPATIAL_GRID_CELL = 100  # Cell size of the enemy grid for nearest-target queries
+
+# Piercing beam (beam item power-up)
+BEAM_WIDTH = 12
+BEAM_DURATION = 480  # Frames a beam item lasts; the beam replaces the gun while attacking
+BEAM_TICK = 6  # Frames between damage ticks
+BEAM_DAMAGE = 1  # HP per tick to every enemy reached and to the boss
+BEAM_PIERCE = 3  # Enemies the beam burns through; it stops inside the last
+BEAM_DRAW_STEP = 4  # Drawn beam lengths are rounded to this many pixels (bounds cached images)
+
+# Player shots destroy enemy bullets and boss pattern bullets they touch
+BULLET_CANCEL_ENABLED = True
+
+# Boss bullet patterns (see strikers2022.patterns)
+BOSS_PATTERN_FILE = "boss.json"  # Phase list in the patterns/ directory
+BULLET_FIELD_CAPACITY = 8192  # Pattern bullets alive at once; volleys beyond it are cut short
+PATTERN_BULLET_SIZE = (8, 24)
+PATTERN_BULLET_RADIUS = 4  # Hit radius around a pattern bullet's centre
+PATTERN_BULLET_ANGLES = 32  # Pre-rotated images of the pattern bullet
+
+# Frame statistics
+FRAME_STATS_WINDOW = 120  # Frames kept for rolling frame-time statistics
+
+# Quality governor
+QUALITY_GOVERNOR_ENABLED = True
+QUALITY_DEGRADE_RATIO = 1.0  # Step down when mean work time exceeds budget * ratio
+QUALITY_RECOVER_RATIO = 0.6  # Step up when mean work time stays below budget * ratio
+QUALITY_DEGRADE_FRAMES = 30  # Frames averaged before stepping down
+QUALITY_RECOVER_FRAMES = 180  # Frames of headroom required before stepping up
+
+# Quality levels, best first. The governor moves one level at a time.
+#   rotation_step: rotation bucket size in degrees for enemies and bullets
+#   bullet_mask_collision: pixel-exact bullet collision (False = rect only)
+#   max_explosions: explosion effects drawn per frame (None = unlimited)
+#   enemy_bullet_cap: live bullets per enemy group (None = unlimited)
+#   render_scale: upper bound for the internal render resolution
+QUALITY_LEVELS = [
+    {
+        "name": "high",
+        "rotation_step": 1,
+        "bullet_mask_collision": True,
+        "max_explosions": None,
+        "enemy_bullet_cap": None,
+        "render_scale": 1.0,
+    },
+    {
+        "name": "medium",
+        "rotation_step": 5,
+        "bullet_mask_collision": True,
+        "max_explosions": 4,
+        "enemy_bullet_cap": 60,
+        "render_scale": 1.0,
+    },
+    {
+        "name": "low",
+        "rotation_step": 15,
+        "bullet_mask_collision": False,
+        "max_explosions": 2,
+        "enemy_bullet_cap": 40,
+        "render_scale": 0.75,
+    },
+    {
+        "name": "minimum",
+        "rotation_step": 30,
+        "bullet_mask_collision": False,
+        "max_explosions": 1,
+        "enemy_bullet_cap": 20,
+        "render_scale": 0.5,
+    },
+]
+
+# Metrics exporter (Prometheus text format on localhost)
+METRICS_ENABLED = False
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = 9108
+METRICS_PUBLISH_INTERVAL = 15  # Frames between snapshot updates
+
+# Session telemetry (SQLite, written on a background thread)
+TELEMETRY_ENABLED = False
+TELEMETRY_PATH = "telemetry.db"
+TELEMETRY_FLUSH_SECONDS = 1.0  # Time between batched writes
+TELEMETRY_MAX_PENDING = 10000  # Rows buffered for a slow disk before new ones are dropped
+
+# Input bindings (rebindable). Keys are pygame key names, joystick inputs
+# are button numbers; joystick N in connection order drives player N + 1,
+# which also moves with its first stick and hat.
+KEY_BINDINGS = (
+    {"left": ["left"], "right": ["right"], "up": ["up"], "down": ["down"], "attack": ["[0]"]},
+    {"left": ["a"], "right": ["d"], "up": ["w"], "down": ["s"], "attack": ["space"]},
+)
+JOYSTICK_BINDINGS = ({"attack": [0, 1]}, {"attack": [0, 1]})
+SYSTEM_KEY_BINDINGS = {"pause": ["p"], "start": ["return"]}
+SYSTEM_BUTTON_BINDINGS = {"pause": [7], "start": [7]}  # 7 is Start on XInput pads
+JOYSTICK_DEADZONE = 0.5  # Stick deflection that counts as a direction
+INPUT_BINDINGS_FILE = "bindings.json"  # Saved rebinds; replaces the defaults above when present
+
+# Input latency instrumentation
+INPUT_LATENCY_WINDOW = 240  # Action changes (and polled frames) kept for latency statistics
+INPUT_LATENCY_LOG = False  # Print every action change's input-to-present latency
+
+# Internal render resolution
+RENDER_SCALE = 1.0  # Scene resolution relative to the window (e.g. 0.5, 0.75)
+RENDER_SCALER = "nearest"  # Final upscale filter: "nearest" or "smooth"
+
+# Menu
+MENU_EVENT_TIMEOUT_MS = 500  # Longest the idle menu blocks waiting for an event
+
+# Pause
+PAUSE_ON_FOCUS_LOST = True  # Pause when the window loses focus or is minimized
+PAUSED_FPS = 10  # Loop rate while paused (the paused frame is only redrawn on expose)
+
+# Result screen
+RESULT_SCREEN_MS = 1000  # How long the result is shown before returning to the menu
+
+# Frame pipelining
+PIPELINE_ENABLED = False  # Simulate the next frame on a worker thread while the current one renders
+
+# Netplay (rollback co-op over UDP)
+NETPLAY_PORT = 7000  # Player 1 listens here, player 2 on the next port
+NETPLAY_INPUT_DELAY = 2  # Frames local input is delayed to hide latency before rolling back
+NETPLAY_MAX_ROLLBACK = 8  # Furthest a peer may run ahead of confirmed remote input
+NETPLAY_CHECKSUM_INTERVAL = 60  # Frames between exchanged world checksums
+NETPLAY_TIMEOUT = 5.0  # Seconds without peer packets before giving up
+
+# Spectator broadcast
+BROADCAST_ENABLED = False  # Stream world state to spectator viewers
+BROADCAST_HOST = "127.0.0.1"
+BROADCAST_PORT = 9300
+BROADCAST_KEYFRAME_INTERVAL = 60  # Frames between full keyframes; other frames are deltas
+BROADCAST_MAX_BUFFER = 256 * 1024  # Bytes queued for a slow viewer before it skips to the next keyframe
+
+# Sampling profiler (toggled in game with F9)
+PROFILER_INTERVAL_MS = 5  # Time between stack samples
+PROFILER_ENTITY_BUCKET = 50  # Granularity of the entity count attached to samples
+PROFILER_OUTPUT_DIR = "profiles"  # Where .collapsed and .prof captures are written
+
+# Timeline tracer (toggled in game with F10)
+TRACE_BUFFER_EVENTS = 1 << 17  # Spans kept per capture; older ones are overwritten
+TRACE_OUTPUT_DIR = "traces"  # Where Trace Event Format .json captures are written
+
+# Bot players (headless runner --bot1/--bot2)
+BOT_DODGE_RADIUS = 90  # Pixels around the player in which bullets and enemies are dodged
+BOT_LOOKAHEAD_FRAMES = 30  # How far ahead bullet paths are extrapolated
+BOT_HOME_Y = WINDOW_HEIGHT - 150  # Height bots return to when nothing needs dodging
+
+# Soak runs (python -m strikers2022.soak)
+SOAK_HOURS = 1.0  # Game hours played by default (the loop runs uncapped)
+SOAK_SAMPLE_FRAMES = 3600  # Frames per sample (one game minute)
+SOAK_WARMUP_SAMPLES = 5  # Samples left out of the trend fits while caches fill
+SOAK_LIFETIME_GRACE_FRAMES = 2  # Frames an entity may stay entirely off screen
+SOAK_MAX_MEMORY_GROWTH_KB_PER_HOUR = 512  # Heap growth at constant load that fails a run
+SOAK_MAX_WORK_DRIFT_MS_PER_HOUR = 0.2  # Frame work growth at constant load that fails a run
+
+# Garbage collection
+GC_MANAGED = True  # Freeze startup objects and collect in frame slack instead of mid-frame
+GC_SLACK_MIN_MS = 2.0  # Budget left after a frame's work needed for a scheduled collection
+GC_FORCE_FACTOR = 10  # Collect without slack once this many young thresholds pile up
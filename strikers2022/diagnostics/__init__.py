@@ -0,0 +1,14 @@
+"""Runtime diagnostics module."""
+
+from .frame_stats import FrameStats
+from .metrics_exporter import MetricsExporter, MetricsSnapshot
+from .memory_report import (
+    entity_instance_bytes,
+    entity_memory_report,
+    format_memory_report,
+)
+from .input_latency import InputLatencyTracker
+from .sampling_profiler import SamplingProfiler
+from .tracer import Tracer
+from .soak import SoakMonitor, SoakSample, cache_sizes
+from .telemetry import TelemetryRecorder, TelemetrySink, session_summaries
@@ -0,0 +1,119 @@
+"""Rolling frame-time statistics."""
+
+from collections import deque
+
+from ..config import FPS, FRAME_STATS_WINDOW
+
+
+class FrameStats:
+    """Keeps a rolling window of per-frame timings.
+
+    Two numbers are recorded every frame: the work time (everything the loop
+    did before ``clock.tick``) and the full frame time including the sleep.
+    The work time is what has to fit inside the frame budget.
+
+    Garbage collector pauses are recorded per collection, split into
+    pauses inside frame work (hitches) and collections scheduled into the
+    slack after it.
+    """
+
+    def __init__(self, window: int = FRAME_STATS_WINDOW):
+        self.budget_ms = 1000.0 / FPS
+        self._work_ms: deque[float] = deque(maxlen=window)
+        self._frame_ms: deque[float] = deque(maxlen=window)
+        self.frame_count = 0
+
+        # (generation, pause ms, scheduled) over the window, totals since reset
+        self.gc_pauses: deque[tuple[int, float, bool]] = deque(maxlen=window)
+        self.gc_collections = [0, 0, 0]
+        self.gc_in_frame = 0
+        self.gc_max_in_frame_ms = 0.0
+        self.gc_max_scheduled_ms = 0.0
+
+    def reset(self) -> None:
+        """Forget all samples."""
+        self._work_ms.clear()
+        self._frame_ms.clear()
+        self.frame_count = 0
+        self.gc_pauses.clear()
+        self.gc_collections = [0, 0, 0]
+        self.gc_in_frame = 0
+        self.gc_max_in_frame_ms = 0.0
+        self.gc_max_scheduled_ms = 0.0
+
+    def record(self, work_ms: float, frame_ms: float) -> None:
+        """Record the timings of one finished frame."""
+        self._work_ms.append(work_ms)
+        self._frame_ms.append(frame_ms)
+        self.frame_count += 1
+
+    def record_gc(self, generation: int, pause_ms: float, scheduled: bool) -> None:
+        """Record one garbage collection.
+
+        Args:
+            generation: Oldest generation collected
+            pause_ms: Duration of the collection
+            scheduled: True if it ran in frame slack rather than mid-frame
+        """
+        self.gc_pauses.append((generation, pause_ms, scheduled))
+        self.gc_collections[generation] += 1
+        if scheduled:
+            self.gc_max_scheduled_ms = max(self.gc_max_scheduled_ms, pause_ms)
+        else:
+            self.gc_in_frame += 1
+            self.gc_max_in_frame_ms = max(self.gc_max_in_frame_ms, pause_ms)
+
+    def gc_pause_percentile(self, percent: float, scheduled: bool = False) -> float:
+        """Percentile of in-frame (or scheduled) GC pauses over the window."""
+        return percentile(
+            [ms for _, ms, in_slack in self.gc_pauses if in_slack == scheduled], percent
+        )
+
+    def gc_summary(self) -> str:
+        """One-line garbage collector summary."""
+        gen0, gen1, gen2 = self.gc_collections
+        total = gen0 + gen1 + gen2
+        return (
+            f"gc: {total} collections (gen0 {gen0}, gen1 {gen1}, gen2 {gen2})  "
+            f"in-frame {self.gc_in_frame}, max {self.gc_max_in_frame_ms:.2f} ms  "
+            f"scheduled {total - self.gc_in_frame}, max {self.gc_max_scheduled_ms:.2f} ms"
+        )
+
+    @property
+    def last_work_ms(self) -> float:
+        """Work time of the most recent frame."""
+        return self._work_ms[-1] if self._work_ms else 0.0
+
+    def mean_work_ms(self, frames: int | None = None) -> float:
+        """Mean work time over the last ``frames`` frames (default: window)."""
+        samples = list(self._work_ms)
+        if frames is not None:
+            samples = samples[-frames:]
+        if not samples:
+            return 0.0
+        return sum(samples) / len(samples)
+
+    def work_percentile(self, percent: float) -> float:
+        """Work time percentile over the window (nearest-rank)."""
+        return percentile(self._work_ms, percent)
+
+    def frame_percentile(self, percent: float) -> float:
+        """Frame time percentile over the window (nearest-rank)."""
+        return percentile(self._frame_ms, percent)
+
+    @property
+    def fps(self) -> float:
+        """Average frames per second over the window."""
+        total = sum(self._frame_ms)
+        if total <= 0:
+            return 0.0
+        return len(self._frame_ms) * 1000.0 / total
+
+
+def percentile(samples, percent: float) -> float:
+    """Nearest-rank percentile of a sample collection."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    return ordered[index]
@@ -0,0 +1,106 @@
+"""Input-to-present latency measurement."""
+
+from collections import deque
+
+from ..config import INPUT_LATENCY_WINDOW, INPUT_LATENCY_LOG
+from .frame_stats import percentile
+
+# Names of the input bits, lowest first (see ``InputManager.LEFT``)
+ACTION_NAMES = ("left", "right", "up", "down", "attack")
+
+
+class InputLatencyTracker:
+    """Timestamps action changes and measures when their effect is presented.
+
+    Each change of a player's actions is stamped when the loop samples the
+    devices. The game applies input, simulation, collisions and rendering
+    in the same frame, so the change first becomes visible at that frame's
+    present; the latency recorded is the time from sampling to the end of
+    that present. The time a key or stick was already down before the
+    sample is bounded by the frame limiter sleep, which happens right
+    before input is polled (pygame events carry no timestamps).
+
+    The cost of the input poll itself (event queue plus device sampling)
+    and the number of events it took off the queue are kept per frame.
+
+    With the pipelined loop a frame is presented one loop iteration after
+    it was simulated; ``lag`` is the number of presents to skip before a
+    change counts as visible.
+    """
+
+    def __init__(self, window: int = INPUT_LATENCY_WINDOW, log: bool = INPUT_LATENCY_LOG):
+        self.log = log
+        self.lag = 0
+        # (label, sample time, presents still to skip)
+        self._pending: list[tuple[str, float, int]] = []
+        # (label, sample time, present frame, latency ms)
+        self.records: deque[tuple[str, float, int, float]] = deque(maxlen=window)
+        # (poll ms, events handled) per polled frame
+        self.polls: deque[tuple[float, int]] = deque(maxlen=window)
+
+    def reset(self) -> None:
+        """Forget pending changes and history."""
+        self._pending.clear()
+        self.records.clear()
+        self.polls.clear()
+
+    def on_poll(self, poll_ms: float, events: int) -> None:
+        """Record the cost of one frame's input poll."""
+        self.polls.append((poll_ms, events))
+
+    def on_input(self, player: int, previous: int, bits: int, sampled_at: float) -> None:
+        """Stamp every action a player pressed or released at one sample.
+
+        Args:
+            player: Player index (0 or 1)
+            previous: Input bits before the sample
+            bits: Input bits sampled
+            sampled_at: Sample time from ``time.perf_counter``
+        """
+        changed = previous ^ bits
+        for index, name in enumerate(ACTION_NAMES):
+            bit = 1 << index
+            if changed & bit:
+                kind = "down" if bits & bit else "up"
+                self._pending.append((f"P{player + 1} {name} {kind}", sampled_at, self.lag))
+
+    def on_present(self, frame: int, presented_at: float) -> None:
+        """Resolve every pending change against a finished present."""
+        if not self._pending:
+            return
+        waiting = []
+        for label, sampled_at, skip in self._pending:
+            if skip:
+                waiting.append((label, sampled_at, skip - 1))
+                continue
+            latency_ms = (presented_at - sampled_at) * 1000
+            self.records.append((label, sampled_at, frame, latency_ms))
+            if self.log:
+                print(f"Input: {label} presented in frame {frame} after {latency_ms:.2f} ms")
+        self._pending = waiting
+
+    def percentile(self, percent: float) -> float:
+        """Latency percentile in ms over recorded changes (nearest-rank)."""
+        return percentile([record[3] for record in self.records], percent)
+
+    def poll_percentile(self, percent: float) -> float:
+        """Input poll cost percentile in ms over the polled frames."""
+        return percentile([poll[0] for poll in self.polls], percent)
+
+    def summary(self) -> str:
+        """Latency and poll cost summary."""
+        if self.polls:
+            events = sum(poll[1] for poll in self.polls) / len(self.polls)
+            poll = (
+                f"input poll  p50: {self.poll_percentile(50) * 1000:.1f} us  "
+                f"p99: {self.poll_percentile(99) * 1000:.1f} us  ({events:.2f} events/frame)"
+            )
+        else:
+            poll = "input poll: no frames"
+        if not self.records:
+            return f"{poll}\ninput latency: no action changes"
+        return (
+            f"{poll}\ninput latency ({len(self.records)} changes)  "
+            f"p50: {self.percentile(50):.2f} ms  p95: {self.percentile(95):.2f} ms  "
+            f"max: {max(record[3] for record in self.records):.2f} ms"
+        )
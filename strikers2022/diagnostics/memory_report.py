@@ -0,0 +1,128 @@
+"""Memory accounting for live entities."""
+
+import sys
+from collections import deque
+from collections.abc import Iterable
+from enum import Enum
+
+import pygame
+
+# CPython caches the ints in this range; every other int is its own object
+SMALL_INT_RANGE = range(-5, 257)
+
+
+def _slot_names(cls: type) -> list[str]:
+    """All slot names declared along the class hierarchy."""
+    names = []
+    for klass in cls.__mro__:
+        slots = klass.__dict__.get("__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names.extend(name for name in slots if name != "__weakref__")
+    return names
+
+
+def _value_bytes(value) -> int | None:
+    """Size of a plain per-instance value.
+
+    Returns 0 for shared or interpreter-cached values and ``None`` for
+    anything else (an object that may own further data). Containers are
+    counted shallowly: the container, not its items.
+    """
+    if value is None or isinstance(value, (bool, Enum, pygame.Surface, pygame.mask.Mask)):
+        return 0
+    if isinstance(value, int):
+        return 0 if value in SMALL_INT_RANGE else sys.getsizeof(value)
+    if isinstance(value, (pygame.Rect, float, tuple, set, list, dict, deque)):
+        return sys.getsizeof(value)
+    return None
+
+
+def _object_bytes(value) -> int:
+    """Size of a per-instance value, including a nested slotted object."""
+    size = sys.getsizeof(value)
+    if hasattr(value, "__dict__"):
+        size += sys.getsizeof(value.__dict__)
+    for name in _slot_names(type(value)):
+        size += _value_bytes(getattr(value, name, None)) or 0
+    return size
+
+
+def _surface_bytes(surface: pygame.Surface) -> int:
+    """Pixel memory held by a surface."""
+    return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+
+def _mask_bytes(mask: pygame.mask.Mask) -> int:
+    """Bit memory held by a mask."""
+    width, height = mask.get_size()
+    return (width * height + 7) // 8
+
+
+def entity_instance_bytes(entity) -> int:
+    """Bytes owned by a single entity.
+
+    Surfaces and masks are shared through ``SpriteData`` and the rotation
+    cache, so they are excluded here and reported separately as shared data.
+    Bools, enums, ``None`` and ints in ``SMALL_INT_RANGE`` are cached by
+    the interpreter and cost nothing extra; other ints, floats, rects and
+    containers are counted with ``sys.getsizeof``.
+    """
+    size = sys.getsizeof(entity)
+    if hasattr(entity, "__dict__"):
+        size += sys.getsizeof(entity.__dict__)
+
+    for name in _slot_names(type(entity)):
+        value = getattr(entity, name, None)
+        if name == "sprite":
+            continue
+        value_bytes = _value_bytes(value)
+        if value_bytes is not None:
+            size += value_bytes
+        elif hasattr(value, "__slots__") or hasattr(value, "__dict__"):
+            size += _object_bytes(value)
+    return size
+
+
+def entity_memory_report(entities: Iterable) -> dict:
+    """Summarize memory used by ``entities``.
+
+    Returns:
+        Dict with ``by_type`` ({type name: (count, instance bytes)}),
+        ``instance_bytes``, ``shared_bytes`` (unique surfaces and masks
+        referenced by the entities) and ``total_bytes``.
+    """
+    by_type: dict[str, list[int]] = {}
+    shared: dict[int, int] = {}
+
+    for entity in entities:
+        entry = by_type.setdefault(type(entity).__name__, [0, 0])
+        entry[0] += 1
+        entry[1] += entity_instance_bytes(entity)
+
+        for surface in (entity.image, getattr(entity.sprite, "image", None)):
+            if surface is not None and id(surface) not in shared:
+                shared[id(surface)] = _surface_bytes(surface)
+        if entity.mask is not None and id(entity.mask) not in shared:
+            shared[id(entity.mask)] = _mask_bytes(entity.mask)
+
+    instance_bytes = sum(total for _, total in by_type.values())
+    shared_bytes = sum(shared.values())
+    return {
+        "by_type": {name: tuple(entry) for name, entry in sorted(by_type.items())},
+        "instance_bytes": instance_bytes,
+        "shared_bytes": shared_bytes,
+        "total_bytes": instance_bytes + shared_bytes,
+    }
+
+
+def format_memory_report(report: dict) -> str:
+    """Render an ``entity_memory_report`` result as a text table."""
+    lines = [f"{'entity':<14}{'count':>8}{'bytes/entity':>14}{'total bytes':>14}"]
+    for name, (count, total) in report["by_type"].items():
+        per_entity = total // count if count else 0
+        lines.append(f"{name:<14}{count:>8}{per_entity:>14}{total:>14}")
+    lines.append(f"{'instance data':<36}{report['instance_bytes']:>14}")
+    lines.append(f"{'shared sprites':<36}{report['shared_bytes']:>14}")
+    lines.append(f"{'total live':<36}{report['total_bytes']:>14}")
+    return "\n".join(lines)
@@ -0,0 +1,102 @@
+"""Prometheus-style metrics endpoint for a running game."""
+
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import threading
+
+from ..config import METRICS_HOST, METRICS_PORT
+
+
+class MetricsSnapshot:
+    """Immutable set of values published by the game loop."""
+
+    __slots__ = ("gauges", "labeled")
+
+    def __init__(
+        self,
+        gauges: dict[str, float],
+        labeled: dict[str, dict[tuple[str, str], float]],
+    ):
+        # name -> value
+        self.gauges = gauges
+        # name -> {(label, label_value): value}
+        self.labeled = labeled
+
+    def render(self) -> str:
+        """Format the snapshot in the Prometheus text exposition format."""
+        lines = []
+        for name, value in self.gauges.items():
+            lines.append(f"# TYPE strikers_{name} {_metric_type(name)}")
+            lines.append(f"strikers_{name} {value:g}")
+        for name, series in self.labeled.items():
+            lines.append(f"# TYPE strikers_{name} {_metric_type(name)}")
+            for (label, label_value), value in series.items():
+                lines.append(f'strikers_{name}{{{label}="{label_value}"}} {value:g}')
+        return "\n".join(lines) + "\n"
+
+
+def _metric_type(name: str) -> str:
+    """Prometheus type for a metric name (``*_total`` are counters)."""
+    return "counter" if name.endswith("_total") else "gauge"
+
+
+class MetricsExporter:
+    """Serves the latest metrics snapshot over HTTP from a daemon thread.
+
+    The game loop only ever swaps a reference to a fully built
+    ``MetricsSnapshot``; the server thread reads whatever reference is
+    current. No lock is shared with the loop, so a slow scrape can never
+    stall a frame.
+    """
+
+    def __init__(self, host: str = METRICS_HOST, port: int = METRICS_PORT):
+        self.host = host
+        self.port = port
+        self._snapshot = MetricsSnapshot({}, {})
+        self._server: HTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start serving in the background."""
+        if self._server:
+            return
+
+        exporter = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = exporter._snapshot.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        try:
+            self._server = HTTPServer((self.host, self.port), Handler)
+        except OSError as e:
+            print(f"Warning: Metrics exporter could not bind {self.host}:{self.port} ({e})")
+            return
+
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(
+            target=self._server.serve_forever, name="metrics-exporter", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            self._thread = None
+
+    def publish(self, snapshot: MetricsSnapshot) -> None:
+        """Make ``snapshot`` the one served to scrapers."""
+        self._snapshot = snapshot
@@ -0,0 +1,257 @@
+"""Statistical profiler that can be switched on in a running game."""
+
+from collections import Counter
+import marshal
+import os
+import signal
+import sys
+import threading
+import time
+
+from ..config import PROFILER_INTERVAL_MS, PROFILER_OUTPUT_DIR, PROFILER_ENTITY_BUCKET
+
+# pstats key of the stage and entity-count pseudo frames ("~" marks
+# built-ins in pstats, which keeps them out of file/line listings)
+PSEUDO_FILE = "~"
+
+
+class SamplingProfiler:
+    """Samples the game loop's call stack at a fixed wall-clock interval.
+
+    Where ``signal.setitimer`` exists and the profiler is started on the
+    main thread, a ``SIGALRM`` timer interrupts the loop every
+    ``interval_ms`` and the handler records the interrupted stack. The
+    handler runs at the next bytecode boundary, so samples land where the
+    loop spends its time, frame limiter waits and blocking calls included.
+    Elsewhere (Windows) a background thread reads the stack with
+    ``sys._current_frames``; that thread only gets the GIL when the loop
+    releases it, so its samples pile up on GIL-releasing calls such as
+    ``display.flip``.
+
+    Nothing is hooked into the profiled code: the cost is the time spent
+    taking samples (reported as ``overhead``) and does not grow with the
+    number of calls the game makes.
+
+    A sample that arrives late (timer signals coalesce while the loop sits
+    in a C call such as the frame limiter's sleep) counts once per interval
+    that elapsed, so sample counts stay proportional to wall time.
+
+    Each sample is prefixed with two pseudo frames from ``annotate``: the
+    loop stage (``Game.stage``) and the live entity count rounded down to
+    ``entity_bucket``, so stacks split by stage and load in a flame graph.
+    """
+
+    def __init__(
+        self,
+        interval_ms: float = PROFILER_INTERVAL_MS,
+        output_dir: str = PROFILER_OUTPUT_DIR,
+        entity_bucket: int = PROFILER_ENTITY_BUCKET,
+    ):
+        self.interval = interval_ms / 1000
+        self.output_dir = output_dir
+        self.entity_bucket = entity_bucket
+
+        self.samples = 0
+        self.sample_seconds = 0.0
+        self.wall_seconds = 0.0
+        # (pseudo labels, stack of code objects from the outermost call)
+        self.stacks: Counter = Counter()
+
+        self._annotate = None
+        self._thread_prefixes: tuple[str, ...] = ()
+        self._main_ident: int | None = None
+        self._running = False
+        self._previous_handler = None
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._started = 0.0
+        self._last_sample = 0.0
+
+    @property
+    def running(self) -> bool:
+        """True while sampling."""
+        return self._running
+
+    @property
+    def overhead(self) -> float:
+        """Share of wall time spent taking samples."""
+        return self.sample_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+    def start(self, annotate=None, thread_prefixes: tuple[str, ...] = ()) -> None:
+        """Start sampling the calling thread.
+
+        Args:
+            annotate: Called on every sample; returns (stage, entity count)
+            thread_prefixes: Names of further threads to sample (by prefix),
+                e.g. the pipelined loop's simulation worker
+        """
+        if self._running:
+            return
+        self.samples = 0
+        self.sample_seconds = 0.0
+        self.stacks.clear()
+        self._annotate = annotate
+        self._thread_prefixes = thread_prefixes
+        self._main_ident = threading.get_ident()
+        self._running = True
+        self._started = self._last_sample = time.perf_counter()
+
+        if hasattr(signal, "setitimer") and threading.current_thread() is threading.main_thread():
+            self._previous_handler = signal.signal(signal.SIGALRM, self._on_signal)
+            signal.setitimer(signal.ITIMER_REAL, self.interval, self.interval)
+        else:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="profiler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling (the samples are kept until the next start)."""
+        if not self._running:
+            return
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+        else:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous_handler)
+            self._previous_handler = None
+        self._running = False
+        self.wall_seconds = time.perf_counter() - self._started
+
+    def _on_signal(self, signum, frame) -> None:
+        # Runs on the profiled thread, so all of it is overhead
+        started = time.perf_counter()
+        self._sample(frame)
+        self.sample_seconds += time.perf_counter() - started
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            # Thread CPU time: waiting for the GIL is not sampling cost
+            started = time.thread_time()
+            self._sample()
+            self.sample_seconds += time.thread_time() - started
+
+    def _threads(self) -> dict[int, str]:
+        """Idents of the threads to sample, with a label for each."""
+        threads = {self._main_ident: ""}
+        if self._thread_prefixes:
+            for thread in threading.enumerate():
+                if thread.name.startswith(self._thread_prefixes):
+                    threads[thread.ident] = thread.name
+        return threads
+
+    def _sample(self, main_frame=None) -> None:
+        """Record one sample (``main_frame``: the interrupted frame, if known)."""
+        now = time.perf_counter()
+        weight = max(1, round((now - self._last_sample) / self.interval))
+        self._last_sample = now
+
+        frames = sys._current_frames()
+        if main_frame is not None:
+            frames[self._main_ident] = main_frame
+        if self._annotate:
+            stage, entities = self._annotate()
+            low = entities // self.entity_bucket * self.entity_bucket
+            labels = (f"stage:{stage}", f"entities:{low}-{low + self.entity_bucket - 1}")
+        else:
+            labels = ()
+
+        for ident, name in self._threads().items():
+            frame = frames.get(ident)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            stack.reverse()
+            thread_labels = labels + (f"thread:{name}",) if name else labels
+            self.stacks[thread_labels, tuple(stack)] += weight
+        self.samples += weight
+
+    def collapsed(self) -> str:
+        """Samples in collapsed-stack format (``flamegraph.pl``, speedscope)."""
+        lines = []
+        for (labels, stack), count in self.stacks.most_common():
+            frames = list(labels) + [_label(code) for code in stack]
+            lines.append(f"{';'.join(frames)} {count}")
+        return "\n".join(lines) + "\n"
+
+    def pstats_dict(self) -> dict:
+        """Samples as a ``pstats``-loadable dict.
+
+        Call counts are sample counts and times are samples times the
+        interval: ``tottime`` is time a function was on top of the stack,
+        ``cumtime`` time it was anywhere on it.
+        """
+        interval = self.interval
+        stats: dict = {}
+
+        def entry(key):
+            if key not in stats:
+                stats[key] = [0, 0, 0.0, 0.0, {}]
+            return stats[key]
+
+        for (labels, stack), count in self.stacks.items():
+            keys = [(PSEUDO_FILE, 0, label) for label in labels]
+            keys += [(code.co_filename, code.co_firstlineno, code.co_name) for code in stack]
+            seen = set()
+            caller = None
+            for key in keys:
+                stat = entry(key)
+                if key not in seen:
+                    # Count recursive functions once per sample
+                    seen.add(key)
+                    stat[0] += count
+                    stat[1] += count
+                    stat[3] += count * interval
+                if caller is not None:
+                    edge = stat[4].get(caller, (0, 0, 0.0, 0.0))
+                    stat[4][caller] = (
+                        edge[0] + count,
+                        edge[1] + count,
+                        edge[2],
+                        edge[3] + count * interval,
+                    )
+                caller = key
+            stats[keys[-1]][2] += count * interval
+            # Own time on the innermost caller edge
+            callers = stats[keys[-1]][4]
+            if len(keys) > 1:
+                edge = callers[keys[-2]]
+                callers[keys[-2]] = (edge[0], edge[1], edge[2] + count * interval, edge[3])
+
+        return {key: (cc, nc, tt, ct, callers) for key, (cc, nc, tt, ct, callers) in stats.items()}
+
+    def write(self, basename: str | None = None) -> tuple[str, str]:
+        """Write ``<basename>.collapsed`` and ``<basename>.prof``.
+
+        Returns:
+            The two file paths
+        """
+        if basename is None:
+            basename = time.strftime("profile-%Y%m%d-%H%M%S")
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, basename)
+
+        collapsed_path = base + ".collapsed"
+        with open(collapsed_path, "w", encoding="utf-8") as f:
+            f.write(self.collapsed())
+        prof_path = base + ".prof"
+        with open(prof_path, "wb") as f:
+            marshal.dump(self.pstats_dict(), f)
+        return collapsed_path, prof_path
+
+    def summary(self) -> str:
+        """One-line report of the last capture."""
+        return (
+            f"profiler: {self.samples} samples in {self.wall_seconds:.1f} s "
+            f"(every {self.interval * 1000:g} ms), "
+            f"sampling overhead {self.overhead * 100:.2f}%"
+        )
+
+
+def _label(code) -> str:
+    """Flame graph label of a code object."""
+    return f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
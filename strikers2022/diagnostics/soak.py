@@ -0,0 +1,348 @@
+"""Long-run leak, lifetime and drift monitoring."""
+
+from dataclasses import dataclass
+import csv
+import time
+import tracemalloc
+
+from ..config import (
+    FPS,
+    WINDOW_WIDTH,
+    WINDOW_HEIGHT,
+    SOAK_SAMPLE_FRAMES,
+    SOAK_WARMUP_SAMPLES,
+    SOAK_LIFETIME_GRACE_FRAMES,
+    SOAK_MAX_MEMORY_GROWTH_KB_PER_HOUR,
+    SOAK_MAX_WORK_DRIFT_MS_PER_HOUR,
+)
+from ..entities import Boss, Enemy, EnemyWeapon, Item, Missile, Player, PlayerWeapon
+from ..utils import rotation_cache
+
+# Lingering entities described in the report (all of them are counted)
+MAX_LINGER_EXAMPLES = 10
+
+
+@dataclass(frozen=True)
+class SoakSample:
+    """Counters of one sampling interval."""
+
+    frame: int
+    wall_seconds: float
+    mean_work_ms: float
+    mean_entities: float
+    traced_bytes: int
+    groups: dict[str, int]
+    caches: dict[str, int]
+    lingering: int
+
+    @property
+    def hours(self) -> float:
+        """Game time at the sample (frames at ``FPS``)."""
+        return self.frame / (FPS * 3600)
+
+
+def cache_sizes() -> dict[str, int]:
+    """Entries of the class-level and module-level surface caches."""
+    from ..managers.audio_manager import _explosion_cache
+
+    sizes = {
+        f"{cls.__name__}._image_cache": len(cls._image_cache)
+        for cls in (Player, PlayerWeapon, Missile, Enemy, EnemyWeapon, Item, Boss)
+    }
+    sizes["rotation_cache"] = len(rotation_cache)
+    sizes["explosion_cache"] = len(_explosion_cache)
+    return sizes
+
+
+def _trend(xs: list[float], loads: list[float], ys: list[float]) -> tuple[float, float]:
+    """Slope of ``ys`` over ``xs`` with the effect of ``loads`` removed.
+
+    Least squares fit of ``y = a + b * x + c * load``. A heavier late game
+    raises frame time and memory without any leak, so the live entity
+    count is held constant. Falls back to a plain slope when the load does
+    not vary independently of time.
+
+    Returns:
+        The slope ``b`` and its standard error
+    """
+    n = len(xs)
+    mean_x = sum(xs) / n
+    mean_l = sum(loads) / n
+    mean_y = sum(ys) / n
+    dx = [x - mean_x for x in xs]
+    dl = [l - mean_l for l in loads]
+    dy = [y - mean_y for y in ys]
+    sxx = sum(x * x for x in dx)
+    sll = sum(l * l for l in dl)
+    sxl = sum(x * l for x, l in zip(dx, dl))
+    sxy = sum(x * y for x, y in zip(dx, dy))
+    sly = sum(l * y for l, y in zip(dl, dy))
+    if sxx == 0:
+        return 0.0, 0.0
+
+    determinant = sxx * sll - sxl * sxl
+    if sll == 0 or determinant <= 1e-9 * sxx * sll or n < 4:
+        slope = sxy / sxx
+        residuals = [y - slope * x for x, y in zip(dx, dy)]
+        variance = sum(r * r for r in residuals) / max(1, n - 2)
+        return slope, (variance / sxx) ** 0.5
+
+    slope = (sxy * sll - sly * sxl) / determinant
+    load_slope = (sly * sxx - sxy * sxl) / determinant
+    residuals = [y - slope * x - load_slope * l for x, l, y in zip(dx, dl, dy)]
+    variance = sum(r * r for r in residuals) / (n - 3)
+    return slope, (variance * sll / determinant) ** 0.5
+
+
+class SoakMonitor:
+    """Watches a long headless run for leaks, stuck entities and slowdown.
+
+    ``on_frame`` runs after every ``Game.step``, outside the timed frame
+    work. It flags every entity whose drawn image has been entirely off
+    screen for more than ``SOAK_LIFETIME_GRACE_FRAMES``, i.e. that outlived
+    its visible lifetime, and every ``SOAK_SAMPLE_FRAMES`` it samples live
+    counts per sprite group, surface cache sizes, the ``tracemalloc`` heap
+    and the mean frame work.
+
+    ``failures`` fits memory and frame work against game time, holding the
+    live entity count constant, over the samples after the warmup, and
+    fails the run when either trends upward faster than the configured
+    limit per hour, or when any entity lingered.
+
+    ``tracemalloc`` has to trace the whole run for the heap size to mean
+    anything, and tracing slows every allocation, more so as the heap
+    grows. Frame work sampled alongside it is therefore timed under
+    tracing and reported as such; with ``trace_heap=False`` the heap is
+    not sampled and frame work is timed without that overhead.
+    """
+
+    def __init__(
+        self,
+        game,
+        sample_frames: int = SOAK_SAMPLE_FRAMES,
+        grace_frames: int = SOAK_LIFETIME_GRACE_FRAMES,
+        trace_heap: bool = True,
+    ):
+        self.game = game
+        self.sample_frames = sample_frames
+        self.grace_frames = grace_frames
+        self.trace_heap = trace_heap
+        self.samples: list[SoakSample] = []
+
+        self.frame = 0
+        self.lingering = 0
+        self.lingering_by_group: dict[str, int] = {}
+        # (frame, group, class, rect) of the first lingering entities
+        self.linger_examples: list[tuple[int, str, str, tuple]] = []
+        # Entities off screen on the last frame -> first frame seen off screen
+        self._offscreen: dict = {}
+
+        self._started = 0.0
+        self._work_total = 0.0
+        self._entity_total = 0
+        self._interval_frames = 0
+        self._started_tracing = False
+        # Heap sampled, and frame work timed under tracing
+        self.traced = False
+
+    def start(self) -> None:
+        """Start heap tracing (if wanted and not already on) and the clock."""
+        if self.trace_heap and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self.traced = self.trace_heap and tracemalloc.is_tracing()
+        self._started = time.perf_counter()
+
+    def stop(self) -> None:
+        """Stop heap tracing if ``start`` turned it on."""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def on_frame(self) -> None:
+        """Check entity lifetimes after a finished frame and sample if due."""
+        game = self.game
+        if game.paused or game.result:
+            return
+        self.frame += 1
+        frame = self.frame
+
+        previous = self._offscreen
+        offscreen = {}
+        entities = 0
+        for name, group in game.sprite_groups.items():
+            entities += len(group)
+            for entity in group:
+                rect = entity.rect
+                width, height = entity.image.get_size()
+                if (
+                    rect.x < WINDOW_WIDTH
+                    and rect.x + width > 0
+                    and rect.y < WINDOW_HEIGHT
+                    and rect.y + height > 0
+                ):
+                    continue
+                since = offscreen[entity] = previous.get(entity, frame)
+                if frame - since == self.grace_frames + 1:
+                    self._linger(name, entity)
+        self._offscreen = offscreen
+
+        self._work_total += game.frame_stats.last_work_ms
+        self._entity_total += entities
+        self._interval_frames += 1
+        if self._interval_frames >= self.sample_frames:
+            self._sample()
+
+    def _linger(self, group: str, entity) -> None:
+        """Record an entity that stayed off screen past the grace period."""
+        self.lingering += 1
+        self.lingering_by_group[group] = self.lingering_by_group.get(group, 0) + 1
+        if len(self.linger_examples) < MAX_LINGER_EXAMPLES:
+            self.linger_examples.append(
+                (self.frame, group, type(entity).__name__, tuple(entity.rect))
+            )
+
+    def _sample(self) -> None:
+        """Close the current interval."""
+        frames = self._interval_frames
+        self.samples.append(
+            SoakSample(
+                frame=self.frame,
+                wall_seconds=time.perf_counter() - self._started,
+                mean_work_ms=self._work_total / frames,
+                mean_entities=self._entity_total / frames,
+                traced_bytes=tracemalloc.get_traced_memory()[0] if self.traced else 0,
+                groups={name: len(group) for name, group in self.game.sprite_groups.items()},
+                caches=cache_sizes(),
+                lingering=self.lingering,
+            )
+        )
+        self._work_total = 0.0
+        self._entity_total = 0
+        self._interval_frames = 0
+
+    def trends(self) -> tuple[tuple[float, float] | None, tuple[float, float]] | None:
+        """Memory (KiB/hour) and frame work (ms/hour) trends after the warmup.
+
+        Returns:
+            (slope, standard error) of each (memory None when the heap is
+            not traced), or None until at least three samples follow the
+            warmup
+        """
+        samples = self.samples[SOAK_WARMUP_SAMPLES:]
+        if len(samples) < 3:
+            return None
+        hours = [sample.hours for sample in samples]
+        loads = [sample.mean_entities for sample in samples]
+        memory = None
+        if self.traced:
+            memory = _trend(hours, loads, [sample.traced_bytes / 1024 for sample in samples])
+        work = _trend(hours, loads, [sample.mean_work_ms for sample in samples])
+        return memory, work
+
+    def failures(self) -> list[str]:
+        """Reasons the run failed (empty: passed).
+
+        A trend fails the run when it exceeds its limit and is more than
+        two standard errors above zero, so noise in a short run is not
+        taken for growth.
+        """
+        failures = []
+        if self.lingering:
+            groups = ", ".join(f"{name} {count}" for name, count in self.lingering_by_group.items())
+            failures.append(f"{self.lingering} entities outlived their visible lifetime ({groups})")
+        trends = self.trends()
+        if trends:
+            memory_trend, (work, work_error) = trends
+            if memory_trend:
+                memory, memory_error = memory_trend
+                if memory > SOAK_MAX_MEMORY_GROWTH_KB_PER_HOUR and memory > 2 * memory_error:
+                    failures.append(
+                        f"memory grows {memory:.0f} KiB/hour "
+                        f"(limit {SOAK_MAX_MEMORY_GROWTH_KB_PER_HOUR} KiB/hour)"
+                    )
+            if work > SOAK_MAX_WORK_DRIFT_MS_PER_HOUR and work > 2 * work_error:
+                failures.append(
+                    f"frame work drifts {work:+.3f} ms/hour{self._work_timing()} "
+                    f"(limit {SOAK_MAX_WORK_DRIFT_MS_PER_HOUR} ms/hour)"
+                )
+        return failures
+
+    def _work_timing(self) -> str:
+        """Note on how frame work was timed."""
+        return " under tracemalloc" if self.traced else ""
+
+    def format_sample(self, sample: SoakSample) -> str:
+        """One progress line."""
+        minutes, seconds = divmod(int(sample.hours * 3600), 60)
+        hours, minutes = divmod(minutes, 60)
+        heap = f"heap {sample.traced_bytes / 1048576:.2f} MiB  " if self.traced else ""
+        return (
+            f"[{hours:02d}:{minutes:02d}:{seconds:02d}] frame {sample.frame}  "
+            f"entities {sample.mean_entities:.0f}  {heap}"
+            f"work {sample.mean_work_ms:.2f} ms  lingering {sample.lingering}"
+        )
+
+    def report(self) -> str:
+        """Multi-line summary of the run."""
+        lines = [f"soak: {self.frame} frames ({self.frame / (FPS * 3600):.2f} game hours)"]
+        if self.samples:
+            first, last = self.samples[0], self.samples[-1]
+            heap = "heap not traced  "
+            if self.traced:
+                heap = f"heap {first.traced_bytes / 1048576:.2f} -> {last.traced_bytes / 1048576:.2f} MiB  "
+            lines.append(
+                f"{heap}work {first.mean_work_ms:.2f} -> {last.mean_work_ms:.2f} ms{self._work_timing()}"
+            )
+            grown = [
+                f"{name} {first.caches[name]} -> {count}"
+                for name, count in last.caches.items()
+                if count != first.caches.get(name)
+            ]
+            lines.append("caches: " + (", ".join(grown) if grown else "unchanged"))
+        trends = self.trends()
+        if trends:
+            memory_trend, (work, work_error) = trends
+            memory = "memory not traced"
+            if memory_trend:
+                memory = f"memory {memory_trend[0]:+.0f} +/- {memory_trend[1]:.0f} KiB/hour"
+            lines.append(
+                f"trend at constant load: {memory}, "
+                f"frame work {work:+.3f} +/- {work_error:.3f} ms/hour{self._work_timing()}"
+            )
+            if self.traced:
+                lines.append("  (tracing slows frame work; time it with --no-heap)")
+        else:
+            lines.append(f"trend: needs {SOAK_WARMUP_SAMPLES + 3} samples")
+        for frame, group, cls, rect in self.linger_examples:
+            lines.append(f"  lingering {cls} in {group} at frame {frame}: rect {rect}")
+        failures = self.failures()
+        lines.append("result: " + ("FAIL - " + "; ".join(failures) if failures else "pass"))
+        return "\n".join(lines)
+
+    def write_csv(self, path: str) -> None:
+        """Write one row per sample."""
+        if not self.samples:
+            return
+        groups = list(self.samples[0].groups)
+        caches = list(self.samples[-1].caches)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["frame", "wall_seconds", "mean_work_ms", "mean_entities", "traced_bytes", "lingering"]
+                + groups
+                + caches
+            )
+            for sample in self.samples:
+                writer.writerow(
+                    [
+                        sample.frame,
+                        round(sample.wall_seconds, 3),
+                        round(sample.mean_work_ms, 4),
+                        round(sample.mean_entities, 1),
+                        sample.traced_bytes,
+                        sample.lingering,
+                    ]
+                    + [sample.groups.get(name, 0) for name in groups]
+                    + [sample.caches.get(name, 0) for name in caches]
+                )
@@ -0,0 +1,343 @@
+"""Play session telemetry stored in SQLite."""
+
+from collections import deque
+from pathlib import Path
+import sqlite3
+import threading
+import time
+import uuid
+
+from ..config import (
+    FPS,
+    ITEM_SPAWN_THRESHOLDS,
+    TELEMETRY_PATH,
+    TELEMETRY_FLUSH_SECONDS,
+    TELEMETRY_MAX_PENDING,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id TEXT PRIMARY KEY,
+    started_at REAL NOT NULL,
+    seed INTEGER,
+    ended_at REAL,
+    result TEXT,
+    frames INTEGER,
+    kills INTEGER,
+    missed INTEGER
+);
+CREATE TABLE IF NOT EXISTS seconds (
+    session TEXT NOT NULL,
+    second INTEGER NOT NULL,
+    kills INTEGER,
+    missed INTEGER,
+    players_hp INTEGER,
+    boss_hp INTEGER,
+    p1_power INTEGER, p1_speed INTEGER, p1_number INTEGER,
+    p2_power INTEGER, p2_speed INTEGER, p2_number INTEGER,
+    frames INTEGER,
+    work_mean_ms REAL,
+    work_max_ms REAL,
+    frame_max_ms REAL
+);
+CREATE TABLE IF NOT EXISTS events (
+    session TEXT NOT NULL,
+    second REAL NOT NULL,
+    kind TEXT NOT NULL,
+    value INTEGER
+);
+CREATE INDEX IF NOT EXISTS seconds_session ON seconds (session, second);
+CREATE INDEX IF NOT EXISTS events_session ON events (session);
+"""
+
+# Row kind -> statement; every batch runs one executemany per kind
+STATEMENTS = {
+    "session": "INSERT OR REPLACE INTO sessions (id, started_at, seed) VALUES (?, ?, ?)",
+    "end": (
+        "UPDATE sessions SET ended_at = ?, result = ?, frames = ?, kills = ?, missed = ? "
+        "WHERE id = ?"
+    ),
+    "second": "INSERT INTO seconds VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+    "event": "INSERT INTO events VALUES (?, ?, ?, ?)",
+}
+
+# Kinds written even when the buffer is full (one row per session)
+ESSENTIAL = frozenset(("session", "end"))
+
+
+class TelemetrySink:
+    """Buffers rows in memory and writes them to SQLite on a daemon thread.
+
+    ``put`` only appends to a deque, so the game loop never waits for the
+    disk. The writer wakes every ``flush_seconds``, takes everything
+    buffered and commits it in one transaction, one ``executemany`` of a
+    fixed statement per row kind. The database runs in WAL mode with
+    ``synchronous=NORMAL``, so a commit is a sequential log append and
+    readers (``session_summaries``) do not block the writer.
+
+    At most ``max_pending`` rows wait in memory. When the disk falls that
+    far behind, new rows are dropped and counted in ``dropped``; session
+    start and end rows are always kept.
+    """
+
+    def __init__(
+        self,
+        path: str = TELEMETRY_PATH,
+        flush_seconds: float = TELEMETRY_FLUSH_SECONDS,
+        max_pending: int = TELEMETRY_MAX_PENDING,
+    ):
+        self.path = path
+        self.flush_seconds = flush_seconds
+        self.max_pending = max_pending
+
+        self._pending: deque[tuple[str, tuple]] = deque()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.write_seconds = 0.0
+        self.max_batch_seconds = 0.0
+
+    def start(self) -> None:
+        """Open the database and start the writer thread."""
+        if self._thread:
+            return
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript(SCHEMA)
+        connection.close()
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Write everything still buffered and stop the writer."""
+        if not self._thread:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join()
+        self._thread = None
+
+    def put(self, kind: str, row: tuple) -> None:
+        """Queue one row (see ``STATEMENTS`` for the kinds); never blocks."""
+        if len(self._pending) >= self.max_pending and kind not in ESSENTIAL:
+            self.dropped += 1
+            return
+        self._pending.append((kind, row))
+
+    def _run(self) -> None:
+        # The connection belongs to this thread
+        connection = sqlite3.connect(self.path)
+        connection.execute("PRAGMA synchronous=NORMAL")
+        try:
+            while not self._stop.is_set():
+                self._wake.wait(self.flush_seconds)
+                self._wake.clear()
+                self._flush(connection)
+            self._flush(connection)
+        finally:
+            connection.close()
+
+    def _flush(self, connection: sqlite3.Connection) -> None:
+        """Commit every buffered row in one transaction."""
+        pending = self._pending
+        if not pending:
+            return
+        batch: dict[str, list[tuple]] = {kind: [] for kind in STATEMENTS}
+        count = len(pending)
+        for _ in range(count):
+            kind, row = pending.popleft()
+            batch[kind].append(row)
+
+        started = time.perf_counter()
+        try:
+            with connection:
+                # Sessions first so updates and child rows find them
+                for kind, statement in STATEMENTS.items():
+                    if batch[kind]:
+                        connection.executemany(statement, batch[kind])
+        except sqlite3.Error as e:
+            print(f"Warning: Could not write telemetry: {e}")
+            self.dropped += count
+            return
+        elapsed = time.perf_counter() - started
+        self.written += count
+        self.batches += 1
+        self.write_seconds += elapsed
+        self.max_batch_seconds = max(self.max_batch_seconds, elapsed)
+
+    def summary(self) -> str:
+        """One-line writer report."""
+        return (
+            f"telemetry: {self.written} rows in {self.batches} batches "
+            f"({self.write_seconds * 1000:.1f} ms writing, "
+            f"max batch {self.max_batch_seconds * 1000:.1f} ms), {self.dropped} dropped"
+        )
+
+
+class TelemetryRecorder:
+    """Turns a running game into telemetry rows.
+
+    ``on_frame`` is called at the end of every gameplay frame. Frame work
+    and frame times are folded into per-second summaries (seconds of game
+    time, ``FPS`` frames each), written together with the counters, HP
+    and weapon levels at the end of the second. Boss HP stages
+    (``ITEM_SPAWN_THRESHOLDS``) are written as events when crossed.
+    """
+
+    def __init__(self, sink: TelemetrySink):
+        self.sink = sink
+        self.session: str | None = None
+        self._frames = 0
+        self._second_frames = 0
+        self._work_total = 0.0
+        self._work_max = 0.0
+        self._frame_max = 0.0
+        self._boss_hp = 0
+
+    def begin(self, game) -> None:
+        """Open a session for a game that just started."""
+        self.session = uuid.uuid4().hex
+        self._frames = 0
+        self._reset_second()
+        self._boss_hp = game.boss.hp
+        self.sink.put("session", (self.session, time.time(), game.seed))
+
+    def _reset_second(self) -> None:
+        self._second_frames = 0
+        self._work_total = 0.0
+        self._work_max = 0.0
+        self._frame_max = 0.0
+
+    def on_frame(self, game, work_ms: float, frame_ms: float) -> None:
+        """Account one finished gameplay frame."""
+        if self.session is None:
+            return
+        self._frames += 1
+        self._second_frames += 1
+        self._work_total += work_ms
+        if work_ms > self._work_max:
+            self._work_max = work_ms
+        if frame_ms > self._frame_max:
+            self._frame_max = frame_ms
+
+        boss_hp = game.boss.hp
+        if boss_hp != self._boss_hp:
+            for threshold in ITEM_SPAWN_THRESHOLDS:
+                if boss_hp <= threshold < self._boss_hp:
+                    self.sink.put(
+                        "event", (self.session, self._frames / FPS, "boss_threshold", threshold)
+                    )
+            self._boss_hp = boss_hp
+
+        if self._second_frames >= FPS:
+            self._write_second(game)
+
+    def _write_second(self, game) -> None:
+        """Queue the summary of the second that just ended."""
+        state1, state2 = game.player1.state, game.player2.state
+        self.sink.put(
+            "second",
+            (
+                self.session,
+                self._frames // FPS,
+                game.shot_count,
+                game.count_missed,
+                game.players_hp,
+                game.boss.hp,
+                state1.weapon_power_level,
+                state1.weapon_speed_level,
+                state1.weapon_number_level,
+                state2.weapon_power_level,
+                state2.weapon_speed_level,
+                state2.weapon_number_level,
+                self._second_frames,
+                self._work_total / self._second_frames,
+                self._work_max,
+                self._frame_max,
+            ),
+        )
+        self._reset_second()
+
+    def end(self, game, result: str | None) -> None:
+        """Close the session ("gameover", "gameclear" or None if abandoned)."""
+        if self.session is None:
+            return
+        if self._second_frames:
+            self._write_second(game)
+        self.sink.put(
+            "end",
+            (time.time(), result, self._frames, game.shot_count, game.count_missed, self.session),
+        )
+        self.session = None
+
+
+def session_summaries(path: str = TELEMETRY_PATH, limit: int = 20) -> list[dict]:
+    """Most recent sessions with their per-second aggregates, newest first.
+
+    The file is opened read-only, so a wrong path is not created.
+
+    Raises:
+        FileNotFoundError: ``path`` does not exist or has no sessions table
+        sqlite3.DatabaseError: Any other failure (locked, corrupt, I/O)
+    """
+    try:
+        connection = sqlite3.connect(f"{Path(path).resolve().as_uri()}?mode=ro", uri=True)
+    except sqlite3.OperationalError:
+        if Path(path).exists():
+            raise
+        raise FileNotFoundError(f"no telemetry at {path}") from None
+    connection.row_factory = sqlite3.Row
+    try:
+        rows = connection.execute(
+            """
+            SELECT s.id, s.started_at, s.seed, s.result, s.frames, s.kills, s.missed,
+                   s.ended_at - s.started_at AS wall_seconds,
+                   MIN(t.players_hp) AS min_players_hp,
+                   MIN(t.boss_hp) AS min_boss_hp,
+                   MAX(t.p1_power + t.p1_speed + t.p1_number) AS p1_levels,
+                   MAX(t.p2_power + t.p2_speed + t.p2_number) AS p2_levels,
+                   SUM(t.work_mean_ms * t.frames) / SUM(t.frames) AS work_mean_ms,
+                   MAX(t.work_max_ms) AS work_max_ms,
+                   MAX(t.frame_max_ms) AS frame_max_ms,
+                   (SELECT COUNT(*) FROM events e
+                    WHERE e.session = s.id AND e.kind = 'boss_threshold') AS boss_thresholds
+            FROM sessions s LEFT JOIN seconds t ON t.session = s.id
+            GROUP BY s.id
+            ORDER BY s.started_at DESC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+    except sqlite3.OperationalError as e:
+        if not str(e).startswith("no such table"):
+            raise
+        raise FileNotFoundError(f"no telemetry at {path}") from None
+    finally:
+        connection.close()
+    return [dict(row) for row in rows]
+
+
+def format_summaries(summaries: list[dict]) -> str:
+    """Table of ``session_summaries`` output."""
+    lines = [
+        f"{'started':19} {'result':9} {'sec':>5} {'kills':>5} {'miss':>4} "
+        f"{'min hp':>6} {'boss':>5} {'stages':>6} {'work':>6} {'max':>6}"
+    ]
+    for row in summaries:
+        started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(row["started_at"]))
+        lines.append(
+            f"{started:19} {row['result'] or '-':9} {(row['frames'] or 0) // FPS:>5} "
+            f"{row['kills'] or 0:>5} {row['missed'] or 0:>4} "
+            f"{row['min_players_hp'] if row['min_players_hp'] is not None else '-':>6} "
+            f"{row['min_boss_hp'] if row['min_boss_hp'] is not None else '-':>5} "
+            f"{row['boss_thresholds']:>6} "
+            f"{row['work_mean_ms'] or 0:>6.2f} {row['work_max_ms'] or 0:>6.2f}"
+        )
+    return "\n".join(lines)
+
@@ -1,8 +1,9 @@
 """Game entities module."""
 
-from .base import GameEntity
+from .base import GameEntity, EntityGroup
+from .sprite_data import SpriteData
 from .player import Player, PlayerState
-from .weapon import PlayerWeapon, EnemyWeapon
+from .weapon import PlayerWeapon, EnemyWeapon, Missile
 from .enemy import Enemy
 from .boss import Boss
 from .item import Item, ItemType, create_item
@@ -2,37 +2,152 @@
 
 from abc import ABC, abstractmethod
 import pygame
+from .sprite_data import SpriteData
 
 
-class GameEntity(ABC, pygame.sprite.Sprite):
-    """Abstract base class for all game entities."""
+class GameEntity(ABC):
+    """Abstract base class for all game entities.
 
-    def __init__(self):
-        super().__init__()
-        self.image: pygame.Surface = None
-        self.rect: pygame.Rect = None
-        self.mask: pygame.mask.Mask = None
+    Entities are slotted and implement pygame's sprite protocol themselves
+    (``add_internal``/``remove_internal``/``kill``/``alive``) instead of
+    inheriting ``pygame.sprite.Sprite``, which would bring back a per-instance
+    ``__dict__``. Immutable image data lives in a shared ``SpriteData``.
+    """
+
+    __slots__ = ("sprite", "image", "rect", "mask", "_groups", "__weakref__")
+
+    # Per-class list of state slots, filled on first use by ``state_slots``
+    _state_slots: dict[type, tuple[str, ...]] = {}
+
+    def __init__(self, sprite: SpriteData | None = None):
+        self._groups: set = set()
+        self.sprite = sprite
+        self.image: pygame.Surface = sprite.image if sprite else None
+        self.mask: pygame.mask.Mask = sprite.mask if sprite else None
+        self.rect: pygame.Rect = self.image.get_rect() if sprite else None
 
     @abstractmethod
     def update(self, *args, **kwargs) -> None:
         """Update entity state."""
         pass
 
+    @property
+    def sx(self) -> int:
+        """Sprite width."""
+        return self.sprite.size[0]
+
+    @property
+    def sy(self) -> int:
+        """Sprite height."""
+        return self.sprite.size[1]
+
+    @property
+    def orig_image(self) -> pygame.Surface:
+        """Unrotated shared image."""
+        return self.sprite.image
+
+    # pygame sprite protocol
+
+    def add_internal(self, group: pygame.sprite.AbstractGroup) -> None:
+        self._groups.add(group)
+
+    def remove_internal(self, group: pygame.sprite.AbstractGroup) -> None:
+        self._groups.remove(group)
+
+    def groups(self) -> list:
+        """Groups this entity belongs to."""
+        return list(self._groups)
+
+    def alive(self) -> bool:
+        """True while the entity belongs to any group."""
+        return bool(self._groups)
+
+    def kill(self) -> None:
+        """Remove the entity from all groups."""
+        for group in self._groups:
+            group.remove_internal(self)
+        self._groups.clear()
+
+    @classmethod
+    def state_slots(cls) -> tuple[str, ...]:
+        """Slots holding entity state (group membership excluded)."""
+        slots = GameEntity._state_slots.get(cls)
+        if slots is None:
+            names = []
+            for klass in reversed(cls.__mro__):
+                declared = klass.__dict__.get("__slots__", ())
+                if isinstance(declared, str):
+                    declared = (declared,)
+                names.extend(
+                    name for name in declared if name not in ("_groups", "__weakref__")
+                )
+            slots = GameEntity._state_slots[cls] = tuple(names)
+        return slots
+
+    def copy_state(self, other: "GameEntity") -> None:
+        """Overwrite this entity's state with ``other``'s.
+
+        Shared data (sprite, surfaces, masks) is referenced, the rect is
+        copied. Group membership is left untouched.
+        """
+        for name in self.state_slots():
+            setattr(self, name, getattr(other, name))
+        self.rect = other.rect.copy()
+
+    def clone(self) -> "GameEntity":
+        """Detached copy of this entity that belongs to no group."""
+        entity = object.__new__(type(self))
+        entity._groups = set()
+        entity.copy_state(self)
+        return entity
+
     def draw(self, surface: pygame.Surface) -> None:
         """Draw entity on surface."""
         if self.image and self.rect:
             surface.blit(self.image, self.rect)
 
-    def crash(self, sprites: pygame.sprite.Group) -> pygame.sprite.Sprite | None:
+    def crash(
+        self,
+        sprites: pygame.sprite.Group,
+        collided=pygame.sprite.collide_mask,
+    ) -> "GameEntity | None":
         """Check collision with a group of sprites.
 
         Args:
             sprites: Group of sprites to check collision against
+            collided: Pairwise collision test (pixel mask by default)
 
         Returns:
             The first colliding sprite, or None if no collision
         """
         for sprite in sprites:
-            if pygame.sprite.collide_mask(self, sprite):
+            if collided(self, sprite):
                 return sprite
         return None
+
+
+class EntityGroup(pygame.sprite.Group):
+    """Sprite group with a direct add/remove path for ``GameEntity``.
+
+    ``pygame.sprite.Group`` only recognises ``pygame.sprite.Sprite``
+    instances directly and reaches other objects through an exception
+    fallback; this keeps adds and removes of entities on the fast path.
+    """
+
+    def add(self, *sprites) -> None:
+        for sprite in sprites:
+            if isinstance(sprite, GameEntity):
+                if sprite not in self.spritedict:
+                    self.spritedict[sprite] = None
+                    sprite._groups.add(self)
+            else:
+                super().add(sprite)
+
+    def remove(self, *sprites) -> None:
+        for sprite in sprites:
+            if isinstance(sprite, GameEntity):
+                if sprite in self.spritedict:
+                    self.remove_internal(sprite)
+                    sprite._groups.discard(self)
+            else:
+                super().remove(sprite)
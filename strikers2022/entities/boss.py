@@ -1,13 +1,17 @@
 """Boss entity."""
 
-import pygame
 from .base import GameEntity
-from ..config import BOSS_SIZE, BOSS_DEFAULT_HP, assets
+from .sprite_data import SpriteData
+from ..config import BOSS_SIZE, BOSS_DEFAULT_HP
 
 
 class Boss(GameEntity):
     """Boss enemy entity."""
 
+    __slots__ = ("hp", "dx", "dy")
+
+    _image_cache: dict[str, SpriteData] = {}
+
     def __init__(
         self,
         hp: int = BOSS_DEFAULT_HP,
@@ -15,19 +19,18 @@ class Boss(GameEntity):
         ypos: int = 0,
         image_file: str = "boss.png",
     ):
-        super().__init__()
-
-        self.image = pygame.image.load(assets.get_image(image_file)).convert_alpha()
-        self.image = pygame.transform.scale(self.image, BOSS_SIZE)
-        self.mask = pygame.mask.from_surface(self.image)
-        self.rect = self.image.get_rect()
+        if image_file not in Boss._image_cache:
+            Boss._image_cache[image_file] = SpriteData.load(image_file, BOSS_SIZE)
+        super().__init__(Boss._image_cache[image_file])
+        self.reset(hp, xpos, ypos)
 
+    def reset(self, hp: int, xpos: int, ypos: int) -> None:
+        """Restore full HP and move the boss to a start position."""
         self.rect.x = xpos
         self.rect.y = ypos
         self.hp = hp
         self.dx = 0
         self.dy = 0
-        self.sx, self.sy = BOSS_SIZE
 
     def update(self) -> None:
         """Update boss state. Currently stationary."""
@@ -2,14 +2,17 @@
 
 import pygame
 from .base import GameEntity
-from ..config import WINDOW_HEIGHT, ENEMY_SIZE, assets
-from ..utils import calculate_angle
+from .sprite_data import SpriteData
+from ..config import WINDOW_HEIGHT, ENEMY_SIZE
+from ..utils import calculate_angle, rotation_cache
 
 
 class Enemy(GameEntity):
     """Enemy entity that moves toward the player."""
 
-    _image_cache: dict[str, pygame.Surface] = {}
+    __slots__ = ("orig_center", "speed", "hp", "angle")
+
+    _image_cache: dict[str, SpriteData] = {}
 
     def __init__(
         self,
@@ -20,25 +23,18 @@ class Enemy(GameEntity):
         size: tuple[int, int] = ENEMY_SIZE,
         image_file: str = "enemy1.png",
     ):
-        super().__init__()
-
         # Use cached image if available
         cache_key = f"{image_file}_{size}"
         if cache_key not in Enemy._image_cache:
-            img = pygame.image.load(assets.get_image(image_file)).convert_alpha()
-            img = pygame.transform.scale(img, size)
-            Enemy._image_cache[cache_key] = img
-
-        self.orig_image = Enemy._image_cache[cache_key]
-        self.image = self.orig_image.copy()
-        self.mask = pygame.mask.from_surface(self.image)
-        self.rect = self.image.get_rect()
+            Enemy._image_cache[cache_key] = SpriteData.load(image_file, size)
+        super().__init__(Enemy._image_cache[cache_key])
 
         self.rect.x = xpos
         self.rect.y = ypos
-        self.sx, self.sy = size
+        self.orig_center = self.rect.center
         self.speed = speed
         self.hp = hp
+        self.angle = 0.0
 
     def update(self, target_x: float = 0, target_y: float = 0) -> None:
         """Update enemy position and rotation toward target."""
@@ -47,19 +43,16 @@ class Enemy(GameEntity):
         # Rotate toward target
         center_x = self.rect.x + self.sx / 2
         center_y = self.rect.y + self.sy / 2
-        angle = calculate_angle(center_x, center_y, target_x, target_y)
-        self.image = pygame.transform.rotate(self.orig_image, angle)
+        self.angle = calculate_angle(center_x, center_y, target_x, target_y)
+        self.image = rotation_cache.rotate(self.orig_image, self.angle)
 
-        # Move down
+        # Move down; leaving the screen is handled (and counted as a miss)
+        # by the game through ``out_of_screen``
         self.rect.y += self.speed
 
-        # Remove if moved above screen (shouldn't happen in normal play)
-        if self.rect.y < 0:
-            self.kill()
-
     def out_of_screen(self) -> bool:
-        """Check if enemy is outside screen bounds."""
-        return self.rect.y < 0 or self.rect.y > WINDOW_HEIGHT
+        """Check if enemy has entirely left the screen."""
+        return self.rect.y > WINDOW_HEIGHT or self.rect.y + self.image.get_height() < 0
 
     def draw(self, surface: pygame.Surface) -> None:
         """Draw with proper centering after rotation."""
@@ -1,9 +1,9 @@
 """Item entities."""
 
 from enum import Enum, auto
-import pygame
 from .base import GameEntity
-from ..config import ITEM_SIZE, ITEM_SPEED, assets
+from .sprite_data import SpriteData
+from ..config import WINDOW_HEIGHT, ITEM_SIZE, ITEM_SPEED
 
 
 class ItemType(Enum):
@@ -13,6 +13,8 @@ class ItemType(Enum):
     WEAPON_POWER = auto()
     WEAPON_SPEED = auto()
     WEAPON_NUMBER = auto()
+    WEAPON_MISSILE = auto()
+    WEAPON_BEAM = auto()
 
 
 ITEM_IMAGES = {
@@ -20,12 +22,18 @@ ITEM_IMAGES = {
     ItemType.WEAPON_POWER: "power_item.png",
     ItemType.WEAPON_SPEED: "attack_speed_item.png",
     ItemType.WEAPON_NUMBER: "weapon_count_item.png",
+    ItemType.WEAPON_MISSILE: "missile_item.png",
+    ItemType.WEAPON_BEAM: "beam_item.png",
 }
 
 
 class Item(GameEntity):
     """Collectible item entity."""
 
+    __slots__ = ("item_type", "speed")
+
+    _image_cache: dict[tuple[ItemType, tuple[int, int]], SpriteData] = {}
+
     def __init__(
         self,
         item_type: ItemType,
@@ -33,25 +41,23 @@ class Item(GameEntity):
         ypos: int,
         size: tuple[int, int] = ITEM_SIZE,
     ):
-        super().__init__()
+        cache_key = (item_type, size)
+        if cache_key not in Item._image_cache:
+            Item._image_cache[cache_key] = SpriteData.load(
+                ITEM_IMAGES[item_type], size
+            )
+        super().__init__(Item._image_cache[cache_key])
 
         self.item_type = item_type
-        image_file = ITEM_IMAGES[item_type]
-
-        self.image = pygame.image.load(assets.get_image(image_file)).convert_alpha()
-        self.image = pygame.transform.scale(self.image, size)
-        self.mask = pygame.mask.from_surface(self.image)
-        self.rect = self.image.get_rect()
 
         self.rect.x = xpos
         self.rect.y = ypos
         self.speed = ITEM_SPEED
-        self.sx, self.sy = size
 
     def update(self) -> None:
         """Update item position (falls down)."""
         self.rect.y += self.speed
-        if self.rect.y > 1000:  # Off screen
+        if self.rect.y > WINDOW_HEIGHT:  # Off screen
             self.kill()
 
 
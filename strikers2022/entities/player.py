@@ -1,7 +1,7 @@
 """Player entity and state management."""
 
-import pygame
 from .base import GameEntity
+from .sprite_data import SpriteData
 from ..config import (
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
@@ -12,23 +12,52 @@ from ..config import (
     MAX_WEAPON_SPEED_LEVEL,
     MAX_WEAPON_POWER_LEVEL,
     MAX_WEAPON_NUMBER_LEVEL,
-    assets,
+    MAX_MISSILE_LEVEL,
+    MISSILE_COOLDOWN,
+    BEAM_DURATION,
 )
 
 
 class PlayerState:
     """Encapsulates player-specific state."""
 
+    __slots__ = (
+        "weapon_speed_level",
+        "weapon_power_level",
+        "weapon_number_level",
+        "missile_level",
+        "attack_go1",
+        "attack_go2",
+        "attack_counter",
+        "attack_cooldown",
+        "missile_counter",
+        "beam_frames",
+    )
+
     def __init__(self):
+        self.reset()
+
+    def reset(self) -> None:
+        """Restore the state of a fresh player."""
         self.weapon_speed_level = 1
         self.weapon_power_level = 1
         self.weapon_number_level = 1
+        self.missile_level = 0
 
         # Attack state
         self.attack_go1 = False
         self.attack_go2 = False
         self.attack_counter = 0
         self.attack_cooldown = ATTACK_COOLDOWN_BASE
+        self.missile_counter = 0
+        self.beam_frames = 0
+
+    def copy(self) -> "PlayerState":
+        """Independent copy of this state."""
+        state = object.__new__(PlayerState)
+        for name in PlayerState.__slots__:
+            setattr(state, name, getattr(self, name))
+        return state
 
     @property
     def attack_delay(self) -> int:
@@ -43,6 +72,18 @@ class PlayerState:
             and self.attack_go2
         )
 
+    def can_launch_missiles(self) -> bool:
+        """Check if a missile salvo is due (attacking with missiles ready)."""
+        return (
+            self.missile_level > 0
+            and self.attack_go1
+            and self.missile_counter >= MISSILE_COOLDOWN
+        )
+
+    def can_fire_beam(self) -> bool:
+        """Check if the beam is on (attacking with a beam item running)."""
+        return self.beam_frames > 0 and self.attack_go1
+
     def start_attack(self) -> None:
         """Start attack sequence."""
         self.attack_go1 = True
@@ -60,6 +101,9 @@ class PlayerState:
         """Update attack counters each frame."""
         self.attack_counter += 1
         self.attack_cooldown += 1
+        self.missile_counter += 1
+        if self.beam_frames > 0:
+            self.beam_frames -= 1
 
     def upgrade_weapon_speed(self) -> None:
         """Upgrade weapon speed level."""
@@ -76,33 +120,52 @@ class PlayerState:
         if self.weapon_number_level < MAX_WEAPON_NUMBER_LEVEL:
             self.weapon_number_level += 1
 
+    def upgrade_missile(self) -> None:
+        """Upgrade missile level (the first upgrade unlocks missiles)."""
+        if self.missile_level < MAX_MISSILE_LEVEL:
+            self.missile_level += 1
+
+    def upgrade_beam(self) -> None:
+        """Start (or restart) the beam power-up."""
+        self.beam_frames = BEAM_DURATION
+
     def clamp_levels(self) -> None:
         """Ensure all levels are within maximum bounds."""
         self.weapon_speed_level = min(self.weapon_speed_level, MAX_WEAPON_SPEED_LEVEL)
         self.weapon_power_level = min(self.weapon_power_level, MAX_WEAPON_POWER_LEVEL)
         self.weapon_number_level = min(self.weapon_number_level, MAX_WEAPON_NUMBER_LEVEL)
+        self.missile_level = min(self.missile_level, MAX_MISSILE_LEVEL)
 
 
 class Player(GameEntity):
     """Player character entity."""
 
+    __slots__ = ("dx", "dy", "state")
+
+    _image_cache: dict[str, SpriteData] = {}
+
     def __init__(self, xpos: int, ypos: int, image_file: str):
-        super().__init__()
+        if image_file not in Player._image_cache:
+            Player._image_cache[image_file] = SpriteData.load(image_file, PLAYER_SIZE)
+        super().__init__(Player._image_cache[image_file])
 
-        self.image = pygame.image.load(assets.get_image(image_file)).convert_alpha()
-        self.image = pygame.transform.scale(self.image, PLAYER_SIZE)
-        self.rect = self.image.get_rect()
-        self.mask = pygame.mask.from_surface(self.image)
+        # Player state
+        self.state = PlayerState()
+        self.reset(xpos, ypos)
 
+    def reset(self, xpos: int, ypos: int) -> None:
+        """Move the player to a start position and clear its state."""
         self.rect.x = xpos
         self.rect.y = ypos
 
-        self.sx, self.sy = PLAYER_SIZE
         self.dx = 0
         self.dy = 0
+        self.state.reset()
 
-        # Player state
-        self.state = PlayerState()
+    def copy_state(self, other: "Player") -> None:
+        """Overwrite this player's state with ``other``'s."""
+        super().copy_state(other)
+        self.state = other.state.copy()
 
     def update(self) -> None:
         """Update player position with boundary checking."""
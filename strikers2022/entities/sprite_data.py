@@ -0,0 +1,30 @@
+"""Shared, immutable sprite data (flyweight)."""
+
+import pygame
+from ..utils import load_image
+
+
+class SpriteData:
+    """Surface, mask and size shared by every entity drawn with one image.
+
+    Entities keep a reference to a ``SpriteData`` and store only their
+    mutable state (position, HP, speed, ...) themselves.
+    """
+
+    __slots__ = ("image", "mask", "size", "name")
+
+    def __init__(
+        self,
+        image: pygame.Surface,
+        mask: pygame.mask.Mask | None = None,
+        name: str | None = None,
+    ):
+        self.image = image
+        self.mask = mask if mask is not None else pygame.mask.from_surface(image)
+        self.size = image.get_size()
+        self.name = name  # Asset file the image was loaded from
+
+    @classmethod
+    def load(cls, image_file: str, size: tuple[int, int]) -> "SpriteData":
+        """Load an image from the asset directory and scale it to ``size``."""
+        return cls(load_image(image_file, size), name=image_file)
@@ -1,8 +1,10 @@
 """Weapon entities for players and enemies."""
 
 import math
+import weakref
 import pygame
 from .base import GameEntity
+from .sprite_data import SpriteData
 from ..config import (
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
@@ -10,17 +12,23 @@ from ..config import (
     PLAYER_WEAPON_SPEED,
     ENEMY_WEAPON_SIZE,
     ENEMY_WEAPON_SPEED,
+    MISSILE_SIZE,
+    MISSILE_SPEED,
+    MISSILE_TURN,
+    MISSILE_LIFETIME,
     assets,
 )
-from ..utils import calculate_angle, calculate_direction
+from ..utils import calculate_angle, calculate_direction, rotation_cache
 
 
 class PlayerWeapon(GameEntity):
     """Player's weapon projectile."""
 
+    __slots__ = ("speed",)
+
     _sound = None
     _sound_loaded = False
-    _image_cache: dict[int, tuple[pygame.Surface, pygame.mask.Mask]] = {}
+    _image_cache: dict[int, SpriteData] = {}
 
     def __init__(
         self,
@@ -30,18 +38,12 @@ class PlayerWeapon(GameEntity):
         size: tuple[int, int] = PLAYER_WEAPON_SIZE,
         speed: int = PLAYER_WEAPON_SPEED,
     ):
-        super().__init__()
-
         # Use cached image if available
         if power_level not in PlayerWeapon._image_cache:
-            image_file = f"bullet_{power_level}.png"
-            img = pygame.image.load(assets.get_image(image_file)).convert_alpha()
-            img = pygame.transform.scale(img, size)
-            mask = pygame.mask.from_surface(img)
-            PlayerWeapon._image_cache[power_level] = (img, mask)
-
-        self.image, self.mask = PlayerWeapon._image_cache[power_level]
-        self.rect = self.image.get_rect()
+            PlayerWeapon._image_cache[power_level] = SpriteData.load(
+                f"bullet_{power_level}.png", size
+            )
+        super().__init__(PlayerWeapon._image_cache[power_level])
 
         self.rect.x = xpos
         self.rect.y = ypos
@@ -75,7 +77,9 @@ class PlayerWeapon(GameEntity):
 class EnemyWeapon(GameEntity):
     """Enemy's weapon projectile that tracks toward a target."""
 
-    _image_cache: dict[str, pygame.Surface] = {}
+    __slots__ = ("orig_center", "speed", "direction", "angle")
+
+    _image_cache: dict[str, SpriteData] = {}
 
     def __init__(
         self,
@@ -87,33 +91,24 @@ class EnemyWeapon(GameEntity):
         speed: int = ENEMY_WEAPON_SPEED,
         image_file: str = "enemy1_bullet.png",
     ):
-        super().__init__()
-
         # Use cached base image if available
         cache_key = f"{image_file}_{size}"
         if cache_key not in EnemyWeapon._image_cache:
-            img = pygame.image.load(assets.get_image(image_file)).convert_alpha()
-            img = pygame.transform.scale(img, size)
-            EnemyWeapon._image_cache[cache_key] = img
-
-        self.image = EnemyWeapon._image_cache[cache_key].copy()
-        self.mask = pygame.mask.from_surface(self.image)
-        self.rect = self.image.get_rect()
+            EnemyWeapon._image_cache[cache_key] = SpriteData.load(image_file, size)
+        super().__init__(EnemyWeapon._image_cache[cache_key])
 
         self.rect.x = xpos
         self.rect.y = ypos
-        self.sx, self.sy = size
         self.speed = speed
 
-        # Store original image for rotation
-        self.orig_image = self.image
+        # Center used when drawing the rotated image
         self.orig_center = self.rect.center
 
         # Calculate direction and rotate
         center_x = self.rect.x + self.sx / 2
         center_y = self.rect.y + self.sy / 2
-        angle = calculate_angle(center_x, center_y, target_x, target_y)
-        self.image = pygame.transform.rotate(self.orig_image, angle)
+        self.angle = calculate_angle(center_x, center_y, target_x, target_y)
+        self.image = rotation_cache.rotate(self.orig_image, self.angle)
 
         # Store movement direction
         self.direction = calculate_direction(
@@ -130,10 +125,11 @@ class EnemyWeapon(GameEntity):
             self.kill()
 
     def out_of_screen(self) -> bool:
-        """Check if weapon is outside screen bounds."""
-        if self.rect.x + WINDOW_WIDTH < 0 or self.rect.x > WINDOW_WIDTH:
+        """Check if the drawn (rotated) image has entirely left the screen."""
+        width, height = self.image.get_size()
+        if self.rect.x + width < 0 or self.rect.x > WINDOW_WIDTH:
             return True
-        if self.rect.y + WINDOW_HEIGHT < 0 or self.rect.y > WINDOW_HEIGHT:
+        if self.rect.y + height < 0 or self.rect.y > WINDOW_HEIGHT:
             return True
         return False
 
@@ -141,3 +137,70 @@ class EnemyWeapon(GameEntity):
         """Draw with proper centering after rotation."""
         self.rect = self.image.get_rect(center=self.orig_center)
         surface.blit(self.image, self.rect)
+
+
+class Missile(GameEntity):
+    """Player's homing missile.
+
+    The missile flies along ``heading`` and turns at most ``MISSILE_TURN``
+    degrees a frame towards the point given to ``steer``; the game picks
+    that point (the nearest enemy, else the boss) before every update. The
+    position is kept in floats so slow turns are not lost to rounding.
+
+    ``x``/``y`` is the centre; the constructor takes the heading in degrees
+    (-90 = straight up) and keeps it in radians.
+    """
+
+    __slots__ = ("x", "y", "heading", "speed", "lifetime", "angle")
+
+    _image_cache: dict[tuple[int, int], SpriteData] = {}
+    # Mask of every rotated image, so pixel collisions follow the rotation;
+    # entries go with the rotation cache's surfaces
+    _masks: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def __init__(
+        self,
+        x: float,
+        y: float,
+        heading: float = -90.0,
+        size: tuple[int, int] = MISSILE_SIZE,
+        speed: float = MISSILE_SPEED,
+    ):
+        if size not in Missile._image_cache:
+            Missile._image_cache[size] = SpriteData.load("missile.png", size)
+        super().__init__(Missile._image_cache[size])
+
+        self.x = x
+        self.y = y
+        self.heading = math.radians(heading)
+        self.speed = speed
+        self.lifetime = MISSILE_LIFETIME
+        self.angle = 0.0
+        self._orient()
+
+    def _orient(self) -> None:
+        """Rotate the image to the heading and centre it on the position."""
+        # The image points down, which pygame's rotation calls 0 degrees
+        self.angle = (90 - math.degrees(self.heading)) % 360
+        self.image = rotation_cache.rotate(self.orig_image, self.angle)
+        mask = Missile._masks.get(self.image)
+        if mask is None:
+            mask = Missile._masks[self.image] = pygame.mask.from_surface(self.image)
+        self.mask = mask
+        self.rect = self.image.get_rect(center=(round(self.x), round(self.y)))
+
+    def steer(self, target_x: float, target_y: float) -> None:
+        """Turn towards a point, by at most ``MISSILE_TURN`` degrees."""
+        desired = math.atan2(target_y - self.y, target_x - self.x)
+        delta = (desired - self.heading + math.pi) % math.tau - math.pi
+        turn = math.radians(MISSILE_TURN)
+        self.heading += max(-turn, min(turn, delta))
+
+    def update(self) -> None:
+        """Fly one frame along the heading; burn out or leave the screen."""
+        self.x += math.cos(self.heading) * self.speed
+        self.y += math.sin(self.heading) * self.speed
+        self.lifetime -= 1
+        self._orient()
+        if self.lifetime <= 0 or not self.rect.colliderect((0, 0, WINDOW_WIDTH, WINDOW_HEIGHT)):
+            self.kill()
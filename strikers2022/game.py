@@ -1,37 +1,172 @@
 """Main Game class containing the game loop."""
 
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import time
 import pygame
 
 from .config import (
     WINDOW_WIDTH,
     WINDOW_HEIGHT,
     FPS,
+    WHITE,
     PLAYER_HP,
     BOSS_DEFAULT_HP,
+    BOSS_PATTERN_FILE,
     ENEMY_SPAWN_PROBABILITY,
     ENEMY_ATTACK_INTERVAL,
-    assets,
+    MISSILE_DAMAGE,
+    MISSILE_LOCK_RADIUS,
+    MISSILE_SALVO_SPREAD,
+    BEAM_WIDTH,
+    BEAM_TICK,
+    BEAM_DAMAGE,
+    BEAM_PIERCE,
+    BEAM_DRAW_STEP,
+    BULLET_CANCEL_ENABLED,
+    QUALITY_GOVERNOR_ENABLED,
+    METRICS_ENABLED,
+    METRICS_PUBLISH_INTERVAL,
+    TELEMETRY_ENABLED,
+    TELEMETRY_PATH,
+    RENDER_SCALE,
+    PAUSE_ON_FOCUS_LOST,
+    PAUSED_FPS,
+    RESULT_SCREEN_MS,
+    PIPELINE_ENABLED,
+    BROADCAST_ENABLED,
+    BROADCAST_PORT,
+)
+from .entities import (
+    Player,
+    Boss,
+    PlayerWeapon,
+    EnemyWeapon,
+    Missile,
+    ItemType,
+    EntityGroup,
 )
-from .entities import Player, Boss, PlayerWeapon, EnemyWeapon, ItemType
 from .managers import (
+    ActionMap,
     InputManager,
     CollisionManager,
     SpawnManager,
+    QualityManager,
+    QualityLevel,
+    GCManager,
     audio,
-    occur_explosion,
+    get_explosion_image,
     occur_get_item,
 )
-from .ui import HUD, fonts
+from .ui import (
+    HUD,
+    REDRAW_EVENTS,
+    FrameSnapshot,
+    Layer,
+    RenderQueue,
+    Renderer,
+    draw_text,
+    fonts,
+)
+from .patterns import BossPatterns, BulletField, load_phases
+from .bots import Bot, BotDriver
+from .diagnostics import (
+    FrameStats,
+    InputLatencyTracker,
+    MetricsExporter,
+    MetricsSnapshot,
+    SamplingProfiler,
+    TelemetryRecorder,
+    TelemetrySink,
+    Tracer,
+)
+from .utils import SpatialGrid, load_image, rotation_cache
+
+# Window events that pause or resume the game, with the pause reason each
+# one controls. A game paused for several reasons resumes once all clear.
+WINDOW_PAUSE_EVENTS = {
+    pygame.WINDOWFOCUSLOST: (True, "focus"),
+    pygame.WINDOWFOCUSGAINED: (False, "focus"),
+    pygame.WINDOWMINIMIZED: (True, "hidden"),
+    pygame.WINDOWHIDDEN: (True, "hidden"),
+    pygame.WINDOWRESTORED: (False, "hidden"),
+    pygame.WINDOWSHOWN: (False, "hidden"),
+}
 
 
 class Game:
     """Main game class managing the game loop and state."""
 
-    def __init__(self, screen: pygame.Surface):
+    def __init__(self, screen: pygame.Surface, actions: ActionMap | None = None):
         self.screen = screen
+        # Key and joystick bindings, shared with the menu
+        self.actions = actions or ActionMap.load()
         self.clock = pygame.time.Clock()
+        self.fps_limit = FPS
         self.running = False
+        self.renderer = Renderer(screen)
+        self.render_queue = RenderQueue()
+
+        # Pipelined mode: the next frame is simulated on a worker thread
+        # while the main thread draws the snapshot of the previous one
+        self.pipelined = PIPELINE_ENABLED
+        self._executor: ThreadPoolExecutor | None = None
+        self._snapshot: FrameSnapshot | None = None
+
+        # Frame timing and adaptive quality
+        self.frame_stats = FrameStats()
+        self.quality = QualityManager(
+            on_change=self._apply_quality, enabled=QUALITY_GOVERNOR_ENABLED
+        )
+        self.enemy_bullet_cap: int | None = None
+        self.input_latency = InputLatencyTracker()
+        self.gc_manager = GCManager(self.frame_stats)
+
+        # Current loop stage, read by the sampling profiler
+        self.stage = "idle"
+        self.profiler = SamplingProfiler()
+        self.tracer = Tracer()
+
+        # Pause and result screen state
+        self._pause_reasons: set[str] = set()
+        self._pause_started: float | None = None
+        self.paused_seconds = 0.0
+        self.result: str | None = None
+        self._result_until = 0.0
+        self._restart_requested_at: float | None = None
+        self._overlay: pygame.Surface | None = None
+        self._overlay_dirty = False
+
+        # Time from a start request to the first gameplay frame
+        self._start_requested_at: float | None = None
+        self.start_ms: list[float] = []
+
+        # The world is built by the first start and reset in place afterwards
+        self._world_ready = False
+
+        # Spawn seed for the next start (None: unseeded) and whether effects
+        # (sounds, explosions) are suppressed, e.g. while resimulating
+        self.seed: int | None = None
+        self.muted = False
+
+        # Optional metrics endpoint
+        self.metrics: MetricsExporter | None = None
+        if METRICS_ENABLED:
+            self.metrics = MetricsExporter()
+            self.metrics.start()
+
+        # Optional session telemetry
+        self.telemetry: TelemetryRecorder | None = None
+        if TELEMETRY_ENABLED:
+            self.enable_telemetry()
+
+        # Optional bot players, driven outside the timed frame work
+        self.bot_driver: BotDriver | None = None
+
+        # Optional spectator broadcast
+        self.broadcaster = None
+        if BROADCAST_ENABLED:
+            self.enable_broadcast()
 
         # Load resources
         self._load_resources()
@@ -39,61 +174,122 @@ class Game:
     def _load_resources(self) -> None:
         """Load game resources."""
         self.default_font = fonts.get_font(20)
-        self.background = pygame.image.load(
-            assets.get_image("background.png")
-        ).convert_alpha()
-        self.background = pygame.transform.scale(
-            self.background, (WINDOW_WIDTH, WINDOW_HEIGHT)
+        self.background = load_image(
+            "background.png", (WINDOW_WIDTH, WINDOW_HEIGHT)
         )
+        # Full-height beam; shorter beams are subsurfaces of it
+        self.beam_image = load_image("beam.png", (BEAM_WIDTH, WINDOW_HEIGHT))
+        self._beam_images: dict[int, pygame.Surface] = {}
 
         # Load sounds
         audio.load_sounds()
 
+        self.hud = HUD(self.default_font)
+
     def _create_entities(self) -> None:
         """Create game entities."""
-        # Boss
-        self.boss = Boss(
+        self.boss = Boss()
+        self.player1 = Player(xpos=0, ypos=0, image_file="player1.png")
+        self.player2 = Player(xpos=0, ypos=0, image_file="player2.png")
+        # Boss pattern bullets live in arrays, not in sprite groups
+        self.bullet_field = BulletField()
+        # Enemy centres, rebuilt every frame that missiles need targets
+        self.enemy_grid = SpatialGrid()
+        self._reset_entities()
+
+    def _reset_entities(self) -> None:
+        """Put the boss and players back at their start positions."""
+        self.boss.reset(
             hp=BOSS_DEFAULT_HP,
             xpos=round(WINDOW_WIDTH * 1 / 2 - 250),
             ypos=0,
         )
-
-        # Players
-        self.player1 = Player(
+        self.player1.reset(
             xpos=round(WINDOW_WIDTH * 2 / 3 - 25),
             ypos=WINDOW_HEIGHT - 80,
-            image_file="player1.png",
         )
-        self.player2 = Player(
+        self.player2.reset(
             xpos=round(WINDOW_WIDTH * 1 / 3 - 25),
             ypos=WINDOW_HEIGHT - 80,
-            image_file="player2.png",
         )
 
-    def _create_sprite_groups(self) -> None:
-        """Create sprite groups for entities."""
-        self.player1_weapons = pygame.sprite.Group()
-        self.player2_weapons = pygame.sprite.Group()
-
-        self.enemy1s = pygame.sprite.Group()
-        self.enemy2s = pygame.sprite.Group()
+    def _reset_world(self) -> None:
+        """Reinitialize the existing world for a new game.
 
-        self.enemy1_weapons = pygame.sprite.Group()
-        self.enemy2_weapons = pygame.sprite.Group()
+        Entities, sprite groups and managers are reused; only their state is
+        cleared, so a restart touches neither the disk nor the image caches.
+        """
+        self._reset_entities()
+        for group in self.sprite_groups.values():
+            group.empty()
+        self.bullet_field.clear()
+        self.boss_patterns.reset()
+        self.render_queue.clear()
+        self.collision_manager.reset()
 
-        self.weapon_power_items = pygame.sprite.Group()
-        self.weapon_speed_items = pygame.sprite.Group()
-        self.weapon_number_items = pygame.sprite.Group()
-        self.heal_items = pygame.sprite.Group()
+    def _create_sprite_groups(self) -> None:
+        """Create sprite groups for entities."""
+        self.player1_weapons = EntityGroup()
+        self.player2_weapons = EntityGroup()
+        self.player1_missiles = EntityGroup()
+        self.player2_missiles = EntityGroup()
+
+        self.enemy1s = EntityGroup()
+        self.enemy2s = EntityGroup()
+
+        self.enemy1_weapons = EntityGroup()
+        self.enemy2_weapons = EntityGroup()
+
+        self.weapon_power_items = EntityGroup()
+        self.weapon_speed_items = EntityGroup()
+        self.weapon_number_items = EntityGroup()
+        self.weapon_missile_items = EntityGroup()
+        self.weapon_beam_items = EntityGroup()
+        self.heal_items = EntityGroup()
+
+    @property
+    def sprite_groups(self) -> dict[str, pygame.sprite.Group]:
+        """All sprite groups by attribute name."""
+        return {
+            "player1_weapons": self.player1_weapons,
+            "player2_weapons": self.player2_weapons,
+            "player1_missiles": self.player1_missiles,
+            "player2_missiles": self.player2_missiles,
+            "enemy1s": self.enemy1s,
+            "enemy2s": self.enemy2s,
+            "enemy1_weapons": self.enemy1_weapons,
+            "enemy2_weapons": self.enemy2_weapons,
+            "weapon_power_items": self.weapon_power_items,
+            "weapon_speed_items": self.weapon_speed_items,
+            "weapon_number_items": self.weapon_number_items,
+            "weapon_missile_items": self.weapon_missile_items,
+            "weapon_beam_items": self.weapon_beam_items,
+            "heal_items": self.heal_items,
+        }
 
     def _create_managers(self) -> None:
         """Create manager instances."""
-        self.input_manager = InputManager(self.player1, self.player2)
+        self.input_manager = InputManager(self.player1, self.player2, self.actions)
         self.collision_manager = CollisionManager(
             self.player1, self.player2, self.boss, self.screen
         )
-        self.collision_manager.set_effects(occur_explosion, occur_get_item)
+        self.collision_manager.set_effects(self._queue_explosion, self._item_pickup)
         self.spawn_manager = SpawnManager()
+        self.boss_patterns = BossPatterns(load_phases(BOSS_PATTERN_FILE))
+        self.input_manager.bind_debug(InputManager.PROFILE, self.toggle_profiler)
+        self.input_manager.bind_debug(InputManager.TRACE, self.toggle_tracer)
+
+    def _apply_quality(self, level: QualityLevel) -> None:
+        """Apply a quality level to the subsystems it controls."""
+        rotation_cache.step = level.rotation_step
+        self.renderer.set_scale(min(RENDER_SCALE, level.render_scale))
+        self.renderer.prepare([self.background])
+        self.enemy_bullet_cap = level.enemy_bullet_cap
+        if hasattr(self, "collision_manager"):
+            self.collision_manager.set_bullet_mask_collision(
+                level.bullet_mask_collision
+            )
+            self.collision_manager.max_explosions = level.max_explosions
 
     def _reset_game_state(self) -> None:
         """Reset game state variables."""
@@ -102,9 +298,126 @@ class Game:
         self.players_hp = PLAYER_HP
         self.enemy_level = 1
         self.enemy_attack_counter = 0
+        self.input_bits = (0, 0)
+
+        # Length of each player's beam this frame (0 = off); derived from
+        # the world in the collision pass, so not part of snapshots
+        self.beam_lengths = [0.0, 0.0]
 
         # Time tracking
-        self.start_time = datetime.now().replace(microsecond=0)
+        self.start_time = time.perf_counter()
+        self.paused_seconds = 0.0
+
+    @property
+    def paused(self) -> bool:
+        """True while the game is paused for any reason."""
+        return bool(self._pause_reasons)
+
+    @property
+    def elapsed_seconds(self) -> float:
+        """Session time, excluding time spent paused."""
+        now = self._pause_started or time.perf_counter()
+        return now - self.start_time - self.paused_seconds
+
+    def pause(self, reason: str = "user") -> None:
+        """Suspend the simulation.
+
+        Args:
+            reason: What requested the pause ("user", "focus" or "hidden")
+        """
+        if not self._pause_reasons:
+            self._pause_started = time.perf_counter()
+            self.input_manager.release_all()
+            if self.bot_driver:
+                self.bot_driver.release()
+            audio.pause()
+            self._overlay = self._compose_overlay("PAUSED", "PRESS P TO RESUME")
+            self._overlay_dirty = True
+        self._pause_reasons.add(reason)
+
+    def resume(self, reason: str = "user") -> None:
+        """Lift a pause; the game continues once no reason is left."""
+        if reason not in self._pause_reasons:
+            return
+        self._pause_reasons.discard(reason)
+        if not self._pause_reasons:
+            self.paused_seconds += time.perf_counter() - self._pause_started
+            self._pause_started = None
+            self._overlay = None
+            audio.resume()
+
+    def _reset_pause(self) -> None:
+        """Leave any pause without counting it (new or abandoned session)."""
+        if self._pause_reasons:
+            audio.resume()
+        self._pause_reasons.clear()
+        self._pause_started = None
+        self._overlay = None
+
+    def _compose_overlay(self, title: str, subtitle: str) -> pygame.Surface:
+        """Dim the last presented frame and label it."""
+        frame = self.screen.copy()
+        shade = pygame.Surface(frame.get_size())
+        shade.set_alpha(128)
+        frame.blit(shade, (0, 0))
+
+        center_x = WINDOW_WIDTH // 2
+        center_y = WINDOW_HEIGHT // 2
+        draw_text(title, fonts.get_font(70), frame, center_x, center_y, WHITE)
+        draw_text(
+            subtitle,
+            fonts.get_font(40),
+            frame,
+            center_x,
+            center_y + 80,
+            WHITE,
+        )
+        return frame
+
+    def _present_overlay(self) -> None:
+        """Show the paused or result frame when the window needs it.
+
+        Nothing is drawn while the window is hidden, and a visible overlay
+        is only presented again after the window was exposed.
+        """
+        if not self._overlay_dirty or "hidden" in self._pause_reasons:
+            return
+        self.screen.blit(self._overlay, (0, 0))
+        self._flip()
+        self._overlay_dirty = False
+
+    def _handle_pause_event(self, event: pygame.event.Event) -> bool:
+        """Apply pause key and window visibility events.
+
+        Returns:
+            True if the event was consumed
+        """
+        if self.actions.matches(event, "pause"):
+            if "user" in self._pause_reasons:
+                self.resume("user")
+            else:
+                self.pause("user")
+            return True
+
+        if PAUSE_ON_FOCUS_LOST and event.type in WINDOW_PAUSE_EVENTS:
+            pause, reason = WINDOW_PAUSE_EVENTS[event.type]
+            if pause:
+                self.pause(reason)
+            else:
+                self.resume(reason)
+
+        if event.type in REDRAW_EVENTS:
+            self._overlay_dirty = True
+        return False
+
+    def _handle_result_event(self, event: pygame.event.Event, sampled_at: float) -> None:
+        """Handle an event while the result screen is shown."""
+        if event.type == pygame.QUIT:
+            self.running = False
+        elif self.actions.matches(event, "start"):
+            self._restart_requested_at = sampled_at
+        elif event.type in REDRAW_EVENTS:
+            self._overlay_dirty = True
 
     def _handle_player_attack(
         self, player: Player, weapons: pygame.sprite.Group
@@ -112,7 +425,8 @@ class Game:
         """Handle weapon firing for a player."""
         state = player.state
 
-        if not state.can_attack():
+        # The beam replaces the gun while it is on
+        if not state.can_attack() or state.can_fire_beam():
             return
 
         power_level = state.weapon_power_level
@@ -137,16 +451,65 @@ class Game:
                 ypos=player.rect.centery - 40,
                 power_level=power_level,
             )
-            weapon.launch()
+            if not self.muted:
+                weapon.launch()
             weapons.add(weapon)
 
+    def _handle_player_missiles(
+        self, player: Player, missiles: pygame.sprite.Group
+    ) -> None:
+        """Launch a missile salvo for a player when one is due."""
+        state = player.state
+
+        if not state.can_launch_missiles():
+            return
+        state.missile_counter = 0
+
+        # One missile per level, fanned out around straight up
+        count = state.missile_level
+        for i in range(count):
+            heading = -90 + (i - (count - 1) / 2) * MISSILE_SALVO_SPREAD
+            missiles.add(Missile(player.center_x, player.rect.y, heading))
+
+    def _steer_missiles(self) -> None:
+        """Point every missile at the nearest enemy in range, else the boss.
+
+        The enemy grid is rebuilt from this frame's enemy centres and all
+        missiles are answered in one batched nearest-neighbour query.
+        """
+        missiles = [*self.player1_missiles, *self.player2_missiles]
+        if not missiles:
+            return
+        enemies = [*self.enemy1s, *self.enemy2s]
+        grid = self.enemy_grid
+        grid.rebuild(
+            [enemy.rect.centerx for enemy in enemies],
+            [enemy.rect.centery for enemy in enemies],
+        )
+        nearest, _ = grid.nearest(
+            [missile.x for missile in missiles],
+            [missile.y for missile in missiles],
+            k=1,
+            radius=MISSILE_LOCK_RADIUS,
+        )
+        boss_x, boss_y = self.boss.rect.center
+        for missile, index in zip(missiles, nearest[:, 0].tolist()):
+            if index < 0:
+                missile.steer(boss_x, boss_y)
+            else:
+                missile.steer(*enemies[index].rect.center)
+
     def _spawn_enemy_weapons(self) -> None:
         """Spawn enemy weapons at regular intervals."""
         if self.enemy_attack_counter % ENEMY_ATTACK_INTERVAL != 0:
             return
 
+        cap = self.enemy_bullet_cap
+
         # Enemy1 weapons targeting player1
         for enemy in self.enemy1s:
+            if cap is not None and len(self.enemy1_weapons) >= cap:
+                break
             weapon = EnemyWeapon(
                 xpos=enemy.rect.centerx - 5,
                 ypos=enemy.rect.centery,
@@ -157,6 +520,8 @@ class Game:
 
         # Enemy2 weapons targeting player2
         for enemy in self.enemy2s:
+            if cap is not None and len(self.enemy2_weapons) >= cap:
+                break
             weapon = EnemyWeapon(
                 xpos=enemy.rect.centerx - 5,
                 ypos=enemy.rect.centery,
@@ -205,6 +570,27 @@ class Game:
             self.player2.state.weapon_power_level,
         )
 
+        # Player missiles vs enemies
+        self.shot_count += cm.check_player_weapon_vs_enemies(
+            self.player1_missiles, enemy_groups, MISSILE_DAMAGE
+        )
+        self.shot_count += cm.check_player_weapon_vs_enemies(
+            self.player2_missiles, enemy_groups, MISSILE_DAMAGE
+        )
+
+        # Player beams vs enemies and boss
+        for index, player in enumerate((self.player1, self.player2)):
+            self.beam_lengths[index] = 0.0
+            state = player.state
+            if not state.can_fire_beam():
+                continue
+            start = (player.rect.centerx, player.rect.y)
+            damage = BEAM_DAMAGE if state.beam_frames % BEAM_TICK == 0 else 0
+            kills, self.beam_lengths[index] = cm.check_beam(
+                start, (start[0], 0), enemy_groups, BEAM_WIDTH / 2, BEAM_PIERCE, damage
+            )
+            self.shot_count += kills
+
         # Players vs enemies
         self.players_hp -= cm.check_player_vs_enemies(
             self.player1, enemy_groups, self.enemy_level
@@ -213,6 +599,14 @@ class Game:
             self.player2, enemy_groups, self.enemy_level
         )
 
+        # Player shots vs enemy bullets, before the bullets can hit anyone
+        if BULLET_CANCEL_ENABLED:
+            cm.check_bullet_cancel(
+                [self.player1_weapons, self.player2_weapons],
+                weapon_groups,
+                self.bullet_field,
+            )
+
         # Players vs enemy weapons
         self.players_hp -= cm.check_player_vs_enemy_weapons(
             self.player1, weapon_groups, self.enemy_level
@@ -221,6 +615,14 @@ class Game:
             self.player2, weapon_groups, self.enemy_level
         )
 
+        # Players vs boss pattern bullets
+        self.players_hp -= cm.check_player_vs_bullet_field(
+            self.player1, self.bullet_field, self.enemy_level
+        )
+        self.players_hp -= cm.check_player_vs_bullet_field(
+            self.player2, self.bullet_field, self.enemy_level
+        )
+
         # Player weapons vs boss
         cm.check_boss_vs_player_weapons(
             self.player1_weapons, self.player1.state.weapon_power_level
@@ -228,6 +630,8 @@ class Game:
         cm.check_boss_vs_player_weapons(
             self.player2_weapons, self.player2.state.weapon_power_level
         )
+        cm.check_boss_vs_player_weapons(self.player1_missiles, MISSILE_DAMAGE)
+        cm.check_boss_vs_player_weapons(self.player2_missiles, MISSILE_DAMAGE)
 
         # Players vs items
         for player in (self.player1, self.player2):
@@ -240,6 +644,12 @@ class Game:
             cm.check_player_vs_items(
                 player, self.weapon_speed_items, ItemType.WEAPON_SPEED
             )
+            cm.check_player_vs_items(
+                player, self.weapon_missile_items, ItemType.WEAPON_MISSILE
+            )
+            cm.check_player_vs_items(
+                player, self.weapon_beam_items, ItemType.WEAPON_BEAM
+            )
 
         # Heal items (shared HP)
         self.players_hp += cm.check_player_vs_heal_items(self.heal_items)
@@ -260,6 +670,8 @@ class Game:
                 self.weapon_power_items,
                 self.weapon_speed_items,
                 self.weapon_number_items,
+                self.weapon_missile_items,
+                self.weapon_beam_items,
                 self.heal_items,
             ],
         )
@@ -278,39 +690,82 @@ class Game:
         self.player1_weapons.update()
         self.player2_weapons.update()
 
+        # Player missiles
+        self._steer_missiles()
+        self.player1_missiles.update()
+        self.player2_missiles.update()
+
         # Players
         self.player1.update()
         self.player2.update()
 
-        # Boss
+        # Boss and its pattern bullets
         self.boss.update()
+        self.bullet_field.update(
+            (
+                (self.player1.center_x, self.player1.center_y),
+                (self.player2.center_x, self.player2.center_y),
+            )
+        )
 
         # Items
         self.weapon_number_items.update()
         self.weapon_speed_items.update()
         self.weapon_power_items.update()
+        self.weapon_missile_items.update()
+        self.weapon_beam_items.update()
         self.heal_items.update()
 
-    def _draw_entities(self) -> None:
-        """Draw all entities."""
-        self.enemy1s.draw(self.screen)
-        self.enemy2s.draw(self.screen)
+    def _queue_entities(self) -> None:
+        """Queue all entities for drawing."""
+        queue = self.render_queue
+
+        queue.add_group(Layer.ENEMIES, self.enemy1s)
+        queue.add_group(Layer.ENEMIES, self.enemy2s)
+
+        queue.add_group(Layer.ENEMY_BULLETS, self.enemy1_weapons)
+        queue.add_group(Layer.ENEMY_BULLETS, self.enemy2_weapons)
+        queue.extend(Layer.ENEMY_BULLETS, self.bullet_field.blits())
 
-        self.enemy1_weapons.draw(self.screen)
-        self.enemy2_weapons.draw(self.screen)
+        queue.add_group(Layer.PLAYER_BULLETS, self.player1_weapons)
+        queue.add_group(Layer.PLAYER_BULLETS, self.player2_weapons)
+        queue.add_group(Layer.PLAYER_BULLETS, self.player1_missiles)
+        queue.add_group(Layer.PLAYER_BULLETS, self.player2_missiles)
+        self._queue_beams()
 
-        self.player1_weapons.draw(self.screen)
-        self.player2_weapons.draw(self.screen)
+        queue.add_entity(Layer.PLAYERS, self.player1)
+        queue.add_entity(Layer.PLAYERS, self.player2)
 
-        self.player1.draw(self.screen)
-        self.player2.draw(self.screen)
+        queue.add_entity(Layer.BOSS, self.boss)
 
-        self.boss.draw(self.screen)
+        queue.add_group(Layer.ITEMS, self.weapon_number_items)
+        queue.add_group(Layer.ITEMS, self.weapon_speed_items)
+        queue.add_group(Layer.ITEMS, self.weapon_power_items)
+        queue.add_group(Layer.ITEMS, self.weapon_missile_items)
+        queue.add_group(Layer.ITEMS, self.weapon_beam_items)
+        queue.add_group(Layer.ITEMS, self.heal_items)
 
-        self.weapon_number_items.draw(self.screen)
-        self.weapon_speed_items.draw(self.screen)
-        self.weapon_power_items.draw(self.screen)
-        self.heal_items.draw(self.screen)
+    def beam_spans(self) -> list[tuple[int, int, int]]:
+        """(centre x, top of the player, drawn length) of each player's beam.
+
+        Lengths are rounded to ``BEAM_DRAW_STEP`` and 0 while a beam is off.
+        """
+        spans = []
+        for player, length in zip((self.player1, self.player2), self.beam_lengths):
+            drawn = min(max(round(length / BEAM_DRAW_STEP), 0) * BEAM_DRAW_STEP, WINDOW_HEIGHT)
+            spans.append((player.rect.centerx, player.rect.y, drawn))
+        return spans
+
+    def _queue_beams(self) -> None:
+        """Queue the players' beams at this frame's lengths."""
+        for x, y, length in self.beam_spans():
+            if not length:
+                continue
+            image = self._beam_images.get(length)
+            if image is None:
+                image = self.beam_image.subsurface((0, WINDOW_HEIGHT - length, BEAM_WIDTH, length))
+                self._beam_images[length] = image
+            self.render_queue.add(Layer.PLAYER_BULLETS, image, (x - BEAM_WIDTH // 2, y - length))
 
     def _check_game_over(self) -> str | None:
         """Check for game over conditions.
@@ -331,116 +786,612 @@ class Game:
 
         return None
 
-    def run(self) -> str:
-        """Run the game loop.
+    def live_entities(self) -> list:
+        """Players, boss and every entity in a sprite group."""
+        entities = [self.player1, self.player2, self.boss]
+        for group in self.sprite_groups.values():
+            entities.extend(group)
+        return entities
 
-        Returns:
-            Next game state ("game_menu")
+    def _publish_metrics(self) -> None:
+        """Hand a fresh snapshot to the metrics exporter."""
+        stats = self.frame_stats
+        cm = self.collision_manager
+        lookups = rotation_cache.hits + rotation_cache.misses
+
+        gauges = {
+            "fps": stats.fps,
+            "frames_total": stats.frame_count,
+            "quality_level": self.quality.index,
+            "collision_pairs": cm.pairs_checked,
+            "collision_pairs_total": cm.pairs_checked_total + cm.pairs_checked,
+            "bullet_cancel_pairs": cm.cancel_pairs,
+            "bullets_cancelled_total": cm.bullets_cancelled,
+            "players_hp": self.players_hp,
+            "boss_hp": self.boss.hp,
+            "boss_bullets": len(self.bullet_field),
+        }
+        labeled = {
+            "frame_work_ms": {
+                ("quantile", q): stats.work_percentile(q * 100)
+                for q in (0.5, 0.9, 0.99)
+            },
+            "frame_time_ms": {
+                ("quantile", q): stats.frame_percentile(q * 100)
+                for q in (0.5, 0.9, 0.99)
+            },
+            "entities": {
+                ("group", name): len(group)
+                for name, group in self.sprite_groups.items()
+            },
+            "cache_hits_total": {("cache", "rotation"): rotation_cache.hits},
+            "cache_misses_total": {("cache", "rotation"): rotation_cache.misses},
+            "cache_hit_ratio": {
+                ("cache", "rotation"): rotation_cache.hits / lookups if lookups else 0.0
+            },
+            "cache_entries": {("cache", "rotation"): len(rotation_cache)},
+            "gc_collections_total": {
+                ("generation", generation): count
+                for generation, count in enumerate(stats.gc_collections)
+            },
+            "gc_pause_ms": {
+                ("quantile", q): stats.gc_pause_percentile(q * 100)
+                for q in (0.5, 0.99)
+            },
+            "input_latency_ms": {
+                ("quantile", q): self.input_latency.percentile(q * 100)
+                for q in (0.5, 0.95)
+            },
+            "input_poll_ms": {
+                ("quantile", q): self.input_latency.poll_percentile(q * 100)
+                for q in (0.5, 0.99)
+            },
+        }
+        self.metrics.publish(MetricsSnapshot(gauges, labeled))
+
+    def set_bots(self, player1: Bot | None = None, player2: Bot | None = None) -> None:
+        """Let bots play either player (None: keyboard).
+
+        Bot decisions run before the frame's work is timed; their cost is
+        reported by ``bot_driver.summary()``.
+        """
+        if player1 is None and player2 is None:
+            self.bot_driver = None
+        else:
+            self.bot_driver = BotDriver(player1, player2)
+
+    def enable_telemetry(self, path: str = TELEMETRY_PATH) -> None:
+        """Record every session to a SQLite file (see ``TelemetrySink``)."""
+        if self.telemetry:
+            return
+        sink = TelemetrySink(path)
+        sink.start()
+        self.telemetry = TelemetryRecorder(sink)
+
+    def enable_broadcast(self, port: int = BROADCAST_PORT) -> None:
+        """Start streaming every presented frame to spectators.
+
+        Args:
+            port: TCP port to serve on (0: pick a free port)
+        """
+        from .broadcast import Broadcaster
+
+        if self.broadcaster:
+            return
+        self.broadcaster = Broadcaster(port=port)
+        self.broadcaster.start()
+
+    def toggle_profiler(self) -> None:
+        """Start a profiler capture, or stop the running one and write it."""
+        profiler = self.profiler
+        if not profiler.running:
+            profiler.start(self._profile_labels, thread_prefixes=("simulation",))
+            print("Profiler: capturing (press F9 again to stop)")
+            return
+        profiler.stop()
+        collapsed_path, prof_path = profiler.write()
+        print(profiler.summary())
+        print(f"Profiler: wrote {collapsed_path} and {prof_path}")
+
+    def _profile_labels(self) -> tuple[str, int]:
+        """Stage and live entity count attached to profiler samples."""
+        entities = sum(map(len, self.sprite_groups.values())) + len(self.bullet_field)
+        return self.stage, entities + 3
+
+    def toggle_tracer(self) -> None:
+        """Start a timeline capture, or stop the running one and write it."""
+        tracer = self.tracer
+        if not tracer.running:
+            tracer.start()
+            for target, names in self._trace_targets():
+                tracer.instrument(target, names)
+            print("Tracer: capturing (press F10 again to stop)")
+            return
+        tracer.stop()
+        path = tracer.write()
+        print(tracer.summary())
+        print(f"Tracer: wrote {path}")
+
+    def _trace_targets(self) -> list[tuple[object, tuple[str, ...]]]:
+        """Objects and the methods of each that the tracer times."""
+        targets = [
+            (
+                self,
+                (
+                    "step",
+                    "_wait_frame",
+                    "_poll_input",
+                    "_step_result",
+                    "_present_overlay",
+                    "_advance",
+                    "_simulate",
+                    "_handle_player_attack",
+                    "_handle_player_missiles",
+                    "_steer_missiles",
+                    "_spawn_enemy_weapons",
+                    "_process_missed_enemies",
+                    "_process_offscreen_weapons",
+                    "_update_entities",
+                    "_process_collisions",
+                    "_check_game_over",
+                    "_render",
+                    "_queue_entities",
+                    "_queue_beams",
+                    "_present_pipelined",
+                    "_advance_and_capture",
+                    "_capture_frame",
+                    "_render_snapshot",
+                    "_flip",
+                    "_finish_game",
+                    "_publish_metrics",
+                ),
+            ),
+            (
+                self.spawn_manager,
+                ("spawn_enemies", "spawn_items_for_boss_hp", "spawn_items_periodic"),
+            ),
+            (
+                self.collision_manager,
+                ("begin_frame", "remove_collided_sprites", "cast_segment")
+                + tuple(name for name in dir(CollisionManager) if name.startswith("check_")),
+            ),
+            (self.boss_patterns, ("update",)),
+            (self.bullet_field, ("update", "hits", "blits")),
+            (self.enemy_grid, ("rebuild", "nearest")),
+            (self.render_queue, ("flush",)),
+            (self.renderer, ("compose",)),
+            (self.hud, ("draw",)),
+            (self.input_latency, ("on_present",)),
+            (self.quality, ("update",)),
+            (self.gc_manager, ("collect_in_slack", "collect_idle")),
+        ]
+        if self.bot_driver:
+            targets.append((self.bot_driver, ("drive",)))
+        if self.telemetry:
+            targets.append((self.telemetry, ("on_frame",)))
+        if self.broadcaster:
+            targets.append((self.broadcaster, ("publish",)))
+        return targets
+
+    def close(self) -> None:
+        """Release background resources."""
+        if self.profiler.running:
+            self.toggle_profiler()
+        if self.tracer.running:
+            self.toggle_tracer()
+        self.gc_manager.close()
+        if self.telemetry:
+            self.telemetry.end(self, self.result)
+            self.telemetry.sink.stop()
+            self.telemetry = None
+        if self.broadcaster:
+            self.broadcaster.stop()
+            self.broadcaster = None
+        if self._executor:
+            self._executor.shutdown()
+            self._executor = None
+        if self.metrics:
+            self.metrics.stop()
+            self.metrics = None
+
+    def start(self, requested_at: float | None = None) -> None:
+        """Set up a new game session.
+
+        The first call builds the world; later calls reset it in place.
+
+        Args:
+            requested_at: ``perf_counter`` time of the start request, used to
+                measure the time to the first gameplay frame (default: now)
         """
-        # Initialize game
-        self._create_entities()
-        self._create_sprite_groups()
-        self._create_managers()
+        self._start_requested_at = time.perf_counter() if requested_at is None else requested_at
+        # Close a session still open with the state it was left in
+        if self.telemetry:
+            self.telemetry.end(self, None)
+        self.result = None
+        self._restart_requested_at = None
+
+        if self._world_ready:
+            self._reset_world()
+        else:
+            self._create_entities()
+            self._create_sprite_groups()
+            self._create_managers()
+            self._world_ready = True
+            # Assets, caches and the world live as long as the game
+            self.gc_manager.freeze()
+        self.spawn_manager.reset(self.seed)
         self._reset_game_state()
+        self._reset_pause()
+        self.frame_stats.reset()
+        self.input_latency.reset()
+        self.input_latency.lag = 1 if self.pipelined else 0
+        self._snapshot = None
+        self.input_manager.release_all()
+        if self.bot_driver:
+            self.bot_driver.reset()
+        bots = self.bot_driver.bots if self.bot_driver else (None, None)
+        self.input_manager.polled = [bot is None for bot in bots]
+        if self.telemetry:
+            self.telemetry.begin(self)
+        self.gc_manager.begin()
+        self.clock.tick()
+        self.quality.apply()
 
         # Start music
         audio.play_music()
 
-        # Create HUD
-        hud = HUD(self.default_font)
-
         self.running = True
-        while self.running:
-            # Calculate elapsed time
-            now = datetime.now().replace(microsecond=0)
-            elapsed_time = now - self.start_time
-
-            # Handle input
-            for event in pygame.event.get():
-                if self.input_manager.handle_event(event):
+
+    def _poll_input(self) -> None:
+        """Handle pending events, then sample and apply player input.
+
+        Player input is read from the devices after the event queue is
+        drained, right before the frame is simulated.
+        """
+        sampled_at = time.perf_counter()
+        events = pygame.event.get()
+        for event in events:
+            if self.actions.handle_event(event):
+                continue
+            if self.result:
+                self._handle_result_event(event, sampled_at)
+                continue
+            if self._handle_pause_event(event):
+                continue
+            if self.paused:
+                # Gameplay input is dropped while paused
+                if event.type == pygame.QUIT:
                     self.running = False
+                continue
+            if self.input_manager.handle_event(event):
+                self.running = False
 
-            # Handle player attacks
-            self._handle_player_attack(self.player1, self.player1_weapons)
-            self._handle_player_attack(self.player2, self.player2_weapons)
+        if not (self.result or self.paused):
+            for player, previous, bits in self.input_manager.poll():
+                self.input_latency.on_input(player, previous, bits, sampled_at)
+        self.input_latency.on_poll((time.perf_counter() - sampled_at) * 1000, len(events))
+
+    def _simulate(self) -> None:
+        """Advance the world by one frame."""
+        # Handle player attacks
+        self._handle_player_attack(self.player1, self.player1_weapons)
+        self._handle_player_attack(self.player2, self.player2_weapons)
+        self._handle_player_missiles(self.player1, self.player1_missiles)
+        self._handle_player_missiles(self.player2, self.player2_missiles)
+
+        # Update attack counters
+        self.player1.state.update_counters()
+        self.player2.state.update_counters()
+
+        # Spawn enemies
+        self.spawn_manager.spawn_enemies(
+            self.enemy1s,
+            self.enemy2s,
+            self.shot_count,
+            self.enemy_level,
+            ENEMY_SPAWN_PROBABILITY,
+        )
 
-            # Update attack counters
-            self.player1.state.update_counters()
-            self.player2.state.update_counters()
+        # Spawn items based on boss HP
+        if self.spawn_manager.spawn_items_for_boss_hp(
+            self.boss.hp,
+            self.heal_items,
+            self.weapon_power_items,
+            self.weapon_speed_items,
+            self.weapon_number_items,
+        ):
+            self.enemy_level += 1
+
+        # Spawn items periodically
+        self.spawn_manager.spawn_items_periodic(
+            self.heal_items,
+            self.weapon_power_items,
+            self.weapon_speed_items,
+            self.weapon_number_items,
+            self.weapon_missile_items,
+            self.weapon_beam_items,
+        )
 
-            # Draw background
-            self.screen.blit(self.background, self.background.get_rect())
+        # Spawn enemy weapons
+        self._spawn_enemy_weapons()
+        self.enemy_attack_counter += 1
 
-            # Spawn enemies
-            self.spawn_manager.spawn_enemies(
-                self.enemy1s,
-                self.enemy2s,
-                self.shot_count,
-                self.enemy_level,
-                ENEMY_SPAWN_PROBABILITY,
-            )
+        # Fire the boss's patterns
+        self.boss_patterns.update(
+            self.boss, (self.player1, self.player2), self.bullet_field
+        )
 
-            # Draw HUD
-            hud.draw(
-                self.screen,
-                self.shot_count,
-                self.count_missed,
-                elapsed_time,
-                self.players_hp,
-                self.boss.hp,
-                self.enemy_level,
-            )
+        # Process missed enemies and offscreen weapons
+        self._process_missed_enemies()
+        self._process_offscreen_weapons()
 
-            # Spawn items based on boss HP
-            if self.spawn_manager.spawn_items_for_boss_hp(
-                self.boss.hp,
-                self.heal_items,
-                self.weapon_power_items,
-                self.weapon_speed_items,
-                self.weapon_number_items,
-            ):
-                self.enemy_level += 1
+        # Update entities
+        self._update_entities()
 
-            # Spawn items periodically
-            self.spawn_manager.spawn_items_periodic(
-                self.heal_items,
-                self.weapon_power_items,
-                self.weapon_speed_items,
-                self.weapon_number_items,
-            )
+    def _queue_explosion(
+        self, surface: pygame.Surface, x: int, y: int, width: int, height: int
+    ) -> None:
+        """Queue an explosion effect for this frame's render pass."""
+        if self.muted:
+            return
+        try:
+            image = get_explosion_image(width, height)
+        except pygame.error:
+            return
+        self.render_queue.add(Layer.EFFECTS, image, (x, y))
+        audio.play_sound("explosion")
 
-            # Spawn enemy weapons
-            self._spawn_enemy_weapons()
-            self.enemy_attack_counter += 1
+    def _item_pickup(self) -> None:
+        """Play the item pickup sound."""
+        if not self.muted:
+            occur_get_item()
 
-            # Process missed enemies and offscreen weapons
-            self._process_missed_enemies()
-            self._process_offscreen_weapons()
+    def _render(self) -> None:
+        """Draw the current world state to the screen.
 
-            # Update and draw entities
-            self._update_entities()
-            self._draw_entities()
+        The scene goes through the renderer at the internal resolution; the
+        HUD is drawn after the upscale so text stays sharp.
+        """
+        self.stage = "render"
+        self.render_queue.add(Layer.BACKGROUND, self.background, (0, 0))
+        self._queue_entities()
+        self.render_queue.flush(self.renderer)
+        self.renderer.compose()
+
+        # Draw HUD
+        self.hud.draw(self.screen, *self._hud_values())
+
+    def _hud_values(self) -> tuple:
+        """Current HUD arguments (after the target surface)."""
+        return (
+            self.shot_count,
+            self.count_missed,
+            timedelta(seconds=int(self.elapsed_seconds)),
+            self.players_hp,
+            self.boss.hp,
+            self.enemy_level,
+        )
 
-            pygame.display.flip()
+    def _capture_frame(self) -> FrameSnapshot:
+        """Detach the current world state as an immutable frame snapshot."""
+        self.render_queue.add(Layer.BACKGROUND, self.background, (0, 0))
+        self._queue_entities()
+        return FrameSnapshot(self.render_queue.take(), self._hud_values())
 
-            # Process collisions
-            self._process_collisions()
+    def _render_snapshot(self, snapshot: FrameSnapshot) -> None:
+        """Draw a frame snapshot; touches no live world state."""
+        RenderQueue.submit(snapshot.layers, self.renderer)
+        self.renderer.compose()
+        self.hud.draw(self.screen, *snapshot.hud)
 
-            # Check game over
-            result = self._check_game_over()
-            if result:
-                audio.stop_music()
-                pygame.display.update()
+    def _advance(self) -> str | None:
+        """Simulate and collide one frame.
 
-                if result == "gameover":
-                    audio.play_sound("gameover")
-                else:
-                    audio.play_sound("gameclear")
+        Returns:
+            The game result if the frame ended the game, None otherwise
+        """
+        self.stage = "simulate"
+        self.collision_manager.begin_frame()
+        self._simulate()
+        self.stage = "collide"
+        self._process_collisions()
+        return self._check_game_over()
 
-                pygame.time.wait(1000)
-                self.running = False
+    def simulate_frame(self, player1_bits: int, player2_bits: int) -> str | None:
+        """Advance one frame driven by per-frame input bits.
+
+        Used instead of keyboard events where every frame's input has to be
+        known and replayable (netplay). See ``InputManager.apply_bits``.
+
+        Returns:
+            The game result if the frame ended the game, None otherwise
+        """
+        manager = self.input_manager
+        manager.apply_bits(self.player1, player1_bits, self.input_bits[0])
+        manager.apply_bits(self.player2, player2_bits, self.input_bits[1])
+        self.input_bits = (player1_bits, player2_bits)
+        return self._advance()
+
+    def present(self) -> None:
+        """Draw the current world state and flip the display."""
+        self._render()
+        self._flip()
+
+    def _wait_frame(self) -> int:
+        """Sleep in the frame limiter.
+
+        Returns:
+            Milliseconds since the previous call
+        """
+        self.stage = "wait"
+        return self.clock.tick(PAUSED_FPS if self.paused else self.fps_limit)
+
+    def _flip(self) -> float:
+        """Present the drawn frame.
+
+        Returns:
+            ``perf_counter`` time right after the flip
+        """
+        self.stage = "present"
+        pygame.display.flip()
+        return time.perf_counter()
+
+    def _advance_and_capture(self) -> tuple[str | None, FrameSnapshot]:
+        """Worker job of the pipelined loop."""
+        result = self._advance()
+        return result, self._capture_frame()
+
+    def _present_pipelined(self) -> tuple[str | None, float]:
+        """Simulate the next frame on the worker while drawing the last one.
+
+        The world is only touched by the worker while its job runs; the main
+        thread draws the previous snapshot and waits for the job before the
+        frame ends, so no state is shared between running stages. Explosions
+        queued during the worker's collisions go into its snapshot. Both
+        threads write ``stage``; profiler samples of the worker carry a
+        thread label.
+
+        Returns:
+            The result of the simulated frame and the present time
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="simulation"
+            )
+        if self._snapshot is None:
+            self._snapshot = self._capture_frame()
+
+        job = self._executor.submit(self._advance_and_capture)
+        self.stage = "render"
+        self._render_snapshot(self._snapshot)
+        presented_at = self._flip()
+        self.stage = "sync"
+        result, self._snapshot = job.result()
+        return result, presented_at
+
+    def _finish_game(self, result: str) -> None:
+        """Play the result sound and switch to the result screen.
+
+        The result screen runs inside the game loop: it stays up for
+        ``RESULT_SCREEN_MS`` without blocking, and Enter restarts at once.
+        """
+        audio.stop_music()
+        if self.telemetry:
+            self.telemetry.end(self, result)
+
+        if result == "gameover":
+            audio.play_sound("gameover")
+            title = "GAME OVER"
+        else:
+            audio.play_sound("gameclear")
+            title = "GAME CLEAR"
+
+        self.result = result
+        self._result_until = time.perf_counter() + RESULT_SCREEN_MS / 1000
+        self._overlay = self._compose_overlay(title, "PRESS ENTER TO PLAY AGAIN")
+        self._overlay_dirty = True
+
+    def _step_result(self) -> None:
+        """Show the result screen and restart or leave when it is done."""
+        self._present_overlay()
+        if self._restart_requested_at is not None:
+            self.start(self._restart_requested_at)
+        elif time.perf_counter() >= self._result_until:
+            self.running = False
+
+    def step(self) -> bool:
+        """Run one frame of the game loop.
+
+        The frame limiter sleeps first so input is sampled as late as
+        possible; the sampled input is then simulated, collided, rendered and
+        presented within the same frame. In pipelined mode the frame shown is
+        the one simulated in the previous iteration (see
+        ``_present_pipelined``).
+
+        While paused the loop runs at ``PAUSED_FPS`` and only handles events;
+        nothing is simulated and paused frames are not recorded. The same
+        holds for the result screen, which runs at the normal rate.
 
-            # Maintain FPS
-            self.clock.tick(FPS)
+        Returns:
+            True while the game keeps running
+        """
+        # Maintain FPS before sampling input
+        frame_ms = self._wait_frame()
+        if self.bot_driver and not (self.paused or self.result):
+            # Before frame work is timed: bot cost is reported separately
+            self.bot_driver.drive(self)
+        frame_start = time.perf_counter()
+
+        self.stage = "input"
+        self._poll_input()
+        if self.result:
+            self._step_result()
+            self.gc_manager.collect_idle()
+            return self.running
+        if self.paused:
+            self._present_overlay()
+            self.gc_manager.collect_idle()
+            return self.running
+
+        if self.pipelined:
+            result, presented_at = self._present_pipelined()
+        else:
+            result = self._advance()
+            self._render()
+            presented_at = self._flip()
+        self.stage = "stats"
+        self.input_latency.on_present(self.frame_stats.frame_count, presented_at)
+        if self.broadcaster:
+            self.stage = "broadcast"
+            self.broadcaster.publish(self)
+
+        if self._start_requested_at is not None:
+            self.start_ms.append((presented_at - self._start_requested_at) * 1000)
+            self._start_requested_at = None
+
+        # In pipelined mode this includes waiting for the worker
+        work_ms = (time.perf_counter() - frame_start) * 1000
+
+        if self.telemetry:
+            self.telemetry.on_frame(self, work_ms, frame_ms)
+        if result:
+            self._finish_game(result)
+
+        self.frame_stats.record(work_ms, frame_ms)
+        self.quality.update(self.frame_stats)
+
+        if (
+            self.metrics
+            and self.frame_stats.frame_count % METRICS_PUBLISH_INTERVAL == 0
+        ):
+            self._publish_metrics()
+
+        # Collect in the slack before the next frame's limiter sleep
+        self.gc_manager.collect_in_slack(work_ms)
+
+        return self.running
+
+    def run(self, requested_at: float | None = None) -> str:
+        """Run the game loop.
+
+        Args:
+            requested_at: ``perf_counter`` time of the menu's start press,
+                passed on to ``start``
+
+        Returns:
+            Next game state ("game_menu")
+        """
+        self.start(requested_at)
+        while self.step():
+            pass
+        if self.telemetry:
+            self.telemetry.end(self, self.result)
+        self._reset_pause()
+        self.gc_manager.end()
+        self.stage = "idle"
+        if self.profiler.running:
+            self.toggle_profiler()
+        if self.tracer.running:
+            self.toggle_tracer()
 
         return "game_menu"
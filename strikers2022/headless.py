@@ -0,0 +1,156 @@
+"""Headless runner for benchmarks and soak runs.
+
+Runs the game loop without a visible window, audio or frame limiter:
+
+    python -m strikers2022.headless --frames 3600 --memory-report
+    python -m strikers2022.headless --bot1 dodge --bot2 items
+"""
+
+import argparse
+import os
+import time
+
+
+def init_pygame():
+    """Initialize pygame with dummy video and audio drivers.
+
+    Returns:
+        The display surface
+    """
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+    import pygame
+    from .config import WINDOW_WIDTH, WINDOW_HEIGHT
+
+    pygame.init()
+    try:
+        pygame.mixer.init()
+    except pygame.error:
+        pass
+    return pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    from .bots import BOTS
+    from .config import TELEMETRY_PATH
+
+    parser = argparse.ArgumentParser(description="Run STRIKERS 2022 headless.")
+    parser.add_argument("--frames", type=int, default=3600, help="frames to simulate")
+    parser.add_argument("--seed", type=int, default=None, help="random seed")
+    parser.add_argument(
+        "--memory-report",
+        action="store_true",
+        help="print entity memory usage at the end of the run",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="simulate on a worker thread while rendering (default: PIPELINE_ENABLED)",
+    )
+    parser.add_argument(
+        "--broadcast",
+        action="store_true",
+        help="stream frames to spectators (python -m strikers2022.broadcast)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="sample the whole run and write a profile (PROFILER_OUTPUT_DIR)",
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="record a timeline of the run's last spans (TRACE_OUTPUT_DIR)",
+    )
+    parser.add_argument(
+        "--telemetry",
+        nargs="?",
+        const=TELEMETRY_PATH,
+        default=None,
+        metavar="PATH",
+        help=f"record the session to SQLite (default file: {TELEMETRY_PATH})",
+    )
+    for index in (1, 2):
+        parser.add_argument(
+            f"--bot{index}",
+            choices=BOTS,
+            default=None,
+            help=f"let a bot play player {index}",
+        )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+
+    screen = init_pygame()
+
+    import pygame
+    from .game import Game
+    from .bots import create_bot
+    from .diagnostics import entity_memory_report, format_memory_report
+    from .managers import filter_events
+
+    filter_events()
+    game = Game(screen)
+    game.fps_limit = 0
+    game.seed = args.seed
+    if args.pipeline is not None:
+        game.pipelined = args.pipeline
+    if args.broadcast:
+        game.enable_broadcast()
+    if args.telemetry:
+        game.enable_telemetry(args.telemetry)
+    bots = [
+        create_bot(name, None if args.seed is None else args.seed + index) if name else None
+        for index, name in enumerate((args.bot1, args.bot2))
+    ]
+    if any(bots):
+        game.set_bots(*bots)
+    game.start()
+    if args.profile:
+        game.toggle_profiler()
+    if args.trace:
+        game.toggle_tracer()
+
+    start = time.perf_counter()
+    frames = 0
+    while frames < args.frames and game.step():
+        frames += 1
+        if game.result:
+            break
+    elapsed = time.perf_counter() - start
+    if game.profiler.running:
+        game.toggle_profiler()
+    if game.tracer.running:
+        game.toggle_tracer()
+
+    stats = game.frame_stats
+    print(f"frames: {frames}  wall: {elapsed:.2f} s  ({frames / elapsed:.0f} frames/s)")
+    print(
+        f"frame work ms  p50: {stats.work_percentile(50):.2f}  "
+        f"p90: {stats.work_percentile(90):.2f}  p99: {stats.work_percentile(99):.2f}"
+    )
+    print(f"kills: {game.shot_count}  missed: {game.count_missed}  boss hp: {game.boss.hp}")
+    print(game.input_latency.summary())
+    print(stats.gc_summary())
+    if game.bot_driver:
+        print(game.bot_driver.summary())
+    if game.broadcaster:
+        print(game.broadcaster.summary())
+    telemetry = game.telemetry
+
+    if args.memory_report:
+        print()
+        print(format_memory_report(entity_memory_report(game.live_entities())))
+
+    game.close()
+    if telemetry:
+        print(telemetry.sink.summary())
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Package exports imported on first use (PEP 562)."""
+
+import importlib
+
+
+def lazy_exports(package: str, exports: dict[str, str]):
+    """Module ``__getattr__`` and ``__dir__`` for a package's lazy exports.
+
+    A package assigns both to its module globals; each exported name is
+    imported from its submodule the first time it is looked up (as an
+    attribute or through ``from package import name``) and then cached in
+    the package like an eager import.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Exported name -> relative submodule that defines it
+
+    Returns:
+        ``(__getattr__, __dir__)``
+    """
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str):
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
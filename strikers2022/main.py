@@ -1,15 +1,59 @@
-"""Main entry point for STRIKERS 2022."""
+"""Main entry point for STRIKERS 2022.
 
-import pygame
+Boot-to-menu time matters on cabinets, so ``boot`` only imports and
+initializes what the menu needs. The game modules are imported and the
+game is built after the first menu frame is on screen (``load_game``).
+"""
 
-from .config import WINDOW_WIDTH, WINDOW_HEIGHT
-from .game import Game
-from .ui import GameMenu
+import os
+import sys
+import time
 
 
-def main() -> None:
-    """Main function to run the game."""
-    pygame.init()
+def _skip_pkg_resources() -> bool:
+    """Keep pygame from importing ``pkg_resources`` at startup.
+
+    ``pygame.pkgdata`` tries it first to locate pygame's bundled font and
+    falls back to pygame's own directory when it is missing; the import
+    alone takes about 100 ms. Only done if nothing imported it yet.
+
+    Returns:
+        Whether the import was blocked (undo with ``_allow_pkg_resources``
+        once pygame is imported)
+    """
+    if "pkg_resources" in sys.modules:
+        return False
+    sys.modules["pkg_resources"] = None
+    return True
+
+
+def _allow_pkg_resources() -> None:
+    """Let later code import ``pkg_resources`` again."""
+    if "pkg_resources" in sys.modules and sys.modules["pkg_resources"] is None:
+        del sys.modules["pkg_resources"]
+
+
+def _mark(marks: list[tuple[str, float]] | None, name: str) -> None:
+    """Record the end of a boot phase (``time.time``, for other processes)."""
+    if marks is not None:
+        marks.append((name, time.time()))
+
+
+def init_subsystems():
+    """Initialize only the SDL subsystems the game uses.
+
+    ``pygame.init`` also starts every other auto-initialized module (game
+    controllers and whatever else the pygame build includes).
+
+    Returns:
+        The display surface
+    """
+    import pygame
+    from .config import WINDOW_WIDTH, WINDOW_HEIGHT
+
+    pygame.display.init()
+    pygame.font.init()
+    pygame.joystick.init()
 
     # Try to initialize mixer (may fail in some environments like WSL)
     try:
@@ -19,9 +63,62 @@ def main() -> None:
 
     screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
     pygame.display.set_caption("STRIKERS 2022")
+    return screen
+
+
+def boot(marks: list[tuple[str, float]] | None = None):
+    """Bring up the window and present the first menu frame.
+
+    Args:
+        marks: If given, (phase, end time) of every boot phase is appended
+
+    Returns:
+        (screen, menu, action map)
+    """
+    os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+    blocked = _skip_pkg_resources()
+    try:
+        import pygame  # noqa: F401
+    finally:
+        if blocked:
+            _allow_pkg_resources()
+
+    _mark(marks, "import pygame")
+    from .managers import ActionMap, filter_events
+    from .ui import GameMenu
+
+    _mark(marks, "import menu")
+    screen = init_subsystems()
+    filter_events()
+    _mark(marks, "init")
+    actions = ActionMap.load()
+    menu = GameMenu(screen, actions)
+    _mark(marks, "menu assets")
+    menu.draw()
+    _mark(marks, "menu shown")
+    return screen, menu, actions
+
+
+def load_game(screen, actions, marks: list[tuple[str, float]] | None = None):
+    """Import the game modules and build the game (after the menu is shown).
+
+    Returns:
+        The game
+    """
+    from .game import Game
+
+    _mark(marks, "import game")
+    game = Game(screen, actions)
+    _mark(marks, "game built")
+    return game
+
+
+def main() -> None:
+    """Main function to run the game."""
+    screen, menu, actions = boot()
+    game = load_game(screen, actions)
 
-    menu = GameMenu(screen)
-    game = Game(screen)
+    import pygame
 
     action = "game_menu"
 
@@ -30,8 +127,10 @@ def main() -> None:
             menu.draw()
             action = menu.handle_events()
         elif action == "play":
-            action = game.run()
+            action = game.run(menu.start_requested_at)
+            menu.invalidate()
 
+    game.close()
     pygame.quit()
 
 
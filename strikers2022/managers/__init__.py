@@ -1,6 +1,43 @@
-"""Manager classes module."""
+"""Manager classes module.
 
-from .input_manager import InputManager
-from .collision_manager import CollisionManager
-from .spawn_manager import SpawnManager
-from .audio_manager import AudioManager, audio, occur_explosion, occur_get_item
+Exports are imported on first use, so the menu can take ``ActionMap``
+without loading the other managers and the entities behind them.
+"""
+
+from typing import TYPE_CHECKING
+
+from ..lazy_exports import lazy_exports
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "ActionMap": ".action_map",
+        "filter_events": ".action_map",
+        "InputManager": ".input_manager",
+        "CollisionManager": ".collision_manager",
+        "SpawnManager": ".spawn_manager",
+        "AudioManager": ".audio_manager",
+        "audio": ".audio_manager",
+        "get_explosion_image": ".audio_manager",
+        "occur_explosion": ".audio_manager",
+        "occur_get_item": ".audio_manager",
+        "QualityManager": ".quality_manager",
+        "QualityLevel": ".quality_manager",
+        "GCManager": ".gc_manager",
+    },
+)
+
+if TYPE_CHECKING:
+    from .action_map import ActionMap, filter_events
+    from .input_manager import InputManager
+    from .collision_manager import CollisionManager
+    from .spawn_manager import SpawnManager
+    from .audio_manager import (
+        AudioManager,
+        audio,
+        get_explosion_image,
+        occur_explosion,
+        occur_get_item,
+    )
+    from .quality_manager import QualityManager, QualityLevel
+    from .gc_manager import GCManager
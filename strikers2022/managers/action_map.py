@@ -0,0 +1,254 @@
+"""Rebindable keyboard and joystick bindings for player and system actions."""
+
+import json
+import os
+
+import pygame
+
+from ..config import (
+    KEY_BINDINGS,
+    JOYSTICK_BINDINGS,
+    SYSTEM_KEY_BINDINGS,
+    SYSTEM_BUTTON_BINDINGS,
+    JOYSTICK_DEADZONE,
+    INPUT_BINDINGS_FILE,
+)
+
+# Per-frame input bits (netplay, replays and bots)
+LEFT = 1
+RIGHT = 2
+UP = 4
+DOWN = 8
+ATTACK = 16
+
+ACTIONS = {"left": LEFT, "right": RIGHT, "up": UP, "down": DOWN, "attack": ATTACK}
+
+# Event types the menu and the game handle. Gameplay input is read as
+# device state, so key releases, stick and mouse motion and text input
+# never need to be queued.
+HANDLED_EVENTS = (
+    pygame.QUIT,
+    pygame.KEYDOWN,
+    pygame.JOYBUTTONDOWN,
+    pygame.JOYDEVICEADDED,
+    pygame.JOYDEVICEREMOVED,
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWSIZECHANGED,
+    pygame.WINDOWFOCUSLOST,
+    pygame.WINDOWFOCUSGAINED,
+    pygame.WINDOWMINIMIZED,
+    pygame.WINDOWHIDDEN,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSHOWN,
+)
+
+
+def filter_events() -> None:
+    """Keep every event type but ``HANDLED_EVENTS`` off the event queue.
+
+    SDL still updates keyboard and joystick state for blocked events; they
+    are dropped before they are queued, so ``pygame.event.get`` only
+    converts events somebody handles.
+    """
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed(HANDLED_EVENTS)
+
+
+class ActionMap:
+    """Maps keys and joystick inputs to player actions and system actions.
+
+    Player actions (``ACTIONS``) are sampled as state once per frame by
+    ``sample``; system actions ("pause", "start") are matched against
+    key and button press events by ``matches``. Bindings are kept by name
+    (pygame key names, button numbers) so they can be saved and loaded as
+    JSON, and resolved to key codes whenever they change.
+
+    Joysticks are opened as they connect and fill the first free player
+    slot; a player's stick and hat always move them, their bound buttons
+    do the rest.
+    """
+
+    def __init__(
+        self,
+        keys=KEY_BINDINGS,
+        buttons=JOYSTICK_BINDINGS,
+        system_keys=SYSTEM_KEY_BINDINGS,
+        system_buttons=SYSTEM_BUTTON_BINDINGS,
+        deadzone: float = JOYSTICK_DEADZONE,
+    ):
+        self.keys = [{action: list(names) for action, names in player.items()} for player in keys]
+        self.buttons = [
+            {action: list(numbers) for action, numbers in player.items()} for player in buttons
+        ]
+        self.system_keys = {action: list(names) for action, names in system_keys.items()}
+        self.system_buttons = {action: list(numbers) for action, numbers in system_buttons.items()}
+        self.deadzone = deadzone
+        # Per player slot: (joystick, axes, hats, buttons) or None
+        self.joysticks: list[tuple[pygame.joystick.JoystickType, int, int, int] | None] = [None, None]
+        self._resolve()
+        if pygame.joystick.get_init():
+            for index in range(pygame.joystick.get_count()):
+                self.add_joystick(index)
+
+    @classmethod
+    def load(cls, path: str = INPUT_BINDINGS_FILE) -> "ActionMap":
+        """Bindings saved at ``path``, or the defaults if there is no file."""
+        if not os.path.exists(path):
+            return cls()
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return cls(
+            data.get("keys", KEY_BINDINGS),
+            data.get("buttons", JOYSTICK_BINDINGS),
+            data.get("system_keys", SYSTEM_KEY_BINDINGS),
+            data.get("system_buttons", SYSTEM_BUTTON_BINDINGS),
+            data.get("deadzone", JOYSTICK_DEADZONE),
+        )
+
+    def save(self, path: str = INPUT_BINDINGS_FILE) -> None:
+        """Write the current bindings as JSON (read back by ``load``)."""
+        data = {
+            "keys": self.keys,
+            "buttons": self.buttons,
+            "system_keys": self.system_keys,
+            "system_buttons": self.system_buttons,
+            "deadzone": self.deadzone,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+
+    def bind_key(self, player: int, action: str, name: str) -> None:
+        """Bind a key (by pygame name) to an action of player 1 or 2.
+
+        The key is taken off any other player action first, so one key
+        never drives two actions.
+        """
+        if action not in ACTIONS:
+            raise ValueError(f"unknown action {action!r}")
+        pygame.key.key_code(name)  # Raises ValueError for unknown names
+        for bindings in self.keys:
+            for names in bindings.values():
+                if name in names:
+                    names.remove(name)
+        self.keys[player - 1].setdefault(action, []).append(name)
+        self._resolve()
+
+    def bind_button(self, player: int, action: str, button: int) -> None:
+        """Bind a joystick button to an action of player 1 or 2 (their own stick)."""
+        if action not in ACTIONS:
+            raise ValueError(f"unknown action {action!r}")
+        bindings = self.buttons[player - 1]
+        for numbers in bindings.values():
+            if button in numbers:
+                numbers.remove(button)
+        bindings.setdefault(action, []).append(button)
+        self._resolve()
+
+    def _resolve(self) -> None:
+        """Turn the bindings into (code, bit) lists for sampling."""
+        self._key_bits = [
+            [
+                (pygame.key.key_code(name), ACTIONS[action])
+                for action, names in bindings.items()
+                for name in names
+            ]
+            for bindings in self.keys
+        ]
+        self._button_bits = [
+            [(button, ACTIONS[action]) for action, numbers in bindings.items() for button in numbers]
+            for bindings in self.buttons
+        ]
+        self._system_key_codes = {
+            action: {pygame.key.key_code(name) for name in names}
+            for action, names in self.system_keys.items()
+        }
+
+    def add_joystick(self, device_index: int) -> None:
+        """Open a connected joystick and give it the first free player slot."""
+        joystick = pygame.joystick.Joystick(device_index)
+        instance_id = joystick.get_instance_id()
+        if any(slot and slot[0].get_instance_id() == instance_id for slot in self.joysticks):
+            return
+        if None in self.joysticks:
+            slot = (
+                joystick,
+                joystick.get_numaxes(),
+                joystick.get_numhats(),
+                joystick.get_numbuttons(),
+            )
+            self.joysticks[self.joysticks.index(None)] = slot
+
+    def remove_joystick(self, instance_id: int) -> None:
+        """Free the slot of a disconnected joystick."""
+        for index, slot in enumerate(self.joysticks):
+            if slot and slot[0].get_instance_id() == instance_id:
+                self.joysticks[index] = None
+
+    def handle_event(self, event: pygame.event.Event) -> bool:
+        """Track joystick hotplug.
+
+        Returns:
+            True if the event was a device event
+        """
+        if event.type == pygame.JOYDEVICEADDED:
+            self.add_joystick(event.device_index)
+            return True
+        if event.type == pygame.JOYDEVICEREMOVED:
+            self.remove_joystick(event.instance_id)
+            return True
+        return False
+
+    def matches(self, event: pygame.event.Event, action: str) -> bool:
+        """True if ``event`` presses a key or button bound to a system action."""
+        if event.type == pygame.KEYDOWN:
+            return event.key in self._system_key_codes.get(action, ())
+        if event.type == pygame.JOYBUTTONDOWN:
+            return event.button in self.system_buttons.get(action, ())
+        return False
+
+    def sample(self, pressed) -> tuple[int, int]:
+        """Both players' input bits from the current device state.
+
+        Args:
+            pressed: Keyboard state, as from ``pygame.key.get_pressed()``
+
+        Returns:
+            Input bits of player 1 and player 2
+        """
+        deadzone = self.deadzone
+        result = []
+        for key_bits, button_bits, slot in zip(self._key_bits, self._button_bits, self.joysticks):
+            bits = 0
+            for key, bit in key_bits:
+                if pressed[key]:
+                    bits |= bit
+            if slot:
+                joystick, axes, hats, buttons = slot
+                if axes >= 2:
+                    x = joystick.get_axis(0)
+                    y = joystick.get_axis(1)
+                    if x < -deadzone:
+                        bits |= LEFT
+                    elif x > deadzone:
+                        bits |= RIGHT
+                    if y < -deadzone:
+                        bits |= UP
+                    elif y > deadzone:
+                        bits |= DOWN
+                if hats:
+                    # Hat y points up
+                    x, y = joystick.get_hat(0)
+                    if x < 0:
+                        bits |= LEFT
+                    elif x > 0:
+                        bits |= RIGHT
+                    if y > 0:
+                        bits |= UP
+                    elif y < 0:
+                        bits |= DOWN
+                for button, bit in button_bits:
+                    if button < buttons and joystick.get_button(button):
+                        bits |= bit
+            result.append(bits)
+        return result[0], result[1]
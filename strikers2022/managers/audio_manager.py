@@ -2,6 +2,7 @@
 
 import pygame
 from ..config import assets
+from ..utils import load_image
 
 
 class AudioManager:
@@ -20,6 +21,7 @@ class AudioManager:
             return
 
         self._sounds: dict[str, pygame.mixer.Sound] = {}
+        self._music_file: str | None = None
         self._initialized = True
 
     def load_sounds(self) -> None:
@@ -42,18 +44,44 @@ class AudioManager:
         if name in self._sounds:
             self._sounds[name].play()
 
-    def play_music(self, loop: bool = True) -> None:
-        """Play background music."""
+    def play_music(self, loop: bool = True, filename: str = "bgm.wav") -> None:
+        """Play background music from the start.
+
+        The track is only loaded from disk when it changes; replaying the
+        loaded track rewinds it.
+        """
         try:
-            pygame.mixer.music.load(assets.get_music("bgm.wav"))
+            if self._music_file != filename:
+                pygame.mixer.music.load(assets.get_music(filename))
+                self._music_file = filename
             pygame.mixer.music.play(-1 if loop else 0)
         except pygame.error:
+            self._music_file = None
             print("Warning: Could not load background music")
 
     def stop_music(self) -> None:
         """Stop background music."""
+        if not pygame.mixer.get_init():
+            return
         pygame.mixer.music.stop()
 
+    def pause(self) -> None:
+        """Pause background music and all playing sound effects.
+
+        Does nothing when the mixer could not be initialized.
+        """
+        if not pygame.mixer.get_init():
+            return
+        pygame.mixer.music.pause()
+        pygame.mixer.pause()
+
+    def resume(self) -> None:
+        """Resume audio paused by ``pause``."""
+        if not pygame.mixer.get_init():
+            return
+        pygame.mixer.music.unpause()
+        pygame.mixer.unpause()
+
     def get_sound(self, name: str) -> pygame.mixer.Sound | None:
         """Get a sound by name."""
         return self._sounds.get(name)
@@ -62,6 +90,18 @@ class AudioManager:
 # Global instance
 audio = AudioManager()
 
+# Scaled explosion images, keyed by size
+_explosion_cache: dict[tuple[int, int], pygame.Surface] = {}
+
+
+def get_explosion_image(xsize: int, ysize: int) -> pygame.Surface:
+    """Get the explosion image scaled to the given size (cached)."""
+    explosion_image = _explosion_cache.get((xsize, ysize))
+    if explosion_image is None:
+        explosion_image = load_image("explosion.png", (xsize, ysize))
+        _explosion_cache[(xsize, ysize)] = explosion_image
+    return explosion_image
+
 
 def occur_explosion(
     surface: pygame.Surface, x: int, y: int, xsize: int, ysize: int
@@ -71,10 +111,7 @@ def occur_explosion(
     This function maintains compatibility with the original API.
     """
     try:
-        explosion_image = pygame.image.load(
-            assets.get_image("explosion.png")
-        ).convert_alpha()
-        explosion_image = pygame.transform.scale(explosion_image, (xsize, ysize))
+        explosion_image = get_explosion_image(xsize, ysize)
         explosion_rect = explosion_image.get_rect()
         explosion_rect.x = x
         explosion_rect.y = y
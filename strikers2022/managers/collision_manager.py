@@ -1,8 +1,12 @@
 """Collision handling manager."""
 
+import math
+import numpy as np
 import pygame
 from ..entities import Player, Boss, ItemType
+from ..patterns import BulletField
 from ..config import HEAL_AMOUNT
+from ..utils import overlapping_pairs, segment_vs_mask, segment_vs_rects
 
 
 class CollisionManager:
@@ -24,21 +28,181 @@ class CollisionManager:
         self._explosion_func = None
         self._get_item_func = None
 
+        # Quality knobs (adjusted by the quality governor)
+        self.bullet_collide = pygame.sprite.collide_mask
+        self.max_explosions: int | None = None
+        self._explosions_this_frame = 0
+
+        # Candidate pairs handed to a collision test
+        self.pairs_checked = 0
+        self.pairs_checked_total = 0
+
+        # Bullet cancellation: candidate pairs this frame, bullets cancelled in the game
+        self.cancel_pairs = 0
+        self.bullets_cancelled = 0
+
     def set_effects(self, explosion_func, get_item_func) -> None:
         """Set effect callback functions."""
         self._explosion_func = explosion_func
         self._get_item_func = get_item_func
 
+    def set_bullet_mask_collision(self, enabled: bool) -> None:
+        """Use pixel masks (True) or bounding rects (False) for bullets."""
+        if enabled:
+            self.bullet_collide = pygame.sprite.collide_mask
+        else:
+            self.bullet_collide = pygame.sprite.collide_rect
+
+    def reset(self) -> None:
+        """Clear counters for a new game."""
+        self._explosions_this_frame = 0
+        self.pairs_checked = 0
+        self.pairs_checked_total = 0
+        self.cancel_pairs = 0
+        self.bullets_cancelled = 0
+
+    def begin_frame(self) -> None:
+        """Reset per-frame effect budgets and counters."""
+        self._explosions_this_frame = 0
+        self.pairs_checked_total += self.pairs_checked
+        self.pairs_checked = 0
+        self.cancel_pairs = 0
+
+    def _crash(self, sprite, group: pygame.sprite.Group, collided=None):
+        """Count candidate pairs and run ``sprite.crash`` against ``group``."""
+        self.pairs_checked += len(group)
+        if collided is None:
+            return sprite.crash(group)
+        return sprite.crash(group, collided)
+
+    def _spritecollide(self, sprite, group: pygame.sprite.Group, collided) -> None:
+        """Count candidate pairs and kill sprites in ``group`` hit by ``sprite``."""
+        self.pairs_checked += len(group)
+        pygame.sprite.spritecollide(sprite, group, True, collided)
+
     def _trigger_explosion(self, x: int, y: int, width: int, height: int) -> None:
-        """Trigger explosion effect if available."""
-        if self._explosion_func:
-            self._explosion_func(self.screen, x, y, width, height)
+        """Trigger explosion effect if available and within budget."""
+        if not self._explosion_func:
+            return
+        if (
+            self.max_explosions is not None
+            and self._explosions_this_frame >= self.max_explosions
+        ):
+            return
+        self._explosions_this_frame += 1
+        self._explosion_func(self.screen, x, y, width, height)
 
     def _trigger_item_pickup(self) -> None:
         """Trigger item pickup sound if available."""
         if self._get_item_func:
             self._get_item_func()
 
+    def cast_segment(
+        self,
+        start: tuple[float, float],
+        end: tuple[float, float],
+        entities,
+        radius: float = 0.0,
+        limit: int | None = None,
+    ) -> list[tuple[float, object]]:
+        """Entities a (thick) segment touches, nearest first.
+
+        Bounding rects are tested in one batch. With pixel-exact bullet
+        collision the candidates are then confirmed against their masks in
+        order of rect entry, until ``limit`` hits are found that no later
+        candidate can beat. The cost follows the number of entities and the
+        size of those the segment crosses, not the segment's length.
+
+        Args:
+            start: Segment start (x, y)
+            end: Segment end (x, y)
+            entities: Entities to test
+            radius: Half the thickness of the segment
+            limit: Nearest hits wanted (None = all)
+
+        Returns:
+            (distance along the segment, entity) pairs
+        """
+        entities = list(entities)
+        if not entities:
+            return []
+        self.pairs_checked += len(entities)
+        masked = self.bullet_collide is pygame.sprite.collide_mask
+        rects = np.array([entity.rect for entity in entities], dtype=np.float64)
+        order, enter, leave = segment_vs_rects(start, end, rects, radius)
+
+        hits = []
+        for index, entry, exit_ in zip(order.tolist(), enter.tolist(), leave.tolist()):
+            # Mask hits lie beyond their rect entry, so later rects cannot win
+            if limit is not None and len(hits) >= limit and entry >= hits[limit - 1][0]:
+                break
+            entity = entities[index]
+            distance = entry
+            if masked:
+                distance = segment_vs_mask(
+                    start, end, entity.mask, entity.rect.topleft, (entry, exit_), radius
+                )
+                if distance is None:
+                    continue
+            hits.append((distance, entity))
+            hits.sort(key=lambda hit: hit[0])
+        return hits[:limit]
+
+    def check_beam(
+        self,
+        start: tuple[float, float],
+        end: tuple[float, float],
+        enemy_groups: list[pygame.sprite.Group],
+        radius: float,
+        pierce: int,
+        damage: int,
+    ) -> tuple[int, float]:
+        """Burn the first ``pierce`` enemies along a beam, or the boss behind them.
+
+        The beam stops inside the ``pierce``-th enemy it touches, else at
+        the boss, else at ``end``; enemies behind the boss are not reached.
+
+        Args:
+            start: Where the beam leaves the player
+            end: Farthest point of the beam
+            enemy_groups: Enemies the beam can hit
+            radius: Half the width of the beam
+            pierce: Enemies the beam passes through, counting the last one
+            damage: HP taken from everything the beam reaches (0 on frames
+                the beam is only shown)
+
+        Returns:
+            Enemies killed, and the beam length up to where it stopped
+        """
+        full = math.hypot(end[0] - start[0], end[1] - start[1])
+        length = full
+        boss_hit = self.cast_segment(start, end, [self.boss], radius, limit=1)
+        if boss_hit:
+            # Cut the beam at the boss so enemies behind it are out of reach
+            length = boss_hit[0][0]
+            scale = length / full if full else 0.0
+            end = (
+                start[0] + (end[0] - start[0]) * scale,
+                start[1] + (end[1] - start[1]) * scale,
+            )
+
+        enemies = [enemy for group in enemy_groups for enemy in group]
+        hits = self.cast_segment(start, end, enemies, radius, limit=pierce)
+        kills = 0
+        if damage:
+            for _, enemy in hits:
+                if enemy.take_damage(damage):
+                    enemy.kill()
+                    self._trigger_explosion(enemy.rect.x, enemy.rect.y, 40, 40)
+                    kills += 1
+        if len(hits) >= pierce:
+            return kills, hits[-1][0]
+
+        if boss_hit and damage:
+            self.boss.take_damage(damage)
+            self._trigger_explosion(round(end[0]) - 20, round(end[1]) - 20, 40, 40)
+        return kills, length
+
     def check_player_weapon_vs_enemies(
         self,
         weapons: pygame.sprite.Group,
@@ -53,7 +217,7 @@ class CollisionManager:
         kills = 0
         for weapon in list(weapons):
             for enemies in enemy_groups:
-                enemy = weapon.crash(enemies)
+                enemy = self._crash(weapon, enemies, self.bullet_collide)
                 if enemy:
                     weapon.kill()
                     if enemy.take_damage(power_level):
@@ -78,7 +242,7 @@ class CollisionManager:
         """
         damage = 0
         for enemies in enemy_groups:
-            if player.crash(enemies):
+            if self._crash(player, enemies):
                 damage += enemy_level
                 self._trigger_explosion(player.rect.x, player.rect.y, 50, 50)
         return damage
@@ -96,11 +260,89 @@ class CollisionManager:
         """
         damage = 0
         for weapons in weapon_groups:
-            if player.crash(weapons):
+            if self._crash(player, weapons, self.bullet_collide):
                 damage += enemy_level
                 self._trigger_explosion(player.rect.x, player.rect.y, 50, 50)
         return damage
 
+    def check_player_vs_bullet_field(
+        self,
+        player: Player,
+        field: BulletField,
+        enemy_level: int,
+    ) -> int:
+        """Check player collision with boss pattern bullets.
+
+        Bullets that hit are removed. With pixel-exact bullet collision the
+        bullets touching the player's rect are tested against its mask.
+
+        Returns:
+            Damage taken (``enemy_level`` per bullet)
+        """
+        if not len(field):
+            return 0
+        self.pairs_checked += len(field)
+        masked = self.bullet_collide is pygame.sprite.collide_mask
+        hit = field.hits(player.rect, player.mask if masked else None)
+        hits = int(hit.sum())
+        if not hits:
+            return 0
+        field.remove(hit)
+        self._trigger_explosion(player.rect.x, player.rect.y, 50, 50)
+        return hits * enemy_level
+
+    def check_bullet_cancel(
+        self,
+        weapon_groups: list[pygame.sprite.Group],
+        enemy_weapon_groups: list[pygame.sprite.Group],
+        field: BulletField,
+    ) -> int:
+        """Let player shots destroy enemy bullets and boss pattern bullets.
+
+        Both populations are reduced to bounding boxes (pattern bullets to
+        the box of their hit circle) and matched with one sort-and-sweep
+        pass, so the pairs tested follow how many bullets share a column
+        rather than shots times bullets. Every overlapping pair is resolved
+        at once: each shot that touches any bullet is spent, and every
+        bullet it touches is cancelled.
+
+        Returns:
+            Enemy bullets cancelled
+        """
+        shots = [shot for group in weapon_groups for shot in group]
+        if not shots:
+            return 0
+        bullets = [bullet for group in enemy_weapon_groups for bullet in group]
+        if not bullets and not len(field):
+            return 0
+
+        shot_boxes = np.array([shot.rect for shot in shots], dtype=np.float64)
+        shot_boxes[:, 2:] += shot_boxes[:, :2]
+        bullet_boxes = np.array([bullet.rect for bullet in bullets], dtype=np.float64).reshape(-1, 4)
+        bullet_boxes[:, 2:] += bullet_boxes[:, :2]
+        x, y, _, _ = field.live()
+        radius = field.radius
+        field_boxes = np.column_stack((x - radius, y - radius, x + radius, y + radius))
+
+        spent, hit, tested = overlapping_pairs(shot_boxes, np.concatenate((bullet_boxes, field_boxes)))
+        self.pairs_checked += tested
+        self.cancel_pairs += tested
+        if not len(hit):
+            return 0
+
+        for index in np.unique(spent).tolist():
+            shots[index].kill()
+        hit = np.unique(hit)
+        sprites = hit[hit < len(bullets)]
+        for index in sprites.tolist():
+            bullets[index].kill()
+        cancelled = np.zeros(len(field), bool)
+        cancelled[hit[hit >= len(bullets)] - len(bullets)] = True
+        if cancelled.any():
+            field.remove(cancelled)
+        self.bullets_cancelled += len(hit)
+        return len(hit)
+
     def check_boss_vs_player_weapons(
         self,
         weapons: pygame.sprite.Group,
@@ -112,8 +354,9 @@ class CollisionManager:
             Number of hits on boss
         """
         hits = 0
+        self.pairs_checked += len(weapons)
         for weapon in list(weapons):
-            if pygame.sprite.collide_mask(self.boss, weapon):
+            if self.bullet_collide(self.boss, weapon):
                 weapon.kill()
                 self.boss.take_damage(power_level)
                 hits += 1
@@ -136,7 +379,7 @@ class CollisionManager:
             Number of items collected
         """
         collected = 0
-        if player.crash(items):
+        if self._crash(player, items):
             collected = 1
             self._trigger_item_pickup()
 
@@ -146,6 +389,10 @@ class CollisionManager:
                 player.state.upgrade_weapon_power()
             elif item_type == ItemType.WEAPON_SPEED:
                 player.state.upgrade_weapon_speed()
+            elif item_type == ItemType.WEAPON_MISSILE:
+                player.state.upgrade_missile()
+            elif item_type == ItemType.WEAPON_BEAM:
+                player.state.upgrade_beam()
 
         return collected
 
@@ -158,7 +405,7 @@ class CollisionManager:
         Returns:
             Heal amount if collected, 0 otherwise
         """
-        if self.player1.crash(items) or self.player2.crash(items):
+        if self._crash(self.player1, items) or self._crash(self.player2, items):
             self._trigger_item_pickup()
             return HEAL_AMOUNT
         return 0
@@ -175,40 +422,20 @@ class CollisionManager:
     ) -> None:
         """Remove all collided sprites using pygame's spritecollide."""
         # Players vs enemies
-        pygame.sprite.spritecollide(
-            self.player1, enemy1s, True, pygame.sprite.collide_mask
-        )
-        pygame.sprite.spritecollide(
-            self.player1, enemy2s, True, pygame.sprite.collide_mask
-        )
-        pygame.sprite.spritecollide(
-            self.player2, enemy1s, True, pygame.sprite.collide_mask
-        )
-        pygame.sprite.spritecollide(
-            self.player2, enemy2s, True, pygame.sprite.collide_mask
-        )
+        self._spritecollide(self.player1, enemy1s, pygame.sprite.collide_mask)
+        self._spritecollide(self.player1, enemy2s, pygame.sprite.collide_mask)
+        self._spritecollide(self.player2, enemy1s, pygame.sprite.collide_mask)
+        self._spritecollide(self.player2, enemy2s, pygame.sprite.collide_mask)
 
         # Players vs enemy weapons
-        pygame.sprite.spritecollide(
-            self.player1, enemy1_weapons, True, pygame.sprite.collide_mask
-        )
-        pygame.sprite.spritecollide(
-            self.player1, enemy2_weapons, True, pygame.sprite.collide_mask
-        )
-        pygame.sprite.spritecollide(
-            self.player2, enemy1_weapons, True, pygame.sprite.collide_mask
-        )
-        pygame.sprite.spritecollide(
-            self.player2, enemy2_weapons, True, pygame.sprite.collide_mask
-        )
+        self._spritecollide(self.player1, enemy1_weapons, self.bullet_collide)
+        self._spritecollide(self.player1, enemy2_weapons, self.bullet_collide)
+        self._spritecollide(self.player2, enemy1_weapons, self.bullet_collide)
+        self._spritecollide(self.player2, enemy2_weapons, self.bullet_collide)
 
         # Boss vs player weapons - handled in check_boss_vs_player_weapons
 
         # Players vs items
         for items in item_groups:
-            pygame.sprite.spritecollide(
-                self.player1, items, True, pygame.sprite.collide_mask
-            )
-            pygame.sprite.spritecollide(
-                self.player2, items, True, pygame.sprite.collide_mask
-            )
+            self._spritecollide(self.player1, items, pygame.sprite.collide_mask)
+            self._spritecollide(self.player2, items, pygame.sprite.collide_mask)
@@ -0,0 +1,120 @@
+"""Garbage collector policy for the game loop."""
+
+import gc
+import time
+
+from ..config import GC_MANAGED, GC_SLACK_MIN_MS, GC_FORCE_FACTOR
+from ..diagnostics import FrameStats
+
+
+class GCManager:
+    """Moves cyclic garbage collection out of frame work.
+
+    Every collection, automatic or not, is timed through ``gc.callbacks``
+    and recorded in ``FrameStats``. With ``managed`` on:
+
+    - ``freeze`` collects once and moves everything alive after loading
+      (assets, caches, the world) into the permanent generation, so later
+      collections never traverse it
+    - during gameplay automatic collection is disabled; ``collect_in_slack``
+      runs the generation CPython would have collected next, but only
+      after a frame whose work left at least ``slack_min_ms`` of budget.
+      If frames stay busy and ``force_factor`` times the young threshold
+      piles up, it collects anyway so memory stays bounded
+    - ``collect_idle`` (pause and result screens) runs a full collection
+      once per idle period
+
+    Without ``managed`` the interpreter's automatic collection stays on
+    and only the instrumentation is active.
+    """
+
+    def __init__(
+        self,
+        frame_stats: FrameStats,
+        managed: bool = GC_MANAGED,
+        slack_min_ms: float = GC_SLACK_MIN_MS,
+        force_factor: int = GC_FORCE_FACTOR,
+    ):
+        self.frame_stats = frame_stats
+        self.managed = managed
+        self.slack_min_ms = slack_min_ms
+        self.force_factor = force_factor
+        self.thresholds = gc.get_threshold()
+        self.active = False
+
+        self._scheduled = False
+        self._started = 0.0
+        self._idle_collected = False
+        gc.callbacks.append(self._on_gc)
+
+    def close(self) -> None:
+        """Stop recording and give collection back to the interpreter."""
+        self.end()
+        if self._on_gc in gc.callbacks:
+            gc.callbacks.remove(self._on_gc)
+
+    def _on_gc(self, phase: str, info: dict) -> None:
+        if phase == "start":
+            self._started = time.perf_counter()
+        else:
+            pause_ms = (time.perf_counter() - self._started) * 1000
+            self.frame_stats.record_gc(info["generation"], pause_ms, self._scheduled)
+
+    def freeze(self) -> None:
+        """Collect, then exempt every live object from future collections."""
+        if not self.managed:
+            return
+        self._collect(2)
+        gc.freeze()
+
+    def begin(self) -> None:
+        """Enter gameplay: automatic collection off."""
+        if self.managed and not self.active:
+            gc.disable()
+            self.active = True
+
+    def end(self) -> None:
+        """Leave gameplay: automatic collection back on."""
+        if self.active:
+            gc.enable()
+            self.active = False
+
+    def _due_generation(self, factor: int = 1) -> int | None:
+        """Generation the automatic collector would collect now, if any."""
+        count0, count1, count2 = gc.get_count()
+        threshold0, threshold1, threshold2 = self.thresholds
+        if count0 < threshold0 * factor:
+            return None
+        if count2 >= threshold2:
+            return 2
+        if count1 >= threshold1:
+            return 1
+        return 0
+
+    def _collect(self, generation: int, scheduled: bool = True) -> None:
+        self._scheduled = scheduled
+        try:
+            gc.collect(generation)
+        finally:
+            self._scheduled = False
+
+    def collect_in_slack(self, work_ms: float) -> None:
+        """Run a due collection after a frame's work, if the frame left room."""
+        if not self.active:
+            return
+        self._idle_collected = False
+        if self.frame_stats.budget_ms - work_ms >= self.slack_min_ms:
+            generation = self._due_generation()
+            if generation is not None:
+                self._collect(generation)
+            return
+        # No room: only collect once far behind, and count it as a hitch
+        generation = self._due_generation(self.force_factor)
+        if generation is not None:
+            self._collect(generation, scheduled=False)
+
+    def collect_idle(self) -> None:
+        """Full collection, once per pause or result screen."""
+        if self.active and not self._idle_collected:
+            self._collect(2)
+            self._idle_collected = True
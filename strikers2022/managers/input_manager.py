@@ -1,29 +1,48 @@
 """Input handling manager."""
 
+from collections.abc import Callable
+
 import pygame
 from ..entities import Player
+from . import action_map
+from .action_map import ActionMap
 
 
 class InputManager:
-    """Handles input for both players."""
-
-    # Player 1 key bindings (arrow keys + numpad 0)
-    P1_LEFT = pygame.K_LEFT
-    P1_RIGHT = pygame.K_RIGHT
-    P1_UP = pygame.K_UP
-    P1_DOWN = pygame.K_DOWN
-    P1_ATTACK = pygame.K_KP0
-
-    # Player 2 key bindings (WASD + Space)
-    P2_LEFT = pygame.K_a
-    P2_RIGHT = pygame.K_d
-    P2_UP = pygame.K_w
-    P2_DOWN = pygame.K_s
-    P2_ATTACK = pygame.K_SPACE
-
-    def __init__(self, player1: Player, player2: Player):
+    """Handles input for both players.
+
+    Gameplay input is not driven by events: ``poll`` samples every bound
+    key and joystick once per frame, right before the simulation, and
+    applies the change since the previous frame through ``apply_bits`` -
+    the same path netplay and bots use. Events only carry system actions,
+    debug hotkeys and joystick hotplug.
+    """
+
+    # Debug
+    PROFILE = pygame.K_F9
+    TRACE = pygame.K_F10
+
+    # Per-frame input bits (netplay and replays)
+    LEFT = action_map.LEFT
+    RIGHT = action_map.RIGHT
+    UP = action_map.UP
+    DOWN = action_map.DOWN
+    ATTACK = action_map.ATTACK
+
+    def __init__(self, player1: Player, player2: Player, actions: ActionMap | None = None):
         self.player1 = player1
         self.player2 = player2
+        self.actions = actions or ActionMap.load()
+        # Bits applied to each player by the last poll
+        self.bits = [0, 0]
+        # Players fed from the devices (False: driven by a bot)
+        self.polled = [True, True]
+        # Debug hotkeys: key -> action run on key down
+        self.debug_actions: dict[int, Callable[[], None]] = {}
+
+    def bind_debug(self, key: int, action: Callable[[], None]) -> None:
+        """Run ``action`` whenever ``key`` is pressed."""
+        self.debug_actions[key] = action
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """Handle a single input event.
@@ -38,52 +57,72 @@ class InputManager:
             return True
 
         if event.type == pygame.KEYDOWN:
-            self._handle_keydown(event.key)
-        elif event.type == pygame.KEYUP:
-            self._handle_keyup(event.key)
+            action = self.debug_actions.get(event.key)
+            if action:
+                action()
 
         return False
 
-    def _handle_keydown(self, key: int) -> None:
-        """Handle key press."""
-        # Player 1 movement
-        if key == self.P1_LEFT:
-            self.player1.move_left()
-        elif key == self.P1_RIGHT:
-            self.player1.move_right()
-        elif key == self.P1_UP:
-            self.player1.move_up()
-        elif key == self.P1_DOWN:
-            self.player1.move_down()
-        elif key == self.P1_ATTACK:
-            self.player1.state.start_attack()
-
-        # Player 2 movement
-        if key == self.P2_LEFT:
-            self.player2.move_left()
-        elif key == self.P2_RIGHT:
-            self.player2.move_right()
-        elif key == self.P2_UP:
-            self.player2.move_up()
-        elif key == self.P2_DOWN:
-            self.player2.move_down()
-        elif key == self.P2_ATTACK:
-            self.player2.state.start_attack()
-
-    def _handle_keyup(self, key: int) -> None:
-        """Handle key release."""
-        # Player 1
-        if key in (self.P1_LEFT, self.P1_RIGHT):
-            self.player1.stop_horizontal()
-        elif key in (self.P1_UP, self.P1_DOWN):
-            self.player1.stop_vertical()
-        elif key == self.P1_ATTACK:
-            self.player1.state.stop_attack()
-
-        # Player 2
-        if key in (self.P2_LEFT, self.P2_RIGHT):
-            self.player2.stop_horizontal()
-        elif key in (self.P2_UP, self.P2_DOWN):
-            self.player2.stop_vertical()
-        elif key == self.P2_ATTACK:
-            self.player2.state.stop_attack()
+    def poll(self) -> list[tuple[int, int, int]]:
+        """Sample the devices and apply what changed since the last poll.
+
+        Returns:
+            (player index, previous bits, bits) of every polled player whose
+            input changed
+        """
+        sampled = self.actions.sample(pygame.key.get_pressed())
+        changes = []
+        for index, player in enumerate((self.player1, self.player2)):
+            bits = sampled[index]
+            previous = self.bits[index]
+            if bits == previous or not self.polled[index]:
+                continue
+            self.apply_bits(player, bits, previous)
+            self.bits[index] = bits
+            changes.append((index, previous, bits))
+        return changes
+
+    def local_bits(self) -> int:
+        """Both players' sampled bits combined (one local player, as in netplay)."""
+        player1, player2 = self.actions.sample(pygame.key.get_pressed())
+        return player1 | player2
+
+    def apply_bits(self, player: Player, bits: int, previous: int) -> None:
+        """Apply one frame of input bits as key presses and releases.
+
+        Changes against ``previous`` are replayed in a fixed order (releases
+        before presses) through the player's movement and attack calls, so
+        the same bit sequence always produces the same player state.
+        """
+        released = previous & ~bits
+        pressed = bits & ~previous
+
+        if released & (self.LEFT | self.RIGHT):
+            player.stop_horizontal()
+        if released & (self.UP | self.DOWN):
+            player.stop_vertical()
+        if released & self.ATTACK:
+            player.state.stop_attack()
+
+        if pressed & self.LEFT:
+            player.move_left()
+        elif pressed & self.RIGHT:
+            player.move_right()
+        if pressed & self.UP:
+            player.move_up()
+        elif pressed & self.DOWN:
+            player.move_down()
+        if pressed & self.ATTACK:
+            player.state.start_attack()
+
+    def release_all(self) -> None:
+        """Drop all held movement and attack input.
+
+        Used when the game pauses or restarts. Input still held afterwards
+        is pressed again by the next ``poll``.
+        """
+        for player in (self.player1, self.player2):
+            player.stop_horizontal()
+            player.stop_vertical()
+            player.state.stop_attack()
+        self.bits = [0, 0]
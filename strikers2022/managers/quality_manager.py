@@ -0,0 +1,95 @@
+"""Adaptive quality governor."""
+
+from dataclasses import dataclass
+
+from ..config import (
+    QUALITY_LEVELS,
+    QUALITY_DEGRADE_RATIO,
+    QUALITY_RECOVER_RATIO,
+    QUALITY_DEGRADE_FRAMES,
+    QUALITY_RECOVER_FRAMES,
+)
+from ..diagnostics import FrameStats
+
+
+@dataclass(frozen=True)
+class QualityLevel:
+    """One step of the quality ladder."""
+
+    name: str
+    rotation_step: int
+    bullet_mask_collision: bool
+    max_explosions: int | None
+    enemy_bullet_cap: int | None
+    render_scale: float
+
+
+class QualityManager:
+    """Steps through quality levels to keep frame work inside the budget.
+
+    The manager looks at the rolling mean work time from ``FrameStats``.
+    When the mean exceeds the budget it drops one level; when it stays well
+    below the budget for a longer stretch it climbs back one level. After
+    every transition it waits for a fresh window of samples so a change is
+    judged on frames rendered at the new level.
+    """
+
+    def __init__(self, on_change=None, enabled: bool = True):
+        self.levels = [QualityLevel(**level) for level in QUALITY_LEVELS]
+        self.index = 0
+        self.enabled = enabled
+        self.transitions: list[tuple[int, str, str, float]] = []
+
+        self._on_change = on_change
+        self._frames_since_change = 0
+        self._headroom_frames = 0
+
+    @property
+    def level(self) -> QualityLevel:
+        """Currently active quality level."""
+        return self.levels[self.index]
+
+    def apply(self) -> None:
+        """Push the current level to the change callback."""
+        if self._on_change:
+            self._on_change(self.level)
+
+    def update(self, stats: FrameStats) -> None:
+        """Re-evaluate the quality level after a finished frame."""
+        if not self.enabled:
+            return
+
+        self._frames_since_change += 1
+        if self._frames_since_change < QUALITY_DEGRADE_FRAMES:
+            return
+
+        mean_ms = stats.mean_work_ms(QUALITY_DEGRADE_FRAMES)
+
+        if mean_ms > stats.budget_ms * QUALITY_DEGRADE_RATIO:
+            self._headroom_frames = 0
+            if self.index < len(self.levels) - 1:
+                self._set_level(self.index + 1, stats, mean_ms)
+            return
+
+        if mean_ms < stats.budget_ms * QUALITY_RECOVER_RATIO:
+            self._headroom_frames += 1
+        else:
+            self._headroom_frames = 0
+
+        if self._headroom_frames >= QUALITY_RECOVER_FRAMES and self.index > 0:
+            self._set_level(self.index - 1, stats, mean_ms)
+
+    def _set_level(self, index: int, stats: FrameStats, mean_ms: float) -> None:
+        """Switch to another level and log the transition."""
+        old = self.level
+        self.index = index
+        self._frames_since_change = 0
+        self._headroom_frames = 0
+
+        self.transitions.append((stats.frame_count, old.name, self.level.name, mean_ms))
+        print(
+            f"Quality: {old.name} -> {self.level.name} "
+            f"(frame {stats.frame_count}, mean work {mean_ms:.1f} ms, "
+            f"budget {stats.budget_ms:.1f} ms)"
+        )
+        self.apply()
@@ -7,18 +7,41 @@ from ..config import WINDOW_WIDTH, WINDOW_HEIGHT, ITEM_SPAWN_THRESHOLDS, ITEM_SP
 
 
 class SpawnManager:
-    """Manages spawning of enemies and items."""
+    """Manages spawning of enemies and items.
+
+    All randomness comes from the manager's own ``rng``, so a game started
+    from the same seed with the same inputs spawns the same things.
+    """
+
+    def __init__(self, seed: int | None = None):
+        self.rng = random.Random(seed)
 
-    def __init__(self):
         # Track which boss HP thresholds have triggered item spawns
         self._spawn_triggered = {hp: False for hp in ITEM_SPAWN_THRESHOLDS}
         self._item_spawn_timer = 0
 
-    def reset(self) -> None:
-        """Reset spawn state for new game."""
+    def reset(self, seed: int | None = None) -> None:
+        """Reset spawn state for new game.
+
+        Args:
+            seed: Reseed the random generator (None keeps its current state)
+        """
+        if seed is not None:
+            self.rng.seed(seed)
         self._spawn_triggered = {hp: False for hp in ITEM_SPAWN_THRESHOLDS}
         self._item_spawn_timer = 0
 
+    def get_state(self) -> tuple:
+        """Capture the spawn state, including the random generator."""
+        return (self.rng.getstate(), dict(self._spawn_triggered), self._item_spawn_timer)
+
+    def set_state(self, state: tuple) -> None:
+        """Restore a state returned by ``get_state``."""
+        rng_state, triggered, timer = state
+        self.rng.setstate(rng_state)
+        self._spawn_triggered = dict(triggered)
+        self._item_spawn_timer = timer
+
     def spawn_enemies(
         self,
         enemy1_group: pygame.sprite.Group,
@@ -36,7 +59,7 @@ class SpawnManager:
             enemy_level: Current enemy level (affects HP)
             spawn_probability: 1 in N chance of spawning (higher = less frequent)
         """
-        if random.randint(1, spawn_probability) != 1:
+        if self.rng.randint(1, spawn_probability) != 1:
             return
 
         # Calculate spawn parameters based on progress
@@ -45,13 +68,13 @@ class SpawnManager:
         max_speed = 1 + int(shot_count / 100)
 
         for _ in range(num_enemies):
-            speed = random.randint(min_speed, max_speed)
+            speed = self.rng.randint(min_speed, max_speed)
             hp = 1 * enemy_level
 
             # Spawn enemy for player 1
             enemy1 = Enemy(
                 hp=hp,
-                xpos=random.randint(0, WINDOW_WIDTH - 50),
+                xpos=self.rng.randint(0, WINDOW_WIDTH - 50),
                 ypos=5,
                 speed=speed,
             )
@@ -60,7 +83,7 @@ class SpawnManager:
             # Spawn enemy for player 2
             enemy2 = Enemy(
                 hp=hp,
-                xpos=random.randint(0, WINDOW_WIDTH - 50),
+                xpos=self.rng.randint(0, WINDOW_WIDTH - 50),
                 ypos=5,
                 speed=speed,
             )
@@ -92,24 +115,24 @@ class SpawnManager:
                 # Always spawn heal item
                 heal_item = create_item(
                     ItemType.HEAL,
-                    random.randrange(0, WINDOW_WIDTH - 40),
+                    self.rng.randrange(0, WINDOW_WIDTH - 40),
                 )
                 heal_items.add(heal_item)
 
                 # Randomly spawn 2 of 3 upgrade item types
-                item_choice = random.randint(1, 3)
+                item_choice = self.rng.randint(1, 3)
 
                 if item_choice == 1:
                     # Power + Speed
                     power_item = create_item(
                         ItemType.WEAPON_POWER,
-                        random.randrange(0, WINDOW_WIDTH - 40),
+                        self.rng.randrange(0, WINDOW_WIDTH - 40),
                     )
                     weapon_power_items.add(power_item)
 
                     speed_item = create_item(
                         ItemType.WEAPON_SPEED,
-                        random.randrange(0, WINDOW_WIDTH - 40),
+                        self.rng.randrange(0, WINDOW_WIDTH - 40),
                     )
                     weapon_speed_items.add(speed_item)
 
@@ -117,13 +140,13 @@ class SpawnManager:
                     # Speed + Number
                     speed_item = create_item(
                         ItemType.WEAPON_SPEED,
-                        random.randrange(0, WINDOW_WIDTH - 40),
+                        self.rng.randrange(0, WINDOW_WIDTH - 40),
                     )
                     weapon_speed_items.add(speed_item)
 
                     number_item = create_item(
                         ItemType.WEAPON_NUMBER,
-                        random.randrange(0, WINDOW_WIDTH - 40),
+                        self.rng.randrange(0, WINDOW_WIDTH - 40),
                     )
                     weapon_number_items.add(number_item)
 
@@ -131,13 +154,13 @@ class SpawnManager:
                     # Power + Number
                     power_item = create_item(
                         ItemType.WEAPON_POWER,
-                        random.randrange(0, WINDOW_WIDTH - 40),
+                        self.rng.randrange(0, WINDOW_WIDTH - 40),
                     )
                     weapon_power_items.add(power_item)
 
                     number_item = create_item(
                         ItemType.WEAPON_NUMBER,
-                        random.randrange(0, WINDOW_WIDTH - 40),
+                        self.rng.randrange(0, WINDOW_WIDTH - 40),
                     )
                     weapon_number_items.add(number_item)
 
@@ -149,6 +172,8 @@ class SpawnManager:
         weapon_power_items: pygame.sprite.Group,
         weapon_speed_items: pygame.sprite.Group,
         weapon_number_items: pygame.sprite.Group,
+        weapon_missile_items: pygame.sprite.Group,
+        weapon_beam_items: pygame.sprite.Group,
     ) -> None:
         """Spawn items periodically based on timer."""
         self._item_spawn_timer += 1
@@ -159,29 +184,41 @@ class SpawnManager:
         self._item_spawn_timer = 0
 
         # Spawn a random item
-        item_choice = random.randint(1, 4)
+        item_choice = self.rng.randint(1, 6)
 
         if item_choice == 1:
             heal_item = create_item(
                 ItemType.HEAL,
-                random.randrange(0, WINDOW_WIDTH - 40),
+                self.rng.randrange(0, WINDOW_WIDTH - 40),
             )
             heal_items.add(heal_item)
         elif item_choice == 2:
             power_item = create_item(
                 ItemType.WEAPON_POWER,
-                random.randrange(0, WINDOW_WIDTH - 40),
+                self.rng.randrange(0, WINDOW_WIDTH - 40),
             )
             weapon_power_items.add(power_item)
         elif item_choice == 3:
             speed_item = create_item(
                 ItemType.WEAPON_SPEED,
-                random.randrange(0, WINDOW_WIDTH - 40),
+                self.rng.randrange(0, WINDOW_WIDTH - 40),
             )
             weapon_speed_items.add(speed_item)
-        else:
+        elif item_choice == 4:
             number_item = create_item(
                 ItemType.WEAPON_NUMBER,
-                random.randrange(0, WINDOW_WIDTH - 40),
+                self.rng.randrange(0, WINDOW_WIDTH - 40),
             )
             weapon_number_items.add(number_item)
+        elif item_choice == 5:
+            missile_item = create_item(
+                ItemType.WEAPON_MISSILE,
+                self.rng.randrange(0, WINDOW_WIDTH - 40),
+            )
+            weapon_missile_items.add(missile_item)
+        else:
+            beam_item = create_item(
+                ItemType.WEAPON_BEAM,
+                self.rng.randrange(0, WINDOW_WIDTH - 40),
+            )
+            weapon_beam_items.add(beam_item)
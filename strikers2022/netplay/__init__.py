@@ -0,0 +1,6 @@
+"""Online co-op with rollback over UDP."""
+
+from .snapshot import WorldSnapshot, capture_world, restore_world
+from .protocol import InputPacket, encode_packet, decode_packet
+from .transport import UdpTransport
+from .session import RollbackSession
@@ -0,0 +1,148 @@
+"""Run one side of a netplay session.
+
+Start one instance per player; on a single machine the defaults pair up
+over loopback:
+
+    python -m strikers2022.netplay --player 1
+    python -m strikers2022.netplay --player 2
+
+Both sides must use the same ``--seed``. ``--delay-ms``, ``--jitter-ms`` and
+``--loss`` are applied to outgoing packets. ``--headless --bot`` runs without
+a window, driven by random input.
+"""
+
+import argparse
+import random
+import time
+
+from ..config import FPS, NETPLAY_PORT, NETPLAY_INPUT_DELAY, NETPLAY_MAX_ROLLBACK
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="STRIKERS 2022 rollback netplay.")
+    parser.add_argument("--player", type=int, choices=(1, 2), required=True)
+    parser.add_argument("--host", default="127.0.0.1", help="local address to bind")
+    parser.add_argument("--port", type=int, default=None, help="local UDP port")
+    parser.add_argument("--peer-host", default="127.0.0.1")
+    parser.add_argument("--peer-port", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=0, help="shared spawn seed")
+    parser.add_argument("--input-delay", type=int, default=NETPLAY_INPUT_DELAY)
+    parser.add_argument("--max-rollback", type=int, default=NETPLAY_MAX_ROLLBACK)
+    parser.add_argument("--delay-ms", type=float, default=0.0, help="added one-way latency")
+    parser.add_argument("--jitter-ms", type=float, default=0.0, help="+/- latency jitter")
+    parser.add_argument("--loss", type=float, default=0.0, help="packet loss ratio")
+    parser.add_argument("--frames", type=int, default=0, help="stop after N frames (0: game end)")
+    parser.add_argument("--headless", action="store_true", help="no window or audio")
+    parser.add_argument("--bot", action="store_true", help="random input instead of the keyboard")
+    args = parser.parse_args(argv)
+
+    if args.port is None:
+        args.port = NETPLAY_PORT + args.player - 1
+    if args.peer_port is None:
+        args.peer_port = NETPLAY_PORT + 2 - args.player
+    return args
+
+
+def random_inputs(seed: int):
+    """Endless input bits that change every few frames."""
+    rng = random.Random(seed)
+    while True:
+        bits = rng.choice((0, 1, 2)) | rng.choice((0, 4, 8)) | rng.choice((0, 16, 16))
+        for _ in range(rng.randint(5, 30)):
+            yield bits
+
+
+def init_display():
+    """Open the game window."""
+    import pygame
+    from ..config import WINDOW_WIDTH, WINDOW_HEIGHT
+
+    pygame.init()
+    screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
+    pygame.display.set_caption("STRIKERS 2022 - netplay")
+    return screen
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+
+    if args.headless:
+        from ..headless import init_pygame
+
+        screen = init_pygame()
+    else:
+        screen = init_display()
+
+    import pygame
+    from ..game import Game
+    from ..managers import filter_events
+    from .session import RollbackSession
+    from .transport import UdpTransport
+
+    filter_events()
+    game = Game(screen)
+    game.seed = args.seed
+    # Quality levels change the simulation, so both sides stay on one level
+    game.quality.enabled = False
+    game.start()
+
+    transport = UdpTransport(
+        args.port,
+        (args.peer_host, args.peer_port),
+        delay_ms=args.delay_ms,
+        jitter_ms=args.jitter_ms,
+        loss=args.loss,
+        host=args.host,
+    )
+    session = RollbackSession(
+        game,
+        args.player,
+        transport,
+        input_delay=args.input_delay,
+        max_rollback=args.max_rollback,
+    )
+
+    print(f"Player {args.player}: waiting for peer at {args.peer_host}:{args.peer_port}")
+    if not session.connect():
+        print("Warning: peer did not answer")
+        transport.close()
+        game.close()
+        pygame.quit()
+        return
+
+    bot = random_inputs(args.seed * 10 + args.player) if args.bot else None
+
+    while game.running:
+        game.clock.tick(FPS)
+        frame_start = time.perf_counter()
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                game.running = False
+
+        if bot:
+            bits = next(bot)
+        else:
+            bits = game.input_manager.local_bits()
+
+        session.advance(bits)
+        game.present()
+        game.gc_manager.collect_in_slack((time.perf_counter() - frame_start) * 1000)
+
+        if session.result or session.timed_out:
+            break
+        if args.frames and session.frame >= args.frames:
+            break
+
+    # Let the peer collect our last inputs and checksums
+    session.linger(1.0)
+
+    print(f"Player {args.player}: result {session.result or 'none'}")
+    print(session.summary())
+
+    transport.close()
+    game.close()
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
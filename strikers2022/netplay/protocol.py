@@ -0,0 +1,57 @@
+"""Netplay packet format."""
+
+from dataclasses import dataclass
+import struct
+
+MAGIC = b"SK"
+
+# magic, ack, first input frame, checksum frame, checksum, input count
+HEADER = struct.Struct("!2siiiIB")
+
+# Inputs carried per packet (older unacknowledged inputs are resent)
+MAX_INPUTS = 255
+
+
+@dataclass(frozen=True, slots=True)
+class InputPacket:
+    """One datagram between peers.
+
+    Attributes:
+        ack: Newest frame of the receiver's input the sender has confirmed
+        start_frame: Frame of the first input in ``inputs``
+        inputs: One byte of input bits per frame, starting at ``start_frame``
+        checksum_frame: Frame the checksum was taken at (-1: none)
+        checksum: World checksum at ``checksum_frame``
+    """
+
+    ack: int
+    start_frame: int
+    inputs: bytes
+    checksum_frame: int = -1
+    checksum: int = 0
+
+
+def encode_packet(packet: InputPacket) -> bytes:
+    """Serialize a packet."""
+    inputs = packet.inputs[:MAX_INPUTS]
+    return (
+        HEADER.pack(
+            MAGIC,
+            packet.ack,
+            packet.start_frame,
+            packet.checksum_frame,
+            packet.checksum,
+            len(inputs),
+        )
+        + inputs
+    )
+
+
+def decode_packet(data: bytes) -> InputPacket | None:
+    """Parse a packet; returns None for anything malformed."""
+    if len(data) < HEADER.size:
+        return None
+    magic, ack, start_frame, checksum_frame, checksum, count = HEADER.unpack_from(data)
+    if magic != MAGIC or len(data) != HEADER.size + count:
+        return None
+    return InputPacket(ack, start_frame, data[HEADER.size:], checksum_frame, checksum)
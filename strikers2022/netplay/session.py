@@ -0,0 +1,297 @@
+"""Rollback netplay session."""
+
+from collections import deque
+import time
+
+from ..config import (
+    NETPLAY_INPUT_DELAY,
+    NETPLAY_MAX_ROLLBACK,
+    NETPLAY_CHECKSUM_INTERVAL,
+    NETPLAY_TIMEOUT,
+)
+from ..diagnostics.frame_stats import percentile
+from .protocol import MAX_INPUTS, InputPacket, decode_packet, encode_packet
+from .snapshot import WorldSnapshot, capture_world, restore_world
+from .transport import UdpTransport
+
+# Rollback samples kept for percentiles
+HISTORY = 600
+
+
+class RollbackSession:
+    """Keeps one player's game in step with a remote peer.
+
+    Each instance simulates both players every frame. The local player's
+    input is delayed by ``input_delay`` frames and sent to the peer; the
+    remote player's input is used as soon as it arrives and predicted
+    (last confirmed input repeated) while it is missing. When a late input
+    differs from its prediction, the world is restored from the snapshot
+    taken before that frame and the frames since are simulated again,
+    silently. A peer never runs more than ``max_rollback`` frames past the
+    newest confirmed remote input; beyond that it stalls.
+
+    Every ``checksum_interval`` frames the peers exchange a checksum of a
+    fully confirmed frame to detect desyncs.
+    """
+
+    def __init__(
+        self,
+        game,
+        local_player: int,
+        transport: UdpTransport,
+        input_delay: int = NETPLAY_INPUT_DELAY,
+        max_rollback: int = NETPLAY_MAX_ROLLBACK,
+        checksum_interval: int = NETPLAY_CHECKSUM_INTERVAL,
+    ):
+        self.game = game
+        self.local_player = local_player
+        self.transport = transport
+        self.input_delay = input_delay
+        self.max_rollback = max_rollback
+        self.checksum_interval = checksum_interval
+
+        self.frame = 0  # Next frame to simulate
+        self.confirmed_frame = -1  # Remote input is known up to this frame
+        self.remote_ack = -1  # Newest local input frame the peer has
+        self.local_inputs: dict[int, int] = {frame: 0 for frame in range(input_delay)}
+        self.remote_inputs: dict[int, int] = {}
+        self.last_heard = time.perf_counter()
+
+        self._predicted: dict[int, int] = {}
+        self._snapshots: dict[int, WorldSnapshot] = {}
+        self._results: dict[int, str] = {}
+
+        self._next_checksum = checksum_interval
+        self._outgoing_checksum = (-1, 0)
+        self._checked_frame = -1
+        self._local_checksums: dict[int, int] = {}
+        self._remote_checksums: dict[int, int] = {}
+
+        # Statistics
+        self.stalls = 0
+        self.rollbacks = 0
+        self.resimulated_frames = 0
+        self.max_depth = 0
+        self.depths: deque[int] = deque(maxlen=HISTORY)
+        self.resim_ms: deque[float] = deque(maxlen=HISTORY)
+        self.snapshot_ms: deque[float] = deque(maxlen=HISTORY)
+        self.snapshot_bytes = 0
+        self.max_snapshot_bytes = 0
+        self.checksums_matched = 0
+        self.desyncs = 0
+
+    # Connection
+
+    def connect(self, timeout: float = NETPLAY_TIMEOUT) -> bool:
+        """Send until the peer answers.
+
+        Returns:
+            True once a packet from the peer arrived, False on timeout
+        """
+        deadline = time.perf_counter() + timeout
+        while time.perf_counter() < deadline:
+            self._send()
+            received, _ = self._receive()
+            if received:
+                return True
+            time.sleep(0.05)
+        return False
+
+    @property
+    def timed_out(self) -> bool:
+        """True when the peer has been silent for ``NETPLAY_TIMEOUT``."""
+        return time.perf_counter() - self.last_heard > NETPLAY_TIMEOUT
+
+    def linger(self, seconds: float) -> None:
+        """Keep answering the peer for a while after the last frame."""
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            self._synchronize()
+            self._send()
+            time.sleep(1 / 60)
+
+    # Frame loop
+
+    def advance(self, local_bits: int) -> bool:
+        """Take the local input for this frame and simulate it.
+
+        Returns:
+            True if a frame was simulated, False if the session stalled
+            waiting for remote input
+        """
+        self._synchronize()
+
+        if self.frame - (self.confirmed_frame + 1) >= self.max_rollback:
+            self.stalls += 1
+            self._send()
+            return False
+
+        self.local_inputs[self.frame + self.input_delay] = local_bits
+        self._send()
+
+        self._simulate(self.frame)
+        self.frame += 1
+        self._prune()
+        return True
+
+    @property
+    def result(self) -> str | None:
+        """Game result of a confirmed frame (both peers agree on it)."""
+        for frame, result in sorted(self._results.items()):
+            if frame <= self.confirmed_frame:
+                return result
+        return None
+
+    def _synchronize(self) -> None:
+        """Apply received input, roll back if needed and compare checksums."""
+        _, rollback_to = self._receive()
+        if rollback_to is not None:
+            self._rollback(rollback_to)
+        self._exchange_checksums()
+
+    def _simulate(self, frame: int) -> None:
+        """Snapshot the world and simulate ``frame``."""
+        start = time.perf_counter()
+        self._snapshots[frame] = capture_world(self.game, frame)
+        self.snapshot_ms.append((time.perf_counter() - start) * 1000)
+
+        local = self.local_inputs[frame]
+        remote = self._remote_input(frame)
+        if self.local_player == 1:
+            result = self.game.simulate_frame(local, remote)
+        else:
+            result = self.game.simulate_frame(remote, local)
+
+        if result:
+            self._results[frame] = result
+        else:
+            self._results.pop(frame, None)
+
+    def _remote_input(self, frame: int) -> int:
+        """Confirmed remote input for ``frame``, or a recorded prediction."""
+        bits = self.remote_inputs.get(frame)
+        if bits is None:
+            bits = self.remote_inputs.get(self.confirmed_frame, 0)
+            self._predicted[frame] = bits
+        return bits
+
+    def _rollback(self, frame: int) -> None:
+        """Restore the world before ``frame`` and simulate up to now again."""
+        start = time.perf_counter()
+        depth = self.frame - frame
+
+        restore_world(self.game, self._snapshots[frame])
+        self.game.muted = True
+        try:
+            for resimulated in range(frame, self.frame):
+                self._simulate(resimulated)
+        finally:
+            self.game.muted = False
+
+        self.rollbacks += 1
+        self.resimulated_frames += depth
+        self.max_depth = max(self.max_depth, depth)
+        self.depths.append(depth)
+        self.resim_ms.append((time.perf_counter() - start) * 1000)
+
+    def _prune(self) -> None:
+        """Forget inputs and snapshots no rollback can reach any more."""
+        keep_from = min(self.confirmed_frame + 1, self._next_checksum)
+        for frame in [frame for frame in self._snapshots if frame < keep_from]:
+            del self._snapshots[frame]
+
+        keep_inputs = min(self.confirmed_frame + 1, self.remote_ack + 1, self.frame)
+        for frame in [frame for frame in self.local_inputs if frame < keep_inputs]:
+            del self.local_inputs[frame]
+        # The newest confirmed remote input stays for predictions; a peer
+        # running behind still needs the ones it has not simulated yet
+        keep_remote = min(self.confirmed_frame, self.frame)
+        for frame in [frame for frame in self.remote_inputs if frame < keep_remote]:
+            del self.remote_inputs[frame]
+
+    # Messaging
+
+    def _send(self) -> None:
+        """Send every local input the peer has not acknowledged."""
+        last = max(self.local_inputs)
+        first = max(self.remote_ack + 1, last - MAX_INPUTS + 1, min(self.local_inputs))
+        inputs = bytes(self.local_inputs[frame] for frame in range(first, last + 1))
+        packet = InputPacket(self.confirmed_frame, first, inputs, *self._outgoing_checksum)
+        self.transport.send(encode_packet(packet))
+
+    def _receive(self) -> tuple[int, int | None]:
+        """Read peer packets.
+
+        Returns:
+            Number of packets read and the earliest mispredicted frame (or
+            None if every prediction held)
+        """
+        rollback_to = None
+        packets = self.transport.receive()
+        for data in packets:
+            packet = decode_packet(data)
+            if packet is None:
+                continue
+            self.last_heard = time.perf_counter()
+            self.remote_ack = max(self.remote_ack, packet.ack)
+
+            for offset, bits in enumerate(packet.inputs):
+                frame = packet.start_frame + offset
+                if frame <= self.confirmed_frame or frame in self.remote_inputs:
+                    continue
+                self.remote_inputs[frame] = bits
+                predicted = self._predicted.pop(frame, None)
+                if predicted is not None and predicted != bits:
+                    if rollback_to is None or frame < rollback_to:
+                        rollback_to = frame
+
+            if packet.checksum_frame > self._checked_frame:
+                self._remote_checksums[packet.checksum_frame] = packet.checksum
+
+        while self.confirmed_frame + 1 in self.remote_inputs:
+            self.confirmed_frame += 1
+        return len(packets), rollback_to
+
+    def _exchange_checksums(self) -> None:
+        """Checksum the next confirmed frame and compare with the peer's."""
+        frame = self._next_checksum
+        if frame - 1 <= self.confirmed_frame and frame in self._snapshots:
+            snapshot = self._snapshots[frame]
+            self._local_checksums[frame] = snapshot.checksum()
+            self._outgoing_checksum = (frame, self._local_checksums[frame])
+            self.snapshot_bytes = snapshot.size_bytes()
+            self.max_snapshot_bytes = max(self.max_snapshot_bytes, self.snapshot_bytes)
+            self._next_checksum += self.checksum_interval
+
+        for frame in sorted(self._remote_checksums):
+            if frame not in self._local_checksums:
+                continue
+            if self._remote_checksums.pop(frame) == self._local_checksums.pop(frame):
+                self.checksums_matched += 1
+            else:
+                self.desyncs += 1
+                print(f"Warning: netplay desync at frame {frame}")
+            self._checked_frame = max(self._checked_frame, frame)
+
+    def summary(self) -> str:
+        """Multi-line session report."""
+        depths = list(self.depths)
+        resim = list(self.resim_ms)
+        capture = list(self.snapshot_ms)
+        mean_depth = sum(depths) / len(depths) if depths else 0.0
+        return "\n".join(
+            [
+                f"netplay: frames {self.frame}  confirmed {self.confirmed_frame}  "
+                f"stalls {self.stalls}",
+                f"rollbacks: {self.rollbacks}  depth mean {mean_depth:.1f}  "
+                f"max {self.max_depth}  resimulated frames {self.resimulated_frames}",
+                f"resimulation ms  p50: {percentile(resim, 50):.2f}  "
+                f"p99: {percentile(resim, 99):.2f}  max: {max(resim, default=0.0):.2f}",
+                f"snapshot: {self.snapshot_bytes} B (max {self.max_snapshot_bytes} B)  "
+                f"capture ms p50: {percentile(capture, 50):.3f}  "
+                f"p99: {percentile(capture, 99):.3f}",
+                f"checksums: matched {self.checksums_matched}  desyncs {self.desyncs}",
+                f"transport: sent {self.transport.sent}  received "
+                f"{self.transport.received}  dropped {self.transport.dropped}",
+            ]
+        )
@@ -0,0 +1,107 @@
+"""World snapshots for rollback."""
+
+from dataclasses import dataclass
+import sys
+import zlib
+
+from ..diagnostics import entity_instance_bytes
+from ..entities import Boss, GameEntity, Player
+
+# Game attributes that are part of the simulated state
+COUNTERS = (
+    "shot_count",
+    "count_missed",
+    "players_hp",
+    "enemy_level",
+    "enemy_attack_counter",
+    "input_bits",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class WorldSnapshot:
+    """Simulated world state at the start of a frame.
+
+    Entities are detached clones: they share sprite data with the live
+    world but belong to no group, so a snapshot can be restored any number
+    of times. Boss pattern bullets are copies of the bullet field's arrays.
+    """
+
+    frame: int
+    player1: Player
+    player2: Player
+    boss: Boss
+    groups: tuple[tuple[GameEntity, ...], ...]
+    bullets: tuple
+    pattern_state: tuple
+    spawn_state: tuple
+    counters: tuple
+
+    def entities(self) -> list[GameEntity]:
+        """Every entity held by the snapshot."""
+        entities = [self.player1, self.player2, self.boss]
+        for group in self.groups:
+            entities.extend(group)
+        return entities
+
+    def checksum(self) -> int:
+        """CRC32 of the gameplay-relevant state, for desync detection."""
+        values = [self.counters, self.boss.hp, self.spawn_state, self.pattern_state]
+        for entity in self.entities():
+            values.append((entity.rect.x, entity.rect.y, getattr(entity, "hp", 0)))
+        checksum = zlib.crc32(repr(values).encode())
+        for column in self.bullets:
+            checksum = zlib.crc32(column.tobytes(), checksum)
+        return checksum
+
+    def size_bytes(self) -> int:
+        """Memory owned by the snapshot (shared sprite data excluded)."""
+        size = sys.getsizeof(self)
+        size += sum(entity_instance_bytes(entity) for entity in self.entities())
+        size += sum(sys.getsizeof(group) for group in self.groups)
+        size += sum(column.nbytes for column in self.bullets)
+
+        rng_state, triggered, _ = self.spawn_state
+        size += sys.getsizeof(rng_state[1])
+        size += sum(sys.getsizeof(value) for value in rng_state[1])
+        size += sys.getsizeof(triggered)
+        return size
+
+
+def capture_world(game, frame: int) -> WorldSnapshot:
+    """Snapshot the simulated state of ``game`` before ``frame``."""
+    return WorldSnapshot(
+        frame=frame,
+        player1=game.player1.clone(),
+        player2=game.player2.clone(),
+        boss=game.boss.clone(),
+        groups=tuple(
+            tuple(entity.clone() for entity in group)
+            for group in game.sprite_groups.values()
+        ),
+        bullets=game.bullet_field.get_state(),
+        pattern_state=game.boss_patterns.get_state(),
+        spawn_state=game.spawn_manager.get_state(),
+        counters=tuple(getattr(game, name) for name in COUNTERS),
+    )
+
+
+def restore_world(game, snapshot: WorldSnapshot) -> None:
+    """Put ``game`` back into the state held by ``snapshot``.
+
+    The players and the boss are restored in place because the managers
+    hold references to them; group contents are replaced by fresh clones.
+    """
+    game.player1.copy_state(snapshot.player1)
+    game.player2.copy_state(snapshot.player2)
+    game.boss.copy_state(snapshot.boss)
+
+    for group, entities in zip(game.sprite_groups.values(), snapshot.groups):
+        group.empty()
+        group.add(*[entity.clone() for entity in entities])
+
+    game.bullet_field.set_state(snapshot.bullets)
+    game.boss_patterns.set_state(snapshot.pattern_state)
+    game.spawn_manager.set_state(snapshot.spawn_state)
+    for name, value in zip(COUNTERS, snapshot.counters):
+        setattr(game, name, value)
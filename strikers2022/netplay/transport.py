@@ -0,0 +1,87 @@
+"""UDP transport with artificial latency, jitter and loss."""
+
+import heapq
+import random
+import socket
+import time
+
+
+class UdpTransport:
+    """Non-blocking UDP socket talking to a single peer.
+
+    Outgoing datagrams can be held back by ``delay_ms`` plus a uniform
+    ``jitter_ms`` (which may reorder them) and dropped with probability
+    ``loss``, so latency conditions can be reproduced over loopback.
+    """
+
+    def __init__(
+        self,
+        port: int,
+        peer: tuple[str, int],
+        delay_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        loss: float = 0.0,
+        host: str = "127.0.0.1",
+        seed: int | None = None,
+    ):
+        self.peer = peer
+        self.delay_ms = delay_ms
+        self.jitter_ms = jitter_ms
+        self.loss = loss
+
+        self.sent = 0
+        self.received = 0
+        self.dropped = 0
+
+        self._rng = random.Random(seed)
+        self._outbox: list[tuple[float, int, bytes]] = []
+        self._sequence = 0
+
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind((host, port))
+        self._socket.setblocking(False)
+
+    def send(self, data: bytes) -> None:
+        """Queue a datagram for the peer."""
+        if self.loss and self._rng.random() < self.loss:
+            self.dropped += 1
+            return
+
+        delay = self.delay_ms
+        if self.jitter_ms:
+            delay += self._rng.uniform(-self.jitter_ms, self.jitter_ms)
+        release_at = time.perf_counter() + max(0.0, delay) / 1000
+
+        self._sequence += 1
+        heapq.heappush(self._outbox, (release_at, self._sequence, data))
+        self.flush()
+
+    def flush(self) -> None:
+        """Send every held datagram whose delay has passed."""
+        now = time.perf_counter()
+        while self._outbox and self._outbox[0][0] <= now:
+            _, _, data = heapq.heappop(self._outbox)
+            try:
+                self._socket.sendto(data, self.peer)
+                self.sent += 1
+            except OSError:
+                # Peer not listening (yet); UDP gives no delivery guarantee
+                self.dropped += 1
+
+    def receive(self) -> list[bytes]:
+        """Flush due datagrams and return everything received from the peer."""
+        self.flush()
+        packets = []
+        while True:
+            try:
+                data, _ = self._socket.recvfrom(2048)
+            except (BlockingIOError, ConnectionResetError):
+                break
+            packets.append(data)
+        self.received += len(packets)
+        return packets
+
+    def close(self) -> None:
+        """Close the socket; held datagrams are discarded."""
+        self._outbox.clear()
+        self._socket.close()
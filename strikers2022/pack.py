@@ -0,0 +1,108 @@
+"""Build a single-file zipapp of the game with precompiled bytecode.
+
+    python -m strikers2022.pack [--output dist/strikers2022.pyz] [--no-assets]
+
+The archive holds the package as bytecode compiled for the running
+interpreter (no sources unless ``--sources``), so nothing is compiled at
+startup and nothing has to be written next to the game, plus the asset
+directories unless ``--no-assets`` (then they are looked up next to the
+archive). Run it with the same Python version:
+
+    python dist/strikers2022.pyz
+"""
+
+import argparse
+import py_compile
+import shutil
+import sys
+import tempfile
+import time
+import zipapp
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).parent
+PROJECT_DIR = PACKAGE_DIR.parent
+ASSET_DIRS = ("images", "sounds", "musics", "patterns")
+
+
+def stage_package(staging: Path, sources: bool, optimize: int) -> int:
+    """Compile every module of the package into ``staging``.
+
+    Each module becomes ``name.pyc`` where ``name.py`` was, which is where
+    ``zipimport`` looks for sourceless modules. Hash-based pycs are not
+    checked against the sources, so an archive with ``--sources`` loads
+    the same bytecode.
+
+    Returns:
+        Number of modules compiled
+    """
+    count = 0
+    for source in sorted(PACKAGE_DIR.rglob("*.py")):
+        relative = source.relative_to(PROJECT_DIR)
+        target = staging / relative.with_suffix(".pyc")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        py_compile.compile(
+            str(source),
+            cfile=str(target),
+            dfile=relative.as_posix(),
+            doraise=True,
+            optimize=optimize,
+            invalidation_mode=py_compile.PycInvalidationMode.UNCHECKED_HASH,
+        )
+        if sources:
+            shutil.copy2(source, staging / relative)
+        count += 1
+    return count
+
+
+def build(
+    output: Path,
+    assets: bool = True,
+    sources: bool = False,
+    optimize: int = 0,
+    compressed: bool = False,
+) -> None:
+    """Write the zipapp to ``output``."""
+    with tempfile.TemporaryDirectory() as tmp:
+        staging = Path(tmp)
+        modules = stage_package(staging, sources, optimize)
+        if assets:
+            for name in ASSET_DIRS:
+                shutil.copytree(PROJECT_DIR / name, staging / name)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        zipapp.create_archive(
+            staging,
+            output,
+            interpreter="/usr/bin/env python3",
+            main="strikers2022.main:main",
+            compressed=compressed,
+        )
+    size = output.stat().st_size / 1024
+    print(
+        f"{output}: {modules} modules, {'with' if assets else 'without'} assets, "
+        f"{size:.0f} KB (bytecode for Python {sys.version_info.major}.{sys.version_info.minor})"
+    )
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Build a single-file zipapp of the game.")
+    parser.add_argument(
+        "--output", type=Path, default=PROJECT_DIR / "dist" / "strikers2022.pyz", help="archive to write"
+    )
+    parser.add_argument(
+        "--no-assets", action="store_true", help="leave the asset directories out (ship them next to it)"
+    )
+    parser.add_argument("--sources", action="store_true", help="also pack the .py sources (tracebacks)")
+    parser.add_argument("--optimize", type=int, default=0, choices=(0, 1, 2), help="bytecode optimization level")
+    parser.add_argument(
+        "--compress", action="store_true", help="deflate the archive (smaller, slower to import)"
+    )
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    build(args.output, not args.no_assets, args.sources, args.optimize, args.compress)
+    print(f"built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
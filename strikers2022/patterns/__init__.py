@@ -0,0 +1,5 @@
+"""Boss bullet patterns."""
+
+from .definitions import KINDS, Pattern, Phase, load_phases, parse_phases
+from .bullet_field import BulletField
+from .director import BossPatterns, volley_directions
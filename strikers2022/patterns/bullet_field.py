@@ -0,0 +1,275 @@
+"""Pattern bullets stored as arrays and updated in bulk."""
+
+import math
+
+import numpy as np
+import pygame
+
+from ..config import (
+    WINDOW_WIDTH,
+    WINDOW_HEIGHT,
+    BULLET_FIELD_CAPACITY,
+    PATTERN_BULLET_SIZE,
+    PATTERN_BULLET_RADIUS,
+    PATTERN_BULLET_ANGLES,
+)
+from ..utils import enable_rle, load_image
+
+# Per-bullet arrays and their types; one row per live bullet, in spawn order
+COLUMNS = (
+    ("x", np.float64),
+    ("y", np.float64),
+    ("vx", np.float64),
+    ("vy", np.float64),
+    # cos/sin of the per-frame homing turn, frames of homing left, player index
+    ("turn_cos", np.float64),
+    ("turn_sin", np.float64),
+    ("homing", np.int32),
+    ("target", np.int8),
+)
+
+
+class BulletField:
+    """Every live pattern bullet as one set of parallel arrays.
+
+    Bullets are not entities: a bullet is one row of ``COLUMNS``, the live
+    ones packed at the front in spawn order. ``update`` moves, steers and
+    culls all of them with a handful of numpy operations, so the cost per
+    frame grows with the bullet count only through vectorized loops and
+    thousands of bullets stay well inside the frame budget. Volleys that
+    would exceed ``capacity`` are cut short and counted in ``dropped``.
+
+    Positions are bullet centres. Bullets hit a player when their
+    ``radius`` circle touches the player's rect (and, with pixel-exact
+    collision, the player's mask).
+
+    The field is deterministic for a given build: a world restored from
+    ``get_state`` replays bit for bit (netplay rollback). Volley velocities
+    and aims come from ``math.cos``, ``math.sin`` and ``math.atan2``, which
+    the C library is not required to round identically everywhere, so
+    peers on different platforms or Python builds may drift apart; the
+    netplay checksums report that as a desync.
+    """
+
+    def __init__(
+        self,
+        capacity: int = BULLET_FIELD_CAPACITY,
+        size: tuple[int, int] = PATTERN_BULLET_SIZE,
+        radius: int = PATTERN_BULLET_RADIUS,
+        angles: int = PATTERN_BULLET_ANGLES,
+        image_file: str = "enemy1_bullet.png",
+    ):
+        self.capacity = capacity
+        self.radius = radius
+        self.count = 0
+        self.spawned = 0
+        self.dropped = 0
+        for name, dtype in COLUMNS:
+            setattr(self, name, np.zeros(capacity, dtype))
+
+        # Pre-rotated images, one per direction bucket, and half their sizes
+        # to turn centres into blit positions
+        image = load_image(image_file, size)
+        self.angle_step = 360 / angles
+        self.images = np.empty(angles, dtype=object)
+        half_sizes = []
+        for bucket in range(angles):
+            rotated = enable_rle(pygame.transform.rotate(image, bucket * self.angle_step))
+            self.images[bucket] = rotated
+            half_sizes.append((rotated.get_width() / 2, rotated.get_height() / 2))
+        self._half_w = np.array([half[0] for half in half_sizes])
+        self._half_h = np.array([half[1] for half in half_sizes])
+
+        # Hit shape for pixel-exact collision
+        circle = pygame.Surface((2 * radius, 2 * radius), pygame.SRCALPHA)
+        pygame.draw.circle(circle, (255, 255, 255), (radius, radius), radius)
+        self.mask = pygame.mask.from_surface(circle)
+
+        # Bullets are dropped once their centre is this far off screen
+        self._margin = max(size) / 2
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self) -> None:
+        """Remove every bullet and reset the counters."""
+        self.count = 0
+        self.spawned = 0
+        self.dropped = 0
+
+    def spawn(
+        self,
+        x: float,
+        y: float,
+        directions: list[float],
+        speed: float,
+        target: int = 0,
+        turn: float = 0.0,
+        homing_frames: int = 0,
+    ) -> int:
+        """Add one volley fired from (x, y).
+
+        Args:
+            directions: Direction of every bullet in degrees (0 = right,
+                90 = down)
+            speed: Pixels per frame
+            target: Player index (0 or 1) homing bullets turn towards
+            turn: Degrees per frame homing bullets turn
+            homing_frames: Frames the bullets keep turning
+
+        Returns:
+            Bullets added
+        """
+        start = self.count
+        added = min(len(directions), self.capacity - start)
+        self.dropped += len(directions) - added
+        if added <= 0:
+            return 0
+        end = start + added
+        # math.cos/sin rather than numpy's: numpy may pick a vectorized
+        # implementation per CPU, so even one build could differ by machine
+        radians = [math.radians(direction) for direction in directions[:added]]
+        self.x[start:end] = x
+        self.y[start:end] = y
+        self.vx[start:end] = [math.cos(angle) * speed for angle in radians]
+        self.vy[start:end] = [math.sin(angle) * speed for angle in radians]
+        self.turn_cos[start:end] = math.cos(math.radians(turn))
+        self.turn_sin[start:end] = math.sin(math.radians(turn))
+        self.homing[start:end] = homing_frames if turn else 0
+        self.target[start:end] = target
+        self.count = end
+        self.spawned += added
+        return added
+
+    def update(self, targets: tuple[tuple[float, float], tuple[float, float]]) -> None:
+        """Steer homing bullets, move every bullet and drop those off screen.
+
+        Args:
+            targets: Centre of each player, indexed by a bullet's ``target``
+        """
+        n = self.count
+        if not n:
+            return
+        x, y, vx, vy = self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+
+        homing = self.homing[:n]
+        steering = np.flatnonzero(homing)
+        if steering.size:
+            self._steer(steering, targets)
+            homing[steering] -= 1
+
+        x += vx
+        y += vy
+
+        margin = self._margin
+        inside = (x > -margin) & (x < WINDOW_WIDTH + margin)
+        inside &= (y > -margin) & (y < WINDOW_HEIGHT + margin)
+        if not inside.all():
+            self._keep(inside)
+
+    def _steer(self, index: np.ndarray, targets) -> None:
+        """Turn the velocity of bullets ``index`` towards their players."""
+        target = self.target[index]
+        goal_x = np.where(target == 0, targets[0][0], targets[1][0])
+        goal_y = np.where(target == 0, targets[0][1], targets[1][1])
+        dx = goal_x - self.x[index]
+        dy = goal_y - self.y[index]
+        vx = self.vx[index]
+        vy = self.vy[index]
+
+        # Rotate by the turn rate, clockwise or counter-clockwise
+        cross = vx * dy - vy * dx
+        cos = self.turn_cos[index]
+        sin = np.where(cross < 0, -self.turn_sin[index], self.turn_sin[index])
+        turned_x = vx * cos - vy * sin
+        turned_y = vx * sin + vy * cos
+
+        # Within one turn of the goal: fly straight at it instead of overshooting
+        speed = np.sqrt(vx * vx + vy * vy)
+        distance = np.sqrt(dx * dx + dy * dy)
+        dot = vx * dx + vy * dy
+        aligned = (dot > 0) & (np.abs(cross) <= self.turn_sin[index] * speed * distance)
+        aligned &= distance > 0
+        scale = np.divide(speed, distance, out=np.zeros_like(speed), where=distance > 0)
+        self.vx[index] = np.where(aligned, dx * scale, turned_x)
+        self.vy[index] = np.where(aligned, dy * scale, turned_y)
+
+    def _keep(self, keep: np.ndarray) -> None:
+        """Pack the live bullets marked in ``keep`` at the front."""
+        n = self.count
+        kept = int(np.count_nonzero(keep))
+        for name, _ in COLUMNS:
+            column = getattr(self, name)
+            column[:kept] = column[:n][keep]
+        self.count = kept
+
+    def remove(self, hit: np.ndarray) -> None:
+        """Remove the live bullets marked in ``hit``."""
+        self._keep(~hit)
+
+    def hits(self, rect: pygame.Rect, mask: pygame.mask.Mask | None = None) -> np.ndarray:
+        """Live bullets touching ``rect`` (and ``mask`` placed at it, if given).
+
+        Returns:
+            Boolean array over the live bullets
+        """
+        n = self.count
+        x, y = self.x[:n], self.y[:n]
+        radius = self.radius
+        near_x = np.clip(x, rect.left, rect.right)
+        near_y = np.clip(y, rect.top, rect.bottom)
+        dx = x - near_x
+        dy = y - near_y
+        hit = dx * dx + dy * dy < radius * radius
+        if mask is None:
+            return hit
+
+        # Pixel-exact test of the few bullets that touch the rect
+        bullet_mask = self.mask
+        for index in np.flatnonzero(hit).tolist():
+            offset = (int(x[index]) - radius - rect.x, int(y[index]) - radius - rect.y)
+            if not mask.overlap(bullet_mask, offset):
+                hit[index] = False
+        return hit
+
+    def live(self) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Views of the live bullets' x, y, vx and vy."""
+        n = self.count
+        return self.x[:n], self.y[:n], self.vx[:n], self.vy[:n]
+
+    def directions(self) -> np.ndarray:
+        """Image bucket (index into ``images``) of every live bullet."""
+        n = self.count
+        vx, vy = self.vx[:n], self.vy[:n]
+        # Same convention as ``calculate_angle``: pygame turns counter-clockwise
+        degrees = -(np.degrees(np.arctan2(-vy, -vx)) + 90)
+        return np.rint(degrees / self.angle_step).astype(np.intp) % len(self.images)
+
+    def place(
+        self, x: np.ndarray, y: np.ndarray, buckets: np.ndarray
+    ) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """(image, top-left) of bullets centred at (x, y) facing ``buckets``."""
+        if not len(x):
+            return []
+        left = (x - self._half_w[buckets]).astype(np.intp).tolist()
+        top = (y - self._half_h[buckets]).astype(np.intp).tolist()
+        return list(zip(self.images[buckets].tolist(), zip(left, top)))
+
+    def blits(self) -> list[tuple[pygame.Surface, tuple[int, int]]]:
+        """(image, top-left) of every live bullet, ready for ``blits``."""
+        n = self.count
+        if not n:
+            return []
+        return self.place(self.x[:n], self.y[:n], self.directions())
+
+    def get_state(self) -> tuple:
+        """Copy of the live bullets (see ``set_state``)."""
+        n = self.count
+        return tuple(getattr(self, name)[:n].copy() for name, _ in COLUMNS)
+
+    def set_state(self, state: tuple) -> None:
+        """Restore bullets captured by ``get_state``."""
+        n = len(state[0])
+        for (name, _), values in zip(COLUMNS, state):
+            getattr(self, name)[:n] = values
+        self.count = n
@@ -0,0 +1,130 @@
+"""Declarative boss bullet patterns and their file format."""
+
+from dataclasses import dataclass, fields
+import json
+
+from ..config import BOSS_DEFAULT_HP, ITEM_SPAWN_THRESHOLDS, assets
+
+# Pattern kinds:
+#   ring: ``count`` bullets evenly around a full circle
+#   spiral: a ring whose start angle turns by ``spin`` every volley
+#   fan: ``count`` bullets across ``spread`` degrees, centred on a player
+#   homing: a fan whose bullets turn towards their player for a while
+KINDS = ("ring", "spiral", "fan", "homing")
+
+# Aimed patterns shoot at one player or at each in turn
+TARGETS = ("player1", "player2", "alternate")
+
+
+@dataclass(frozen=True, slots=True)
+class Pattern:
+    """One emitter of a boss phase.
+
+    Attributes:
+        kind: One of ``KINDS``
+        count: Bullets per volley
+        speed: Bullet speed in pixels per frame
+        interval: Frames between volleys
+        delay: Frames into the phase before the first volley
+        spread: Arc of a fan or homing volley in degrees
+        spin: Degrees the start angle turns every volley (rings, spirals)
+        angle: Start angle in degrees (0 = right, 90 = down)
+        turn: Degrees per frame a homing bullet turns towards its player
+        homing_frames: Frames a homing bullet keeps turning
+        target: Player aimed at by fans and homing volleys (``TARGETS``)
+        offset: Emitter position relative to the boss centre
+    """
+
+    kind: str
+    count: int
+    speed: float
+    interval: int
+    delay: int = 0
+    spread: float = 0.0
+    spin: float = 0.0
+    angle: float = 90.0
+    turn: float = 0.0
+    homing_frames: int = 0
+    target: str = "alternate"
+    offset: tuple[float, float] = (0.0, 0.0)
+
+    def __post_init__(self):
+        if self.kind not in KINDS:
+            raise ValueError(f"unknown kind {self.kind!r} (choose from {', '.join(KINDS)})")
+        if self.target not in TARGETS:
+            raise ValueError(f"unknown target {self.target!r} (choose from {', '.join(TARGETS)})")
+        if self.count < 1 or self.interval < 1 or self.speed <= 0:
+            raise ValueError("count, interval and speed must be positive")
+
+    @property
+    def aimed(self) -> bool:
+        """True if volleys are centred on a player."""
+        return self.kind in ("fan", "homing")
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Pattern":
+        """Build a pattern from its file representation."""
+        known = {field.name for field in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"unknown keys {', '.join(sorted(unknown))}")
+        data = dict(data)
+        if "offset" in data:
+            data["offset"] = tuple(float(value) for value in data["offset"])
+        return cls(**data)
+
+
+@dataclass(frozen=True, slots=True)
+class Phase:
+    """Patterns fired while the boss HP is at or below ``hp``.
+
+    ``hp`` is ``BOSS_DEFAULT_HP`` for the opening phase or one of the
+    ``ITEM_SPAWN_THRESHOLDS``, so phases change on the same HP stages that
+    drop items and raise the enemy level.
+    """
+
+    hp: int
+    patterns: tuple[Pattern, ...]
+
+
+def parse_phases(data: dict) -> tuple[Phase, ...]:
+    """Validate the file representation of a phase list.
+
+    Returns:
+        Phases ordered from the highest HP down
+    """
+    stages = {BOSS_DEFAULT_HP, *ITEM_SPAWN_THRESHOLDS}
+    phases = []
+    for number, entry in enumerate(data.get("phases", ())):
+        hp = entry.get("hp")
+        if hp not in stages:
+            raise ValueError(
+                f"phase {number}: hp {hp!r} is not BOSS_DEFAULT_HP or an ITEM_SPAWN_THRESHOLDS stage"
+            )
+        patterns = []
+        for index, pattern in enumerate(entry.get("patterns", ())):
+            try:
+                patterns.append(Pattern.from_dict(pattern))
+            except (TypeError, ValueError) as e:
+                raise ValueError(f"phase {number}, pattern {index}: {e}") from None
+        phases.append(Phase(hp, tuple(patterns)))
+
+    phases.sort(key=lambda phase: -phase.hp)
+    if len({phase.hp for phase in phases}) != len(phases):
+        raise ValueError("two phases share an hp stage")
+    return tuple(phases)
+
+
+def load_phases(filename: str) -> tuple[Phase, ...]:
+    """Load a phase list from a JSON file in the patterns directory.
+
+    Args:
+        filename: File name under ``patterns/``, or a path to any file
+    """
+    path = assets.get_pattern(filename)
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    try:
+        return parse_phases(data)
+    except ValueError as e:
+        raise ValueError(f"{path}: {e}") from None
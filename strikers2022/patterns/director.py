@@ -0,0 +1,115 @@
+"""Boss phases driving pattern emitters."""
+
+import math
+
+from .bullet_field import BulletField
+from .definitions import Pattern, Phase
+
+
+def volley_directions(pattern: Pattern, volley: int, aim: float) -> list[float]:
+    """Direction of every bullet of one volley, in degrees.
+
+    Args:
+        pattern: The emitting pattern
+        volley: Volleys the pattern fired before this one in the phase
+        aim: Direction from the emitter to the targeted player
+    """
+    count = pattern.count
+    if pattern.aimed:
+        if count == 1:
+            return [aim]
+        step = pattern.spread / (count - 1)
+        first = aim - pattern.spread / 2
+        return [first + step * i for i in range(count)]
+
+    # Rings and spirals: the start angle turns by ``spin`` per volley
+    start = pattern.angle + pattern.spin * volley
+    step = 360 / count
+    return [start + step * i for i in range(count)]
+
+
+class BossPatterns:
+    """Fires the patterns of the boss's current phase into a ``BulletField``.
+
+    The phase is the one with the lowest ``hp`` still at or above the
+    boss's HP. Entering a phase restarts its emitters' timers; each pattern
+    then fires every ``interval`` frames after its ``delay``. Aimed
+    patterns target a player chosen by ``target``; "alternate" switches
+    players every volley.
+    """
+
+    def __init__(self, phases: tuple[Phase, ...]):
+        self.phases = phases
+        self.phase: int | None = None
+        self.frame = 0
+
+    def reset(self) -> None:
+        """Start over from the opening phase (new game)."""
+        self.phase = None
+        self.frame = 0
+
+    def get_state(self) -> tuple:
+        """Capture the emitter state."""
+        return (self.phase, self.frame)
+
+    def set_state(self, state: tuple) -> None:
+        """Restore a state returned by ``get_state``."""
+        self.phase, self.frame = state
+
+    def current_phase(self, boss_hp: int) -> int | None:
+        """Index of the phase for ``boss_hp`` (None before the first one)."""
+        current = None
+        for index, phase in enumerate(self.phases):
+            if boss_hp <= phase.hp:
+                current = index
+        return current
+
+    def update(self, boss, players, field: BulletField) -> int:
+        """Advance one frame and fire the volleys that are due.
+
+        Args:
+            boss: The boss (emitters sit at its centre)
+            players: Both players, for aimed patterns
+            field: Where new bullets go
+
+        Returns:
+            Bullets fired
+        """
+        phase = self.current_phase(boss.hp)
+        if phase != self.phase:
+            self.phase = phase
+            self.frame = 0
+        if phase is None:
+            return 0
+
+        frame = self.frame
+        self.frame += 1
+        center_x, center_y = boss.rect.center
+        fired = 0
+        for pattern in self.phases[phase].patterns:
+            elapsed = frame - pattern.delay
+            if elapsed < 0 or elapsed % pattern.interval:
+                continue
+            volley = elapsed // pattern.interval
+            x = center_x + pattern.offset[0]
+            y = center_y + pattern.offset[1]
+
+            target = 0
+            aim = 90.0
+            if pattern.aimed:
+                if pattern.target == "alternate":
+                    target = volley % 2
+                else:
+                    target = 0 if pattern.target == "player1" else 1
+                player = players[target]
+                aim = math.degrees(math.atan2(player.center_y - y, player.center_x - x))
+            fired += field.spawn(
+                x,
+                y,
+                volley_directions(pattern, volley, aim),
+                pattern.speed,
+                target,
+                pattern.turn,
+                pattern.homing_frames,
+            )
+        return fired
@@ -0,0 +1,34 @@
+"""Print per-session summaries of a telemetry file.
+
+    python -m strikers2022.sessions [telemetry.db] [--limit 20]
+
+Sessions are recorded with ``TELEMETRY_ENABLED`` or the headless runner's
+``--telemetry``. The file can be read while a game is writing to it.
+"""
+
+import argparse
+import sqlite3
+import sys
+
+from .config import TELEMETRY_PATH
+from .diagnostics.telemetry import format_summaries, session_summaries
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Summarize recorded play sessions.")
+    parser.add_argument("path", nargs="?", default=TELEMETRY_PATH)
+    parser.add_argument("--limit", type=int, default=20, help="newest sessions to show")
+    args = parser.parse_args(argv)
+    try:
+        summaries = session_summaries(args.path, args.limit)
+    except FileNotFoundError as e:
+        print(e)
+        sys.exit(1)
+    except sqlite3.DatabaseError as e:
+        print(f"could not read {args.path}: {e}")
+        sys.exit(1)
+    print(format_summaries(summaries))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Soak runner: hours of bot-driven headless play checked for leaks.
+
+    python -m strikers2022.soak --hours 2 --bot1 dodge --bot2 items --csv soak.csv
+
+Hours are game time (frames at ``FPS``); the loop itself runs uncapped.
+Finished games are restarted at once with the next seed. The run exits
+with status 1 if ``SoakMonitor`` reports a failure.
+
+Heap tracing slows the frames it runs under, so frame work is timed
+under ``tracemalloc``; ``--no-heap`` skips the heap check and times frame
+work without it.
+"""
+
+import argparse
+import sys
+import time
+
+from .config import FPS, SOAK_HOURS
+from .headless import init_pygame
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    from .bots import BOTS
+
+    parser = argparse.ArgumentParser(description="STRIKERS 2022 soak run.")
+    parser.add_argument("--hours", type=float, default=SOAK_HOURS, help="game hours to play")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game")
+    parser.add_argument("--bot1", choices=BOTS, default="dodge")
+    parser.add_argument("--bot2", choices=BOTS, default="items")
+    parser.add_argument("--csv", default=None, help="write every sample to this file")
+    parser.add_argument(
+        "--heap",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="trace the heap with tracemalloc (frame work is then timed under tracing)",
+    )
+    parser.add_argument(
+        "--pipeline",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="simulate on a worker thread while rendering (default: PIPELINE_ENABLED)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> None:
+    args = parse_args(argv)
+
+    screen = init_pygame()
+
+    import pygame
+    from .game import Game
+    from .bots import create_bot
+    from .diagnostics import SoakMonitor
+
+    game = Game(screen)
+    game.fps_limit = 0
+    game.seed = args.seed
+    if args.pipeline is not None:
+        game.pipelined = args.pipeline
+    game.set_bots(create_bot(args.bot1, args.seed), create_bot(args.bot2, args.seed + 1))
+    game.start()
+
+    monitor = SoakMonitor(game, trace_heap=args.heap)
+    monitor.start()
+    frames = int(args.hours * FPS * 3600)
+    games = 1
+    start = time.perf_counter()
+    while monitor.frame < frames:
+        game.step()
+        monitor.on_frame()
+        if game.result:
+            game.seed += 1
+            game.start()
+            games += 1
+        elif monitor.frame % monitor.sample_frames == 0 and monitor.samples:
+            print(monitor.format_sample(monitor.samples[-1]), flush=True)
+    elapsed = time.perf_counter() - start
+    monitor.stop()
+
+    print(f"games: {games}  wall: {elapsed:.0f} s  ({monitor.frame / elapsed:.0f} frames/s)")
+    print(monitor.report())
+    if args.csv:
+        monitor.write_csv(args.csv)
+
+    game.close()
+    pygame.quit()
+    if monitor.failures():
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
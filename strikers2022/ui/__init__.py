@@ -2,4 +2,6 @@
 
 from .fonts import fonts, FontManager
 from .hud import HUD, draw_text
-from .menu import GameMenu
+from .menu import GameMenu, REDRAW_EVENTS
+from .renderer import Renderer
+from .render_queue import FrameSnapshot, Layer, RenderQueue
@@ -1,41 +1,69 @@
 """Game menu screens."""
 
+import time
+
 import pygame
-from ..config import WINDOW_WIDTH, WINDOW_HEIGHT, WHITE, YELLOW, assets
+from ..config import (
+    WINDOW_WIDTH,
+    WINDOW_HEIGHT,
+    WHITE,
+    YELLOW,
+    MENU_EVENT_TIMEOUT_MS,
+)
+from ..managers import ActionMap
+from ..utils import load_image
 from .hud import draw_text
 from .fonts import fonts
 
+# Events after which the window contents have to be presented again
+REDRAW_EVENTS = (
+    pygame.VIDEOEXPOSE,
+    pygame.WINDOWEXPOSED,
+    pygame.WINDOWRESTORED,
+    pygame.WINDOWSIZECHANGED,
+)
+
 
 class GameMenu:
-    """Main game menu."""
+    """Main game menu.
+
+    The menu frame never changes, so it is composed once into an offscreen
+    surface. ``draw`` only presents it when the screen is stale, and
+    ``handle_events`` blocks in ``pygame.event.wait`` instead of polling,
+    so an idle menu costs next to no CPU.
+    """
 
-    def __init__(self, screen: pygame.Surface):
+    def __init__(self, screen: pygame.Surface, actions: ActionMap | None = None):
         self.screen = screen
+        self.actions = actions or ActionMap.load()
         self.font_70 = fonts.get_font(70)
         self.font_40 = fonts.get_font(40)
 
         # Load background
-        self.background = pygame.image.load(
-            assets.get_image("background.png")
-        ).convert_alpha()
-        self.background = pygame.transform.scale(
-            self.background, (WINDOW_WIDTH, WINDOW_HEIGHT)
+        self.background = load_image(
+            "background.png", (WINDOW_WIDTH, WINDOW_HEIGHT)
         )
 
-    def draw(self) -> None:
-        """Draw the menu screen."""
-        self.screen.blit(self.background, [0, 0])
+        self.frame = self._compose()
+        self._dirty = True
+
+        # perf_counter time at which the last start press was read
+        self.start_requested_at: float | None = None
+
+    def _compose(self) -> pygame.Surface:
+        """Render the static menu frame."""
+        frame = self.background.copy()
 
         draw_x = int(WINDOW_WIDTH / 4)
         draw_y = int(WINDOW_HEIGHT / 4)
 
         draw_text(
-            "STRIKERS 2022", self.font_70, self.screen, draw_x + 250, draw_y, YELLOW
+            "STRIKERS 2022", self.font_70, frame, draw_x + 250, draw_y, YELLOW
         )
         draw_text(
             "PRESS ENTER KEY",
             self.font_40,
-            self.screen,
+            frame,
             draw_x + 150,
             draw_y + 200,
             WHITE,
@@ -43,21 +71,41 @@ class GameMenu:
         draw_text(
             "TO START THE GAME.",
             self.font_40,
-            self.screen,
+            frame,
             draw_x + 150,
             draw_y + 250,
             WHITE,
         )
+        return frame
+
+    def invalidate(self) -> None:
+        """Mark the screen as stale (e.g. after returning from a game)."""
+        self._dirty = True
 
+    def draw(self) -> None:
+        """Draw the menu screen if it is stale."""
+        if not self._dirty:
+            return
+
+        self.screen.blit(self.frame, (0, 0))
         pygame.display.update()
+        self._dirty = False
 
     def handle_events(self) -> str:
-        """Handle menu events. Returns next game state."""
-        for event in pygame.event.get():
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_RETURN:
-                    return "play"
+        """Wait for menu events. Returns next game state."""
+        events = [pygame.event.wait(MENU_EVENT_TIMEOUT_MS)]
+        events.extend(pygame.event.get())
+        sampled_at = time.perf_counter()
+
+        for event in events:
+            if self.actions.handle_event(event):
+                continue
+            if self.actions.matches(event, "start"):
+                self.start_requested_at = sampled_at
+                return "play"
             if event.type == pygame.QUIT:
                 return "quit"
+            if event.type in REDRAW_EVENTS:
+                self._dirty = True
 
         return "game_menu"
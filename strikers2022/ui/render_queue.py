@@ -0,0 +1,97 @@
+"""Layered render queue submitted with batched blits."""
+
+from dataclasses import dataclass
+from enum import IntEnum
+
+import pygame
+
+
+class Layer(IntEnum):
+    """Draw order, back to front."""
+
+    BACKGROUND = 0
+    ENEMIES = 1
+    ENEMY_BULLETS = 2
+    PLAYER_BULLETS = 3
+    PLAYERS = 4
+    BOSS = 5
+    ITEMS = 6
+    EFFECTS = 7
+
+
+@dataclass(frozen=True, slots=True)
+class FrameSnapshot:
+    """Everything needed to draw one simulated frame.
+
+    Attributes:
+        layers: Blits per layer, as returned by ``RenderQueue.take``
+        hud: Positional arguments for ``HUD.draw`` after the surface
+    """
+
+    layers: tuple
+    hud: tuple
+
+
+class RenderQueue:
+    """Collects (surface, dest) pairs per layer for one frame.
+
+    Everything drawn in a frame is queued first and then submitted layer by
+    layer, one ``blits`` call per non-empty layer, instead of one ``draw``
+    call per sprite group and per standalone entity.
+    """
+
+    def __init__(self):
+        self._layers: list[list[tuple[pygame.Surface, pygame.Rect]]] = [
+            [] for _ in Layer
+        ]
+
+    def add(self, layer: Layer, surface: pygame.Surface, dest) -> None:
+        """Queue a single blit."""
+        self._layers[layer].append((surface, dest))
+
+    def add_entity(self, layer: Layer, entity) -> None:
+        """Queue an entity's current image at its rect."""
+        self._layers[layer].append((entity.image, entity.rect))
+
+    def extend(self, layer: Layer, items) -> None:
+        """Queue prepared (surface, dest) pairs."""
+        self._layers[layer].extend(items)
+
+    def add_group(self, layer: Layer, group: pygame.sprite.AbstractGroup) -> None:
+        """Queue every sprite in ``group``."""
+        self._layers[layer].extend([(sprite.image, sprite.rect) for sprite in group])
+
+    def __len__(self) -> int:
+        return sum(len(items) for items in self._layers)
+
+    def clear(self) -> None:
+        """Drop everything queued without drawing it."""
+        for items in self._layers:
+            items.clear()
+
+    def take(self) -> tuple:
+        """Detach the queued blits as an immutable snapshot and empty the queue.
+
+        Destinations are copied out of the entities' rects, so the snapshot
+        stays valid while the world moves on.
+        """
+        layers = tuple(
+            tuple([(surface, (dest[0], dest[1])) for surface, dest in items])
+            for items in self._layers
+        )
+        self.clear()
+        return layers
+
+    @staticmethod
+    def submit(layers: tuple, renderer) -> None:
+        """Draw a snapshot returned by ``take``."""
+        for items in layers:
+            if items:
+                renderer.blits(items)
+
+    def flush(self, renderer) -> None:
+        """Submit all layers in order and empty the queue."""
+        for items in self._layers:
+            if items:
+                renderer.blits(items)
+                items.clear()
@@ -0,0 +1,114 @@
+"""Scene renderer with a configurable internal resolution."""
+
+import weakref
+
+import pygame
+from ..config import RENDER_SCALE, RENDER_SCALER
+from ..utils import enable_rle
+
+
+class Renderer:
+    """Draws the scene into an internal surface and upscales it once.
+
+    Gameplay keeps using logical window coordinates. At a scale below 1.0
+    every blit position is scaled on the way in and every source surface is
+    replaced by a pre-scaled copy, cached per surface, so the fill cost of a
+    frame follows the internal resolution instead of the window size. At
+    scale 1.0 the renderer draws straight to the display.
+    """
+
+    def __init__(
+        self,
+        display: pygame.Surface,
+        scale: float = RENDER_SCALE,
+        scaler: str = RENDER_SCALER,
+    ):
+        self.display = display
+        self.scaler = scaler
+        self.scale = None
+        self.target: pygame.Surface = display
+        self._scaled: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.set_scale(scale)
+
+    def set_scale(self, scale: float) -> None:
+        """Change the internal resolution (1.0 = window resolution)."""
+        scale = max(0.1, min(1.0, scale))
+        if scale == self.scale:
+            return
+
+        self.scale = scale
+        self._scaled = weakref.WeakKeyDictionary()
+        if scale == 1.0:
+            self.target = self.display
+        else:
+            width, height = self.display.get_size()
+            self.target = pygame.Surface(
+                (round(width * scale), round(height * scale))
+            ).convert()
+
+    def scaled(self, surface: pygame.Surface) -> pygame.Surface:
+        """Get ``surface`` at the internal resolution."""
+        if self.scale == 1.0:
+            return surface
+        result = self._scaled.get(surface)
+        if result is None:
+            width, height = surface.get_size()
+            size = (max(1, round(width * self.scale)), max(1, round(height * self.scale)))
+            # Smooth filtering would blend colorkey pixels into the edges
+            if (
+                self.scaler == "smooth"
+                and surface.get_bitsize() >= 24
+                and surface.get_colorkey() is None
+            ):
+                result = pygame.transform.smoothscale(surface, size)
+            else:
+                result = pygame.transform.scale(surface, size)
+            self._scaled[surface] = enable_rle(result)
+        return result
+
+    def prepare(self, surfaces) -> None:
+        """Pre-scale surfaces that are about to be drawn."""
+        for surface in surfaces:
+            self.scaled(surface)
+
+    def _dest(self, dest) -> tuple[int, int]:
+        """Map a logical position (point or rect) to the internal surface."""
+        scale = self.scale
+        return (int(dest[0] * scale), int(dest[1] * scale))
+
+    def blit(self, source: pygame.Surface, dest) -> None:
+        """Blit ``source`` at a logical position (``Surface.blit`` compatible)."""
+        if self.scale == 1.0:
+            self.target.blit(source, dest)
+        else:
+            self.target.blit(self.scaled(source), self._dest(dest))
+
+    def blits(self, items) -> None:
+        """Blit (surface, logical dest) pairs with one ``Surface.blits`` call."""
+        if self.scale == 1.0:
+            self.target.blits(items, doreturn=False)
+            return
+
+        scaled = self.scaled
+        scale = self.scale
+        self.target.blits(
+            [
+                (scaled(surface), (int(dest[0] * scale), int(dest[1] * scale)))
+                for surface, dest in items
+            ],
+            doreturn=False,
+        )
+
+    def draw_group(self, group: pygame.sprite.AbstractGroup) -> None:
+        """Draw every sprite in ``group`` with one ``blits`` call."""
+        self.blits([(sprite.image, sprite.rect) for sprite in group])
+
+    def compose(self) -> None:
+        """Upscale the internal surface onto the display."""
+        if self.scale == 1.0:
+            return
+        size = self.display.get_size()
+        if self.scaler == "smooth":
+            pygame.transform.smoothscale(self.target, size, self.display)
+        else:
+            pygame.transform.scale(self.target, size, self.display)
@@ -1,3 +1,8 @@
 """Utility module."""
 
 from .math_utils import calculate_angle, calculate_direction
+from .surface_pipeline import classify_surface, enable_rle, optimize_surface, load_image
+from .rotation_cache import RotationCache, rotation_cache
+from .spatial_grid import SpatialGrid
+from .segment_cast import mask_array, segment_vs_mask, segment_vs_rects
+from .box_sweep import overlapping_pairs
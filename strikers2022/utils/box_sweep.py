@@ -0,0 +1,49 @@
+"""Sort-and-sweep overlap test between two sets of boxes."""
+
+import numpy as np
+
+_EMPTY = np.empty(0, np.intp)
+
+
+def overlapping_pairs(a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray, int]:
+    """Every pair of a box from ``a`` and a box from ``b`` that overlap.
+
+    ``b`` is sorted by left edge once. A box of ``a`` can only overlap the
+    boxes of ``b`` whose left edge lies between its own left edge minus
+    the widest ``b`` and its right edge, which is one contiguous run of
+    the sorted order found by binary search. Only those candidate pairs
+    are tested in full, all at once. Boxes are half-open like
+    ``pygame.Rect``: touching edges do not overlap.
+
+    Args:
+        a: Array of (left, top, right, bottom) rows
+        b: Array of (left, top, right, bottom) rows
+
+    Returns:
+        Indices into ``a`` and into ``b`` of the overlapping pairs, and the
+        number of candidate pairs tested
+    """
+    if not len(a) or not len(b):
+        return _EMPTY, _EMPTY, 0
+
+    order = np.argsort(b[:, 0], kind="stable")
+    lefts = b[order, 0]
+    widest = (b[:, 2] - b[:, 0]).max()
+    first = np.searchsorted(lefts, a[:, 0] - widest, side="right")
+    last = np.searchsorted(lefts, a[:, 2], side="left")
+    counts = np.maximum(last - first, 0)
+    tested = int(counts.sum())
+    if not tested:
+        return _EMPTY, _EMPTY, 0
+
+    # Expand every run into (a, b) candidate pairs
+    run_starts = np.repeat(np.cumsum(counts) - counts, counts)
+    ia = np.repeat(np.arange(len(a)), counts)
+    ib = order[np.repeat(first, counts) + (np.arange(tested) - run_starts)]
+    overlap = (
+        (b[ib, 2] > a[ia, 0])
+        & (b[ib, 0] < a[ia, 2])
+        & (b[ib, 3] > a[ia, 1])
+        & (b[ib, 1] < a[ia, 3])
+    )
+    return ia[overlap], ib[overlap], tested
@@ -0,0 +1,53 @@
+"""Cache of rotated sprite surfaces."""
+
+import pygame
+from .surface_pipeline import enable_rle
+
+
+class RotationCache:
+    """Shares rotated surfaces between sprites.
+
+    Angles are snapped to buckets of ``step`` degrees so that every sprite
+    using the same base surface and facing roughly the same way reuses one
+    rotated copy instead of calling ``pygame.transform.rotate`` each frame.
+    """
+
+    def __init__(self, step: int = 1):
+        self._cache: dict[tuple[pygame.Surface, int], pygame.Surface] = {}
+        self._step = step
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def step(self) -> int:
+        return self._step
+
+    @step.setter
+    def step(self, value: int) -> None:
+        if value != self._step:
+            self._step = value
+            self._cache.clear()
+
+    def rotate(self, surface: pygame.Surface, angle: float) -> pygame.Surface:
+        """Get ``surface`` rotated by ``angle`` degrees, snapped to the bucket."""
+        bucket = round(angle / self._step) % (360 // self._step)
+        key = (surface, bucket)
+        rotated = self._cache.get(key)
+        if rotated is None:
+            rotated = enable_rle(pygame.transform.rotate(surface, bucket * self._step))
+            self._cache[key] = rotated
+            self.misses += 1
+        else:
+            self.hits += 1
+        return rotated
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """Drop all cached surfaces."""
+        self._cache.clear()
+
+
+# Global instance
+rotation_cache = RotationCache()
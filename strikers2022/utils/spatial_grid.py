@@ -0,0 +1,155 @@
+"""Uniform grid for batched nearest-neighbour and radius queries."""
+
+import math
+
+import numpy as np
+
+from ..config import WINDOW_WIDTH, WINDOW_HEIGHT, SPATIAL_GRID_CELL
+
+
+class SpatialGrid:
+    """Points bucketed into square cells, queried many at a time.
+
+    ``rebuild`` sorts the points by cell once (a counting sort through
+    ``argsort``); afterwards a cell's points are one contiguous slice of
+    ``order``. A query of radius ``r`` only looks at the cells within
+    ``ceil(r / cell)`` of its own, so its cost follows the points near it
+    rather than all of them, and a whole batch of queries is answered with
+    array operations instead of a Python loop per query.
+
+    Points outside the covered area (the window by default) are clamped
+    into the border cells, so they are still found, just less cheaply.
+    """
+
+    def __init__(
+        self,
+        cell: float = SPATIAL_GRID_CELL,
+        width: float = WINDOW_WIDTH,
+        height: float = WINDOW_HEIGHT,
+    ):
+        self.cell = cell
+        self.columns = max(1, math.ceil(width / cell))
+        self.rows = max(1, math.ceil(height / cell))
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        # Point indices sorted by cell, and where each cell's run starts
+        self.order = np.empty(0, np.intp)
+        self.starts = np.zeros(self.columns * self.rows + 1, np.intp)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def _cells(self, x: np.ndarray, y: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Column and row of every point, clamped into the grid."""
+        column = np.clip((x // self.cell).astype(np.intp), 0, self.columns - 1)
+        row = np.clip((y // self.cell).astype(np.intp), 0, self.rows - 1)
+        return column, row
+
+    def rebuild(self, x, y) -> None:
+        """Replace the points (centres); a point's index is its position here."""
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        column, row = self._cells(self.x, self.y)
+        cells = row * self.columns + column
+        self.order = np.argsort(cells, kind="stable")
+        self.starts = np.searchsorted(
+            cells[self.order], np.arange(self.columns * self.rows + 1)
+        )
+
+    def _candidates(self, qx: np.ndarray, qy: np.ndarray, radius: float):
+        """Every (query, point) pair within ``radius``, grouped by query.
+
+        Returns:
+            Query index, point index and squared distance of every pair
+        """
+        empty = np.empty(0, np.intp)
+        if not len(self.x) or not len(qx):
+            return empty, empty, np.empty(0)
+
+        # The block of cells around each query that can hold a point in range
+        reach = math.ceil(min(radius / self.cell, max(self.columns, self.rows)))
+        span = np.arange(-reach, reach + 1)
+        column, row = self._cells(qx, qy)
+        columns = column[:, None, None] + span[None, None, :]
+        rows = row[:, None, None] + span[None, :, None]
+        valid = (columns >= 0) & (columns < self.columns) & (rows >= 0) & (rows < self.rows)
+        queries = np.broadcast_to(np.arange(len(qx))[:, None, None], valid.shape)[valid]
+        cells = (rows * self.columns + columns)[valid]
+
+        # Expand every (query, cell) into its cell's points
+        first = self.starts[cells]
+        counts = self.starts[cells + 1] - first
+        total = int(counts.sum())
+        if not total:
+            return empty, empty, np.empty(0)
+        run_starts = np.repeat(np.cumsum(counts) - counts, counts)
+        slots = np.repeat(first, counts) + (np.arange(total) - run_starts)
+        points = self.order[slots]
+        queries = np.repeat(queries, counts)
+
+        dx = self.x[points] - qx[queries]
+        dy = self.y[points] - qy[queries]
+        distance2 = dx * dx + dy * dy
+        inside = distance2 <= radius * radius
+        return queries[inside], points[inside], distance2[inside]
+
+    def within(self, qx, qy, radius: float) -> list[np.ndarray]:
+        """Points within ``radius`` of each query point.
+
+        Returns:
+            One array of point indices per query (unordered)
+        """
+        qx = np.asarray(qx, dtype=np.float64)
+        qy = np.asarray(qy, dtype=np.float64)
+        queries, points, _ = self._candidates(qx, qy, radius)
+        # Pairs come grouped by query, in query order
+        bounds = np.searchsorted(queries, np.arange(len(qx) + 1))
+        return [points[bounds[i]:bounds[i + 1]] for i in range(len(qx))]
+
+    def nearest(self, qx, qy, k: int = 1, radius: float = math.inf) -> tuple[np.ndarray, np.ndarray]:
+        """The ``k`` closest points to each query point, up to ``radius`` away.
+
+        The search widens in steps. Each step looks at every point closer
+        than a limit; a query with ``k`` of them is settled, and only the
+        rest go on with the limit doubled. Once the limit spans the grid the
+        last step searches the whole ``radius``, so far points (including
+        those clamped in from outside the covered area) are found. The first
+        limit is where about ``4 * k`` points are expected at the grid's
+        average density, so most queries settle in one step and few pairs
+        are sorted, whatever the radius.
+
+        Returns:
+            Point indices and distances, shaped (queries, k) and sorted by
+            distance (ties by index); missing neighbours are -1 and ``inf``
+        """
+        qx = np.asarray(qx, dtype=np.float64)
+        qy = np.asarray(qy, dtype=np.float64)
+        indices = np.full((len(qx), k), -1, np.intp)
+        distances = np.full((len(qx), k), np.inf)
+        if not len(self.x):
+            return indices, distances
+
+        pending = np.arange(len(qx))
+        area = self.columns * self.rows * self.cell * self.cell
+        step = math.sqrt(4 * k * area / (math.pi * len(self.x)))
+        while len(pending):
+            limit = min(step, radius)
+            last = limit >= radius or limit >= self.cell * max(self.columns, self.rows)
+            if last:
+                limit = radius
+            queries, points, distance2 = self._candidates(qx[pending], qy[pending], limit)
+
+            # Sort pairs by query, then distance, and keep each query's first k
+            ranked = np.lexsort((points, distance2, queries))
+            queries, points, distance2 = queries[ranked], points[ranked], distance2[ranked]
+            rank = np.arange(len(queries)) - np.searchsorted(queries, queries)
+            found = np.bincount(queries, minlength=len(pending))
+            settled = np.ones(len(pending), bool) if last else found >= k
+            keep = (rank < k) & settled[queries]
+            owners = pending[queries[keep]]
+            indices[owners, rank[keep]] = points[keep]
+            distances[owners, rank[keep]] = np.sqrt(distance2[keep])
+
+            pending = pending[~settled]
+            step *= 2
+        return indices, distances